@@ -2,16 +2,35 @@
 Nutanix to Harvester Migration Library
 """
 
-from .utils import Colors, colored, format_size, format_timestamp
-from .nutanix import NutanixClient
-from .harvester import HarvesterClient
-from .actions import MigrationActions
+from importlib import import_module
+
+from .utils import Colors, colored, COLOR_PAD, format_size, format_timestamp, json_load, json_loads, json_dumps
+
+# API clients pull in requests/urllib3, so load them on first access only
+_LAZY_ATTRS = {
+    'NutanixClient': '.nutanix',
+    'HarvesterClient': '.harvester',
+    'MigrationActions': '.actions',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'Colors',
     'colored', 
+    'COLOR_PAD',
     'format_size',
     'format_timestamp',
+    'json_load',
+    'json_loads',
+    'json_dumps',
     'NutanixClient',
     'HarvesterClient',
     'MigrationActions',
@@ -3,18 +3,65 @@ Migration Actions - Export, Convert, Import operations
 """
 
 import os
+import re
+import struct
 import subprocess
 import time
 import http.server
 import socketserver
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable, List, Dict
-from .utils import Colors, colored, format_size
+from .utils import Colors, colored, format_size, json_loads
+
+# qemu-img -p output: "    (45.23/100%)\r"
+QEMU_PROGRESS = re.compile(rb'([\d.]+)/100%')
+QEMU_LINE_SPLIT = re.compile(rb'[\r\n]')
+
+
+def _kernel_has_io_uring() -> bool:
+    """io_uring file reads need Linux 5.6 or newer."""
+    try:
+        major, minor = (int(x) for x in os.uname().release.split('.')[:2])
+    except (AttributeError, ValueError):
+        return False
+    return (major, minor) >= (5, 6)
+
+
+# First fields of the qcow2 header: magic, version, backing_file_offset,
+# backing_file_size, cluster_bits, size (virtual size), all big-endian
+QCOW2_HEADER = struct.Struct('>4sIQIIQ')
+QCOW2_MAGIC = b'QFI\xfb'
+
+
+def _probe_image_header(path: str, stat: os.stat_result) -> Optional[Dict]:
+    """
+    Read format and sizes of a qcow2 or raw image without running qemu-img info.
+    
+    Returns the same fields get_file_info takes from qemu-img, or None for
+    anything else (vmdk, vhd, unreadable files) so the caller can fall back.
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(QCOW2_HEADER.size)
+    except OSError:
+        return None
+    actual_size = stat.st_blocks * 512
+    if len(header) == QCOW2_HEADER.size and header[:4] == QCOW2_MAGIC:
+        _, _, _, _, _, virtual_size = QCOW2_HEADER.unpack(header)
+        return {'format': 'qcow2', 'virtual_size': virtual_size, 'actual_size': actual_size}
+    if path.endswith('.raw'):
+        return {'format': 'raw', 'virtual_size': stat.st_size, 'actual_size': actual_size}
+    return None
 
 
 class MigrationActions:
     """Handles VM migration operations."""
     
+    STAGING_LIST_TTL = 15  # seconds
+    MOUNT_CHECK_TTL = 2  # seconds
+    STAT_WORKERS = 8  # concurrent stat() calls when scanning staging
+    
     def __init__(self, config: dict, nutanix=None, harvester=None):
         """
         Initialize migration actions.
@@ -30,12 +77,24 @@ class MigrationActions:
         self.staging_path = config.get('transfer', {}).get('staging_mount', '/mnt/staging')
         self._http_server = None
         self._http_thread = None
+        self._http_stats = {'bytes': 0, 'requests': 0}
+        # path -> ((mtime, size), qemu-img fields), see get_file_info
+        self._qemu_info_cache: Dict[str, tuple] = {}
+        # ((search paths, dir mtimes), monotonic time, files), see list_staging_files
+        self._staging_list_cache = None
+        # (monotonic time, mounted), see is_staging_mounted
+        self._mount_check = (None, False)
     
     # === Staging Operations ===
     
-    def is_staging_mounted(self) -> bool:
-        """Check if staging is mounted."""
-        return os.path.ismount(self.staging_path)
+    def is_staging_mounted(self, fresh: bool = False) -> bool:
+        """Check if staging is mounted (result reused for MOUNT_CHECK_TTL seconds unless fresh)."""
+        now = time.monotonic()
+        checked_at, mounted = self._mount_check
+        if fresh or checked_at is None or now - checked_at >= self.MOUNT_CHECK_TTL:
+            mounted = os.path.ismount(self.staging_path)
+            self._mount_check = (now, mounted)
+        return mounted
     
     def check_staging(self) -> dict:
         """
@@ -46,29 +105,31 @@ class MigrationActions:
         """
         result = {
             'path': self.staging_path,
-            'mounted': self.is_staging_mounted(),
+            'mounted': self.is_staging_mounted(fresh=True),
             'files': [],
             'total_size': 0
         }
         
         if result['mounted']:
             try:
-                for f in os.listdir(self.staging_path):
-                    fpath = os.path.join(self.staging_path, f)
-                    if os.path.isfile(fpath):
-                        size = os.path.getsize(fpath)
-                        result['files'].append({
-                            'name': f,
-                            'size': size,
-                            'type': 'file'
-                        })
-                        result['total_size'] += size
-                    elif os.path.isdir(fpath):
-                        result['files'].append({
-                            'name': f,
-                            'size': 0,
-                            'type': 'directory'
-                        })
+                # scandir gets the entry type from the directory read, so
+                # only regular files need a stat
+                with os.scandir(self.staging_path) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            size = entry.stat().st_size
+                            result['files'].append({
+                                'name': entry.name,
+                                'size': size,
+                                'type': 'file'
+                            })
+                            result['total_size'] += size
+                        elif entry.is_dir():
+                            result['files'].append({
+                                'name': entry.name,
+                                'size': 0,
+                                'type': 'directory'
+                            })
             except Exception as e:
                 result['error'] = str(e)
         
@@ -78,6 +139,10 @@ class MigrationActions:
         """
         List all files in staging directory and migrations subfolders.
         
+        The listing is reused for STAGING_LIST_TTL seconds as long as none of
+        the scanned directories changed (files added, removed or renamed), so
+        sizes of files still being written may lag by up to that long.
+        
         Args:
             filter_ext: Optional extension filter (e.g., '.raw', '.qcow2')
         
@@ -87,38 +152,73 @@ class MigrationActions:
         if not self.is_staging_mounted():
             return []
         
-        files = []
-        
-        # Search paths: staging root + migrations subfolders
-        search_paths = [self.staging_path]
+        # Search paths: staging root + migrations subfolders, as
+        # (directory, display prefix relative to staging)
+        search_paths = [(self.staging_path, '')]
+        dir_mtimes = [os.stat(self.staging_path).st_mtime_ns]
         migrations_dir = os.path.join(self.staging_path, 'migrations')
         if os.path.isdir(migrations_dir):
-            for vm_dir in os.listdir(migrations_dir):
-                vm_path = os.path.join(migrations_dir, vm_dir)
-                if os.path.isdir(vm_path):
-                    search_paths.append(vm_path)
+            with os.scandir(migrations_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        search_paths.append((entry.path, os.path.join('migrations', entry.name, '')))
+                        dir_mtimes.append(entry.stat().st_mtime_ns)
+        
+        key = tuple(search_paths), tuple(dir_mtimes)
+        cached = self._staging_list_cache
+        if cached and cached[0] == key and time.monotonic() - cached[1] < self.STAGING_LIST_TTL:
+            files = cached[2]
+        else:
+            files = self._scan_staging(search_paths)
+            self._staging_list_cache = (key, time.monotonic(), files)
+        
+        if filter_ext:
+            return [f for f in files if f['name'].endswith(filter_ext)]
+        return list(files)
+    
+    @classmethod
+    def _scan_staging(cls, search_paths: list) -> List[Dict]:
+        """
+        Read the search directories; scandir gives the file type, one stat per file.
         
+        On the Ceph/NFS staging share every stat is a round trip to the server,
+        so with more than a handful of files the stats are issued concurrently.
+        """
+        entries = []
         try:
-            for search_path in search_paths:
-                for f in os.listdir(search_path):
-                    fpath = os.path.join(search_path, f)
-                    if os.path.isfile(fpath):
-                        if filter_ext and not f.endswith(filter_ext):
-                            continue
-                        stat = os.stat(fpath)
-                        # Include relative path from staging for display
-                        rel_path = os.path.relpath(fpath, self.staging_path)
-                        files.append({
-                            'name': rel_path,
-                            'path': fpath,
-                            'size': stat.st_size,
-                            'mtime': stat.st_mtime,
-                        })
+            for search_path, prefix in search_paths:
+                with os.scandir(search_path) as it:
+                    entries += [(prefix, entry) for entry in it if entry.is_file()]
         except Exception as e:
             pass
         
+        def stat(item):
+            try:
+                return item[1].stat()
+            except OSError:
+                return None
+        
+        if len(entries) > 4:
+            with ThreadPoolExecutor(max_workers=min(cls.STAT_WORKERS, len(entries))) as pool:
+                stats = list(pool.map(stat, entries))
+        else:
+            stats = [stat(item) for item in entries]
+        
+        files = [
+            {
+                'name': prefix + entry.name,
+                'path': entry.path,
+                'size': st.st_size,
+                'mtime': st.st_mtime,
+            }
+            for (prefix, entry), st in zip(entries, stats) if st is not None
+        ]
         return sorted(files, key=lambda x: x['name'])
     
+    def invalidate_staging_list(self):
+        """Forget the cached staging listing."""
+        self._staging_list_cache = None
+    
     def list_raw_files(self) -> List[Dict]:
         """List RAW files in staging."""
         return self.list_staging_files(filter_ext='.raw')
@@ -149,19 +249,32 @@ class MigrationActions:
             'mtime': stat.st_mtime,
         }
         
-        # Get qemu-img info for disk images
+        # Get qemu-img info for disk images (cached until the file changes)
         if filename.endswith(('.raw', '.qcow2', '.vmdk', '.vhd', '.vhdx')):
+            key = (stat.st_mtime, stat.st_size)
+            cached = self._qemu_info_cache.get(fpath)
+            if cached and cached[0] == key:
+                info.update(cached[1])
+                return info
+            fields = _probe_image_header(fpath, stat)
+            if fields is not None:
+                self._qemu_info_cache[fpath] = (key, fields)
+                info.update(fields)
+                return info
             try:
                 result = subprocess.run(
                     ['qemu-img', 'info', '--output=json', fpath],
-                    capture_output=True, text=True, timeout=30
+                    capture_output=True, timeout=30
                 )
                 if result.returncode == 0:
-                    import json
-                    qemu_info = json.loads(result.stdout)
-                    info['format'] = qemu_info.get('format')
-                    info['virtual_size'] = qemu_info.get('virtual-size')
-                    info['actual_size'] = qemu_info.get('actual-size')
+                    qemu_info = json_loads(result.stdout)
+                    fields = {
+                        'format': qemu_info.get('format'),
+                        'virtual_size': qemu_info.get('virtual-size'),
+                        'actual_size': qemu_info.get('actual-size'),
+                    }
+                    self._qemu_info_cache[fpath] = (key, fields)
+                    info.update(fields)
             except:
                 pass
         
@@ -169,6 +282,8 @@ class MigrationActions:
     
     def delete_file(self, filepath: str) -> bool:
         """Delete a file from staging."""
+        self._qemu_info_cache.pop(filepath, None)
+        self.invalidate_staging_list()
         try:
             os.remove(filepath)
             return True
@@ -240,7 +355,8 @@ class MigrationActions:
     # === Convert Operations ===
     
     def convert_raw_to_qcow2(self, raw_file: str, compress: bool = True,
-                             progress_callback: Callable = None) -> dict:
+                             progress_callback: Callable = None,
+                             workers: int = None, io_engine: str = None) -> dict:
         """
         Convert RAW file to QCOW2.
         
@@ -248,57 +364,52 @@ class MigrationActions:
             raw_file: Path to RAW file
             compress: Whether to compress the output
             progress_callback: Optional callback(percent)
+            workers: Parallel qemu-img coroutines (-m, capped at 16 by qemu-img;
+                     defaults to transfer.qemu_img_coroutines, else 8)
+            io_engine: 'io_uring' to read the source with O_DIRECT through io_uring
+                       (defaults to transfer.io_engine in the config)
         
         Returns:
             Dict with success, output_file, size_before, size_after
         """
-        import re
-        
         if not os.path.exists(raw_file):
             return {'success': False, 'error': f"File not found: {raw_file}"}
         
         qcow2_file = raw_file.replace('.raw', '.qcow2')
+        self._qemu_info_cache.pop(qcow2_file, None)
+        self.invalidate_staging_list()
         
-        cmd = ['qemu-img', 'convert', '-f', 'raw', '-O', 'qcow2']
+        transfer_cfg = self.config.get('transfer', {})
+        workers = workers or transfer_cfg.get('qemu_img_coroutines', 8)
+        cmd = ['qemu-img', 'convert', '-O', 'qcow2', '-m', str(max(1, min(workers, 16)))]
         if compress:
             cmd.append('-c')
-        cmd.extend(['-p', raw_file, qcow2_file])
+        else:
+            # Out-of-order writes are not allowed together with compression
+            cmd.append('-W')
+        if transfer_cfg.get('qcow2_options'):
+            cmd.extend(['-o', transfer_cfg['qcow2_options']])
+        
+        io_engine = io_engine or transfer_cfg.get('io_engine')
+        use_uring = io_engine == 'io_uring' and _kernel_has_io_uring()
         
         try:
             size_before = os.path.getsize(raw_file)
             
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-            )
-            
-            # Read progress output character by character
-            buffer = ""
-            while True:
-                char = process.stdout.read(1)
-                if not char:
-                    break
-                char = char.decode('utf-8', errors='ignore')
-                if char == '\r' or char == '\n':
-                    # Parse progress line
-                    if '%' in buffer and progress_callback:
-                        try:
-                            # Extract percentage (e.g., "(45.23/100%)")
-                            match = re.search(r'([\d.]+)/100%', buffer)
-                            if match:
-                                pct = float(match.group(1))
-                                progress_callback(pct)
-                        except:
-                            pass
-                    buffer = ""
-                else:
-                    buffer += char
-            
-            process.wait()
+            # file.aio needs --image-opts; commas in option values are escaped by doubling
+            source = ("driver=raw,file.driver=file,file.aio=io_uring,file.cache.direct=on,"
+                      f"file.filename={raw_file.replace(',', ',,')}")
+            if use_uring and self._image_opts_open(source):
+                returncode = self._run_qemu_convert(
+                    cmd + ['--image-opts', '-p', source, qcow2_file], progress_callback)
+            else:
+                # Plain buffered reads: default engine, or qemu-img built without io_uring
+                returncode = self._run_qemu_convert(
+                    cmd + ['-f', 'raw', '-p', raw_file, qcow2_file], progress_callback)
             
-            if process.returncode != 0:
-                return {'success': False, 'error': f"qemu-img failed with code {process.returncode}"}
+            self.invalidate_staging_list()  # Output size changed while converting
+            if returncode != 0:
+                return {'success': False, 'error': f"qemu-img failed with code {returncode}"}
             
             size_after = os.path.getsize(qcow2_file)
             
@@ -314,6 +425,52 @@ class MigrationActions:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    @staticmethod
+    def _image_opts_open(source: str) -> bool:
+        """
+        Check that qemu-img can open an --image-opts source (e.g. file.aio=io_uring).
+        
+        Only opens the image, so an unsupported engine is detected up front
+        instead of by a conversion failing after it has started.
+        """
+        try:
+            result = subprocess.run(['qemu-img', 'info', '--image-opts', source],
+                                    capture_output=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0
+    
+    @staticmethod
+    def _run_qemu_convert(cmd: list, progress_callback: Callable = None) -> int:
+        """Run qemu-img convert -p, forwarding its percentage to progress_callback."""
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        
+        # Read whatever is available (not byte by byte); qemu-img ends
+        # each progress update with '\r'
+        buffer = b""
+        while True:
+            chunk = process.stdout.read1(4096)
+            if not chunk:
+                break
+            buffer += chunk
+            *lines, buffer = QEMU_LINE_SPLIT.split(buffer)
+            if not progress_callback:
+                continue
+            # Only the newest percentage in this chunk matters
+            for line in reversed(lines):
+                # Extract percentage (e.g., "(45.23/100%)")
+                match = QEMU_PROGRESS.search(line)
+                if match:
+                    progress_callback(float(match.group(1)))
+                    break
+        
+        process.wait()
+        return process.returncode
+    
     # === HTTP Server for Image Serving ===
     
     def start_http_server(self, port: int = 8080, bind_ip: str = None) -> str:
@@ -332,6 +489,8 @@ class MigrationActions:
         
         # Use a custom handler with better support for large files
         staging_path = self.staging_path
+        stats = self._http_stats = {'bytes': 0, 'requests': 0}
+        stats_lock = threading.Lock()
         
         class RobustHandler(http.server.SimpleHTTPRequestHandler):
             def __init__(self, *args, **kwargs):
@@ -343,6 +502,19 @@ class MigrationActions:
             def log_error(self, format, *args):
                 pass  # Suppress error logging too
             
+            def copyfile(self, source, outputfile):
+                """Send the file body with sendfile(2), no copy through Python buffers."""
+                # wfile is unbuffered, the headers are already on the socket
+                # Sent in slices so the served-bytes counter moves during large files
+                with stats_lock:
+                    stats['requests'] += 1
+                while True:
+                    sent = self.connection.sendfile(source, source.tell(), 64 * 1024 * 1024)
+                    if not sent:
+                        break
+                    with stats_lock:
+                        stats['bytes'] += sent
+            
             def handle_one_request(self):
                 """Handle a single HTTP request with better error handling."""
                 try:
@@ -433,6 +605,10 @@ class MigrationActions:
         
         return f"http://{local_ip}:{port}"
     
+    def http_server_stats(self) -> dict:
+        """Bytes sent and file requests served by the current HTTP server."""
+        return dict(self._http_stats)
+    
     def stop_http_server(self):
         """Stop the HTTP server."""
         if self._http_server:
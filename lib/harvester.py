@@ -4,13 +4,29 @@ Harvester/KubeVirt API Client
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import tempfile
 import os
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlencode
+from typing import Optional, List, Dict, Any, Callable
+from .utils import json_dumpb, json_loads
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Ask for metadata-only list items, falling back to full objects
+PARTIAL_METADATA_LIST = 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1, application/json'
+
+# Items per list request; larger lists are fetched in chunks (limit/continue)
+# so no single response body has to hold the whole collection
+LIST_CHUNK_SIZE = 500
+
+# Namespaces every cluster has, excluded server-side by list_user_namespaces
+SYSTEM_NAMESPACE_SELECTOR = 'kubernetes.io/metadata.name notin (kube-system,kube-public,kube-node-lease)'
+
 
 class HarvesterClient:
     """Harvester/KubeVirt API client using Kubernetes REST API."""
@@ -29,6 +45,19 @@ class HarvesterClient:
         self.cert = None
         self.verify = False
         self._setup_certs(config)
+        
+        # Shared session so consecutive calls reuse the TLS connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(429, 503),
+                                                raise_on_status=False))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # (endpoint, accept) -> Future of an in-flight cluster-wide list, see _list_items
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     def _setup_certs(self, config: dict):
         """Configure certificates from config."""
@@ -58,55 +87,114 @@ class HarvesterClient:
             
             self.cert = (cert_file.name, key_file.name)
     
+    def close(self):
+        """Close the pooled keep-alive connections."""
+        session = getattr(self, '_session', None)
+        if session:
+            session.close()
+    
     def __del__(self):
-        """Cleanup temporary certificate files."""
+        """Close the HTTP session and cleanup temporary certificate files."""
+        self.close()
         for f in self._temp_files:
             try:
                 os.unlink(f)
             except:
                 pass
     
-    def _request(self, method: str, endpoint: str, data: dict = None, content_type: str = None, silent: bool = False) -> dict:
+    def _request(self, method: str, endpoint: str, data: dict = None, content_type: str = None,
+                 silent: bool = False, accept: str = None) -> dict:
         """Execute API request."""
         url = f"{self.base_url}{endpoint}"
         
         headers = {}
+        if accept:
+            headers['Accept'] = accept
         if method == "PATCH":
             # Use provided content_type or default to merge-patch
             headers['Content-Type'] = content_type or 'application/merge-patch+json'
-        
-        # For JSON Patch, send data directly (not as json=)
-        if content_type == "application/json-patch+json":
-            import json as json_module
-            response = requests.request(
-                method=method,
-                url=url,
-                data=json_module.dumps(data),
-                headers=headers,
-                cert=self.cert,
-                verify=self.verify if self.verify else False
-            )
-        else:
-            response = requests.request(
-                method=method,
-                url=url,
-                json=data,
-                headers=headers if headers else None,
-                cert=self.cert,
-                verify=self.verify if self.verify else False
-            )
+        elif data is not None:
+            headers['Content-Type'] = content_type or 'application/json'
+        
+        # Serialize body once ourselves (orjson when available)
+        body = json_dumpb(data) if data is not None else None
+        response = self._session.request(
+            method=method,
+            url=url,
+            data=body,
+            headers=headers if headers else None,
+            cert=self.cert,
+            verify=self.verify if self.verify else False
+        )
         
         if not response.ok and not silent:
             # Try to get detailed error message
             try:
-                error_detail = response.json()
+                error_detail = json_loads(response.content)
                 error_msg = error_detail.get('message', response.text)
                 print(f"API Error: {error_msg}")
             except:
                 print(f"API Error: {response.text}")
         
         response.raise_for_status()
-        return response.json() if response.text else {}
+        return json_loads(response.content) if response.content else {}
+    
+    def _list_items(self, endpoint: str, accept: str = None) -> List[dict]:
+        """
+        GET a list endpoint and return its items, sharing one request between
+        concurrent callers asking for the same endpoint (singleflight).
+        
+        The returned list may be shared, callers must not modify it.
+        """
+        key = (endpoint, accept)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            items = self._list_chunked(endpoint, accept)
+            future.set_result(items)
+            return items
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _list_chunked(self, endpoint: str, accept: str = None) -> List[dict]:
+        """Collect a list endpoint's items LIST_CHUNK_SIZE at a time."""
+        sep = '&' if '?' in endpoint else '?'
+        items = []
+        token = None
+        while True:
+            query = {'limit': LIST_CHUNK_SIZE}
+            if token:
+                query['continue'] = token
+            result = self._request("GET", f"{endpoint}{sep}{urlencode(query)}", accept=accept)
+            items += result.get('items') or []
+            token = (result.get('metadata') or {}).get('continue')
+            if not token:
+                return items
+    
+    def _run_concurrently(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Optional[Exception]]:
+        """Run independent API calls on up to 8 threads; key -> None or the exception raised."""
+        if not calls:
+            return {}
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(calls), 8)) as executor:
+            futures = {key: executor.submit(call) for key, call in calls.items()}
+            for key, future in futures.items():
+                try:
+                    future.result()
+                    results[key] = None
+                except Exception as e:
+                    results[key] = e
+        return results
     
     # === Node Operations ===
     
@@ -115,6 +203,15 @@ class HarvesterClient:
         result = self._request("GET", "/api/v1/nodes")
         return result.get('items', [])
     
+    def list_node_metadata(self) -> List[dict]:
+        """
+        List cluster nodes with metadata only (PartialObjectMetadataList).
+        
+        Node status carries the image list of every node, so this is the
+        cheap call for counting nodes or checking that the API answers.
+        """
+        return self._list_items("/api/v1/nodes", accept=PARTIAL_METADATA_LIST)
+    
     # === VM Operations ===
     
     def list_vms(self, namespace: str = None) -> List[dict]:
@@ -125,8 +222,7 @@ class HarvesterClient:
     
     def list_all_vms(self) -> List[dict]:
         """List all VMs across all namespaces."""
-        result = self._request("GET", "/apis/kubevirt.io/v1/virtualmachines")
-        return result.get('items', [])
+        return self._list_items("/apis/kubevirt.io/v1/virtualmachines")
     
     def get_vm(self, name: str, namespace: str = None) -> dict:
         """Get VM by name."""
@@ -165,12 +261,149 @@ class HarvesterClient:
             patch
         )
     
+    def watch_vm(self, name: str, namespace: str = None,
+                 predicate: Callable[[dict], bool] = None, timeout: int = 120) -> Optional[dict]:
+        """
+        Wait for a VM to reach a state using the Kubernetes watch API.
+        
+        Falls back to polling every 5s if the watch cannot be used
+        (e.g. 410 Gone when the resourceVersion has expired).
+        
+        Args:
+            name: VM name
+            namespace: VM namespace
+            predicate: Called with the VM object, returns True when done
+            timeout: Max seconds to wait
+            
+        Returns:
+            VM object that matched the predicate, or None on timeout
+        """
+        import time
+        ns = namespace or self.namespace
+        deadline = time.time() + timeout
+        
+        vm = self.get_vm(name, ns)
+        if predicate(vm):
+            return vm
+        
+        url = f"{self.base_url}/apis/kubevirt.io/v1/namespaces/{ns}/virtualmachines"
+        params = {
+            'watch': '1',
+            'fieldSelector': f"metadata.name={name}",
+            'resourceVersion': vm.get('metadata', {}).get('resourceVersion', ''),
+            'timeoutSeconds': str(timeout),
+        }
+        try:
+            with self._session.get(
+                url,
+                params=params,
+                stream=True,
+                cert=self.cert,
+                verify=self.verify if self.verify else False,
+                timeout=(10, timeout + 5)
+            ) as response:
+                if response.ok:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        event = json_loads(line)
+                        if event.get('type') == 'ERROR':
+                            break  # Watch expired, fall back to polling
+                        obj = event.get('object', {})
+                        if event.get('type') in ('ADDED', 'MODIFIED') and predicate(obj):
+                            return obj
+                        if time.time() >= deadline:
+                            return None
+        except (requests.RequestException, ValueError):
+            pass
+        
+        # Fallback: poll
+        while time.time() < deadline:
+            time.sleep(5)
+            vm = self.get_vm(name, ns)
+            if predicate(vm):
+                return vm
+        return None
+    
+    def watch_pvcs_bound(self, names: List[str], namespace: str = None, timeout: int = 120) -> bool:
+        """
+        Wait until all given PVCs are Bound using the Kubernetes watch API.
+        
+        Field selectors cannot match a set of names, so the namespace's PVCs
+        are watched and filtered client-side. Falls back to polling every 2s
+        if the watch cannot be used.
+        
+        Args:
+            names: PVC names to wait for
+            namespace: PVC namespace
+            timeout: Max seconds to wait
+            
+        Returns:
+            True if all PVCs are Bound, False on timeout
+        """
+        import time
+        ns = namespace or self.namespace
+        deadline = time.time() + timeout
+        pending = set(names)
+        
+        def check(pvc: dict):
+            name = pvc.get('metadata', {}).get('name')
+            if name in pending and pvc.get('status', {}).get('phase') == 'Bound':
+                pending.discard(name)
+        
+        endpoint = f"/api/v1/namespaces/{ns}/persistentvolumeclaims"
+        pvc_list = self._request("GET", endpoint)
+        for pvc in pvc_list.get('items', []):
+            check(pvc)
+        if not pending:
+            return True
+        
+        params = {
+            'watch': '1',
+            'resourceVersion': pvc_list.get('metadata', {}).get('resourceVersion', ''),
+            'timeoutSeconds': str(timeout),
+        }
+        try:
+            with self._session.get(
+                f"{self.base_url}{endpoint}",
+                params=params,
+                stream=True,
+                cert=self.cert,
+                verify=self.verify if self.verify else False,
+                timeout=(10, timeout + 5)
+            ) as response:
+                if response.ok:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        event = json_loads(line)
+                        if event.get('type') == 'ERROR':
+                            break  # Watch expired, fall back to polling
+                        if event.get('type') in ('ADDED', 'MODIFIED'):
+                            check(event.get('object', {}))
+                            if not pending:
+                                return True
+                        if time.time() >= deadline:
+                            return False
+        except (requests.RequestException, ValueError):
+            pass
+        
+        # Fallback: poll
+        while pending and time.time() < deadline:
+            time.sleep(2)
+            for name in list(pending):
+                try:
+                    check(self.get_pvc(name, ns))
+                except requests.RequestException:
+                    pass
+        return not pending
+    
     def get_vmi(self, name: str, namespace: str = None, silent: bool = False) -> dict:
         """Get VirtualMachineInstance (running VM) by name."""
         ns = namespace or self.namespace
         url = f"{self.base_url}/apis/kubevirt.io/v1/namespaces/{ns}/virtualmachineinstances/{name}"
         
-        response = requests.get(
+        response = self._session.get(
             url,
             cert=self.cert,
             verify=self.verify if self.verify else False
@@ -179,14 +412,14 @@ class HarvesterClient:
         if not response.ok:
             if not silent:
                 try:
-                    error_detail = response.json()
+                    error_detail = json_loads(response.content)
                     error_msg = error_detail.get('message', response.text)
                     print(f"API Error: {error_msg}")
                 except:
                     print(f"API Error: {response.text}")
             response.raise_for_status()
         
-        return response.json() if response.text else {}
+        return json_loads(response.content) if response.content else {}
     
     def get_vm_ip(self, name: str, namespace: str = None) -> List[dict]:
         """
@@ -200,13 +433,13 @@ class HarvesterClient:
         # Try Harvester v1 API first (used by UI)
         try:
             url = f"{self.base_url}/v1/kubevirt.io.virtualmachineinstances/{ns}/{name}"
-            response = requests.get(
+            response = self._session.get(
                 url,
                 cert=self.cert,
                 verify=self.verify if self.verify else False
             )
             if response.ok:
-                vmi = response.json()
+                vmi = json_loads(response.content)
                 interfaces = vmi.get('status', {}).get('interfaces', [])
                 for iface in interfaces:
                     ip = iface.get('ipAddress', '')
@@ -269,21 +502,30 @@ class HarvesterClient:
         ns = namespace or self.namespace
         url = f"{self.base_url}/apis/subresources.kubevirt.io/v1/namespaces/{ns}/virtualmachines/{name}/restart"
         
-        response = requests.put(
+        response = self._session.put(
             url,
             json={},
             cert=self.cert,
             verify=self.verify if self.verify else False
         )
         response.raise_for_status()
-        return response.json() if response.text else {}
+        return json_loads(response.content) if response.content else {}
     
     # === VMI Operations (Running Instances) ===
     
     def list_all_vmis(self) -> List[dict]:
         """List all VirtualMachineInstances (running VMs)."""
-        result = self._request("GET", "/apis/kubevirt.io/v1/virtualmachineinstances")
-        return result.get('items', [])
+        return self._list_items("/apis/kubevirt.io/v1/virtualmachineinstances")
+    
+    def list_all_vmi_metadata(self) -> List[dict]:
+        """
+        List all VMIs with metadata only (PartialObjectMetadataList).
+        
+        Enough to tell which VMs are running, without transferring the
+        VMI spec/status. Servers that don't support it return full objects.
+        """
+        return self._list_items("/apis/kubevirt.io/v1/virtualmachineinstances",
+                                accept=PARTIAL_METADATA_LIST)
     
     def list_vmis(self, namespace: str = None) -> List[dict]:
         """List VMIs in a namespace."""
@@ -309,8 +551,7 @@ class HarvesterClient:
     
     def list_all_images(self) -> List[dict]:
         """List all images across all namespaces."""
-        result = self._request("GET", "/apis/harvesterhci.io/v1beta1/virtualmachineimages")
-        return result.get('items', [])
+        return self._list_items("/apis/harvesterhci.io/v1beta1/virtualmachineimages")
     
     def get_image(self, name: str, namespace: str = None) -> dict:
         """Get image by name."""
@@ -378,10 +619,21 @@ class HarvesterClient:
         result = self._request("GET", "/apis/storage.k8s.io/v1/storageclasses")
         return result.get('items', [])
     
-    def list_namespaces(self) -> List[dict]:
-        """List namespaces."""
-        result = self._request("GET", "/api/v1/namespaces")
-        return result.get('items', [])
+    def list_namespaces(self, label_selector: str = None) -> List[dict]:
+        """List namespaces (metadata only, callers only need the names)."""
+        endpoint = "/api/v1/namespaces"
+        if label_selector:
+            endpoint += "?" + urlencode({'labelSelector': label_selector})
+        return self._list_items(endpoint, accept=PARTIAL_METADATA_LIST)
+    
+    def list_user_namespaces(self) -> List[dict]:
+        """
+        List namespaces without the Kubernetes core ones, filtered by the API server.
+        
+        Relies on the kubernetes.io/metadata.name label (Kubernetes 1.21+);
+        older servers return every namespace, so callers keep their own filter.
+        """
+        return self.list_namespaces(SYSTEM_NAMESPACE_SELECTOR)
     
     def list_pvcs(self, namespace: str = None) -> List[dict]:
         """List persistent volume claims."""
@@ -391,14 +643,24 @@ class HarvesterClient:
     
     def list_all_pvcs(self) -> List[dict]:
         """List all persistent volume claims across namespaces."""
-        result = self._request("GET", "/api/v1/persistentvolumeclaims")
-        return result.get('items', [])
+        return self._list_items("/api/v1/persistentvolumeclaims")
     
     def delete_pvc(self, name: str, namespace: str = None) -> dict:
         """Delete a PersistentVolumeClaim (volume)."""
         ns = namespace or self.namespace
         return self._request("DELETE", f"/api/v1/namespaces/{ns}/persistentvolumeclaims/{name}")
     
+    def delete_pvcs(self, names: List[str], namespace: str = None) -> Dict[str, Optional[Exception]]:
+        """
+        Delete several PVCs, issuing the DELETE calls concurrently.
+        
+        Returns:
+            Mapping of PVC name -> None on success or the exception raised
+        """
+        return self._run_concurrently({
+            name: (lambda name=name: self.delete_pvc(name, namespace)) for name in names
+        })
+    
     def clone_pvc(self, source_name: str, clone_name: str, namespace: str = None, storage_class: str = None) -> dict:
         """Clone a PVC using CSI volume cloning."""
         ns = namespace or self.namespace
@@ -524,6 +786,17 @@ class HarvesterClient:
     
     def update_vm_volume(self, vm_name: str, old_volume_name: str, new_volume_name: str, namespace: str = None) -> dict:
         """Update VM to use a different volume."""
+        return self.update_vm_volumes(vm_name, {old_volume_name: new_volume_name}, namespace)
+    
+    def update_vm_volumes(self, vm_name: str, renames: Dict[str, str], namespace: str = None) -> dict:
+        """
+        Point several VM volumes at new PVCs in a single read-modify-write.
+        
+        Args:
+            vm_name: VM name
+            renames: Mapping of old volume name -> new PVC name
+            namespace: VM namespace
+        """
         ns = namespace or self.namespace
         
         # Get current VM
@@ -533,27 +806,24 @@ class HarvesterClient:
         spec = vm.get('spec', {})
         template_spec = spec.get('template', {}).get('spec', {})
         
-        # Update volumes section
+        # Update volumes section, changing the reference to persistentVolumeClaim
+        # instead of dataVolume
         volumes = template_spec.get('volumes', [])
         for vol in volumes:
-            if vol.get('dataVolume', {}).get('name') == old_volume_name:
-                vol['dataVolume']['name'] = new_volume_name
-            elif vol.get('persistentVolumeClaim', {}).get('claimName') == old_volume_name:
-                vol['persistentVolumeClaim']['claimName'] = new_volume_name
+            dv_name = vol.get('dataVolume', {}).get('name')
+            if dv_name in renames:
+                vol['persistentVolumeClaim'] = {'claimName': renames[dv_name]}
+                del vol['dataVolume']
+            elif vol.get('persistentVolumeClaim', {}).get('claimName') in renames:
+                vol['persistentVolumeClaim']['claimName'] = renames[vol['persistentVolumeClaim']['claimName']]
         
         # Remove dataVolumeTemplates (since we're using existing PVC now)
         if 'dataVolumeTemplates' in spec:
             spec['dataVolumeTemplates'] = [
                 dvt for dvt in spec['dataVolumeTemplates'] 
-                if dvt.get('metadata', {}).get('name') != old_volume_name
+                if dvt.get('metadata', {}).get('name') not in renames
             ]
         
-        # Change volume reference to persistentVolumeClaim instead of dataVolume
-        for vol in volumes:
-            if vol.get('dataVolume', {}).get('name') == new_volume_name:
-                vol['persistentVolumeClaim'] = {'claimName': new_volume_name}
-                del vol['dataVolume']
-        
         # Update the VM
         return self._request("PUT", f"/apis/kubevirt.io/v1/namespaces/{ns}/virtualmachines/{vm_name}", vm)
     
@@ -592,6 +862,7 @@ class HarvesterClient:
             'namespace': metadata.get('namespace'),
             'running': spec.get('running', False),
             'status': status.get('printableStatus', 'Unknown'),
+            'ready': status.get('ready'),
             'cpu_cores': domain.get('cpu', {}).get('cores'),
             'memory': domain.get('memory', {}).get('guest'),
         }
@@ -902,6 +1173,23 @@ class HarvesterClient:
         
         return self._request("POST", f"/api/v1/namespaces/{ns}/persistentvolumeclaims", pvc_manifest)
     
+    def create_empty_block_pvcs(self, disks: List[dict], namespace: str = None) -> Dict[str, Optional[Exception]]:
+        """
+        Create several empty Block PVCs, issuing the POST calls concurrently.
+        
+        Args:
+            disks: Dicts with name, size_gi and storage_class
+            namespace: Target namespace
+        
+        Returns:
+            Mapping of PVC name -> None on success or the exception raised
+        """
+        return self._run_concurrently({
+            disk['name']: (lambda disk=disk: self.create_empty_block_pvc(
+                disk['name'], disk['size_gi'], disk['storage_class'], namespace))
+            for disk in disks
+        })
+    
     def create_importer_pod(self, pod_name: str, pvc_name: str, 
                             nfs_server: str, nfs_path: str, qcow2_file: str,
                             namespace: str = None) -> dict:
@@ -1103,7 +1391,7 @@ fi
         """Get pod logs."""
         ns = namespace or self.namespace
         url = f"{self.base_url}/api/v1/namespaces/{ns}/pods/{name}/log?tailLines={tail_lines}"
-        response = requests.get(url, cert=self.cert, verify=self.verify if self.verify else False)
+        response = self._session.get(url, cert=self.cert, verify=self.verify if self.verify else False)
         if response.ok:
             return response.text
         return ""
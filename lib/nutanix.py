@@ -8,11 +8,21 @@ import shutil
 import time
 import requests
 import urllib3
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator
+from .utils import json_dumpb, json_loads
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+@lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """Resolve an external tool on PATH once per process."""
+    return shutil.which(tool)
+
+
 class NutanixClient:
     """Nutanix Prism API client."""
     
@@ -33,27 +43,100 @@ class NutanixClient:
         self.cvm_ip = config.get('cvm_ip', config['prism_ip'])  # Default to prism_ip
         self.cvm_user = config.get('cvm_user', 'nutanix')
         self.nfs_mount_path = config.get('nfs_mount_path', '/mnt/nutanix')
+        
+        # Shared session: one TLS connection pool, auth/verify set once
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.verify = self.verify_ssl
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3,
+                                                status_forcelist=(429, 503),
+                                                raise_on_status=False))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Lowercased VM name -> UUID, refreshed by every full list_vms()
+        self._vm_uuid_by_name: Dict[str, str] = {}
+    
+    def close(self):
+        """Close the pooled keep-alive connections."""
+        session = getattr(self, 'session', None)
+        if session:
+            session.close()
+    
+    def __del__(self):
+        """Close the HTTP session."""
+        self.close()
     
     def _request(self, method: str, endpoint: str, data: dict = None) -> dict:
         """Execute API request."""
         url = f"{self.base_url}/{endpoint}"
-        response = requests.request(
+        response = self.session.request(
             method=method,
             url=url,
-            auth=self.auth,
-            json=data,
-            verify=self.verify_ssl
+            data=json_dumpb(data) if data is not None else None,
+            headers={'Content-Type': 'application/json'} if data is not None else None
         )
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
+    
+    def _iter_entities(self, kind: str, filter_expr: str = None, page_size: int = 500) -> Iterator[dict]:
+        """
+        Yield entities from POST <kind>s/list page by page until total_matches is reached.
+        
+        Each decoded page is released once its entities have been yielded.
+        
+        Args:
+            kind: v3 entity kind ('vm', 'image')
+            filter_expr: Optional server-side FIQL filter (e.g. 'power_state==on')
+            page_size: Entities per request (Prism caps this at 500)
+        """
+        offset = 0
+        while True:
+            payload = {"kind": kind, "length": page_size, "offset": offset}
+            if filter_expr:
+                payload["filter"] = filter_expr
+            result = self._request("POST", f"{kind}s/list", payload)
+            page = result.get('entities', [])
+            total = result.get('metadata', {}).get('total_matches', 0)
+            del result
+            yield from page
+            offset += len(page)
+            if not page or offset >= total:
+                return
+    
+    def _list_entities(self, kind: str, filter_expr: str = None, page_size: int = 500) -> List[dict]:
+        """Collect all entities of a kind (see _iter_entities)."""
+        return list(self._iter_entities(kind, filter_expr, page_size))
     
     # === VM Operations ===
     
-    def list_vms(self, limit: int = 500) -> List[dict]:
-        """List all VMs."""
-        payload = {"kind": "vm", "length": limit}
-        result = self._request("POST", "vms/list", payload)
-        return result.get('entities', [])
+    def list_vms(self, limit: int = 500, filter_expr: str = None) -> List[dict]:
+        """List all VMs (paginated, limit is the page size)."""
+        vms = self._list_entities("vm", filter_expr, limit)
+        if not filter_expr:
+            self._index_vm_names(vms)
+        return vms
+    
+    def iter_vms(self, page_size: int = 200, filter_expr: str = None) -> Iterator[dict]:
+        """Yield VMs as their pages arrive, without building the full list."""
+        return self._iter_entities("vm", filter_expr, page_size)
+    
+    def _index_vm_names(self, vms: List[dict]):
+        """Rebuild the name -> UUID index; names shared by several VMs are left out."""
+        index = {}
+        duplicates = set()
+        for vm in vms:
+            name = (vm.get('spec', {}).get('name') or '').lower()
+            uuid = vm.get('metadata', {}).get('uuid')
+            if not name or not uuid:
+                continue
+            if name in index:
+                duplicates.add(name)
+            index[name] = uuid
+        for name in duplicates:
+            del index[name]
+        self._vm_uuid_by_name = index
     
     def get_vm(self, vm_uuid: str) -> dict:
         """Get VM details by UUID."""
@@ -61,6 +144,14 @@ class NutanixClient:
     
     def get_vm_by_name(self, vm_name: str) -> Optional[dict]:
         """Get VM by name (case-insensitive, partial match)."""
+        # Exact name seen in the last full listing: fetch it directly by UUID
+        uuid = self._vm_uuid_by_name.get(vm_name.lower())
+        if uuid:
+            try:
+                return self.get_vm(uuid)
+            except requests.HTTPError:
+                self._vm_uuid_by_name.pop(vm_name.lower(), None)  # Deleted since
+        
         # Use contains filter for partial match
         payload = {"kind": "vm", "filter": f"vm_name==.*{vm_name.lower()}.*", "length": 10}
         result = self._request("POST", "vms/list", payload)
@@ -68,13 +159,9 @@ class NutanixClient:
         
         # If regex doesn't work, try listing all and filtering client-side
         if not entities:
-            payload = {"kind": "vm", "length": 500}
-            result = self._request("POST", "vms/list", payload)
-            all_vms = result.get('entities', [])
-            
-            # Case-insensitive search
+            # Case-insensitive search, stopping at the first page with a match
             search_name = vm_name.lower()
-            for vm in all_vms:
+            for vm in self.iter_vms():
                 nutanix_name = vm.get('spec', {}).get('name', '').lower()
                 if search_name in nutanix_name or nutanix_name in search_name:
                     return vm
@@ -118,11 +205,9 @@ class NutanixClient:
     
     # === Image Operations ===
     
-    def list_images(self, limit: int = 500) -> List[dict]:
-        """List all images."""
-        payload = {"kind": "image", "length": limit}
-        result = self._request("POST", "images/list", payload)
-        return result.get('entities', [])
+    def list_images(self, limit: int = 500, filter_expr: str = None) -> List[dict]:
+        """List all images (paginated, limit is the page size)."""
+        return self._list_entities("image", filter_expr, limit)
     
     def get_image(self, image_uuid: str) -> dict:
         """Get image details."""
@@ -259,13 +344,9 @@ class NutanixClient:
     
     def _download_with_aria2(self, url: str, dest_path: str, progress_callback=None) -> bool:
         """Download using aria2c for maximum speed."""
-        import subprocess
-        import os
-        import time
-        import shutil
-        
         # Check if aria2c is available
-        if not shutil.which('aria2c'):
+        aria2c = _which('aria2c')
+        if not aria2c:
             raise Exception("aria2c not installed")
         
         dest_dir = os.path.dirname(dest_path) or '.'
@@ -273,7 +354,7 @@ class NutanixClient:
         
         # Build aria2c command
         cmd = [
-            'aria2c',
+            aria2c,
             '-x16', '-s16',
             '-k1M',
             '--file-allocation=none',
@@ -308,10 +389,8 @@ class NutanixClient:
     
     def _download_with_requests(self, url: str, dest_path: str, progress_callback=None) -> bool:
         """Download using Python requests (fallback)."""
-        response = requests.get(
+        response = self.session.get(
             url,
-            auth=self.auth,
-            verify=self.verify_ssl,
             stream=True
         )
         response.raise_for_status()
@@ -355,12 +434,15 @@ class NutanixClient:
         # Calculate disk info
         disks = resources.get('disk_list', [])
         disk_list = []
+        total_disk_bytes = 0
         for disk in disks:
             device_props = disk.get('device_properties', {})
             if device_props.get('device_type') == 'DISK':
+                size_bytes = disk.get('disk_size_bytes', 0) or disk.get('disk_size_mib', 0) * 1024 * 1024
+                total_disk_bytes += size_bytes
                 disk_list.append({
                     'uuid': disk.get('uuid'),
-                    'size_bytes': disk.get('disk_size_bytes', 0) or disk.get('disk_size_mib', 0) * 1024 * 1024,
+                    'size_bytes': size_bytes,
                     'adapter': device_props.get('disk_address', {}).get('adapter_type'),
                     'index': device_props.get('disk_address', {}).get('device_index'),
                 })
@@ -390,6 +472,7 @@ class NutanixClient:
             'memory_mb': resources.get('memory_size_mib', 0),
             'boot_type': boot_type,
             'disks': disk_list,
+            'total_disk_bytes': total_disk_bytes,
             'nics': nic_list,
         }
     
@@ -410,17 +493,15 @@ class NutanixClient:
         url = f"https://{self.prism_ip}:9440/PrismGateway/services/rest/v2.0/vms/"
         params = {'include_vm_disk_config': 'true'}
         
-        response = requests.get(
+        response = self.session.get(
             url,
-            auth=self.auth,
-            params=params,
-            verify=self.verify_ssl
+            params=params
         )
         response.raise_for_status()
         
         # Find the VM by name
         target_vm = None
-        for vm in response.json().get('entities', []):
+        for vm in json_loads(response.content).get('entities', []):
             if vm.get('name') == vm_name:
                 target_vm = vm
                 break
@@ -534,12 +615,30 @@ class NutanixClient:
         last_copied = 0
         
         with open(src_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            src_fd = src.fileno()
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            # copy_file_range lets the kernel move the data without passing it
+            # through Python; fall back to read/write where it is refused
+            # (non-Linux, or EXDEV/EINVAL between these filesystems)
+            use_copy_range = hasattr(os, 'copy_file_range')
             while True:
-                chunk = src.read(chunk_size)
-                if not chunk:
+                n = 0
+                if use_copy_range:
+                    try:
+                        n = os.copy_file_range(src_fd, dst.fileno(), chunk_size)
+                    except OSError:
+                        use_copy_range = False
+                if not use_copy_range:
+                    chunk = src.read(chunk_size)
+                    dst.write(chunk)
+                    n = len(chunk)
+                if not n:
                     break
-                dst.write(chunk)
-                copied += len(chunk)
+                copied += n
+                if hasattr(os, 'posix_fadvise'):
+                    # Source data won't be read again, keep it out of the page cache
+                    os.posix_fadvise(src_fd, copied - n, n, os.POSIX_FADV_DONTNEED)
                 
                 # Progress update every second
                 now = time.time()
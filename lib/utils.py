@@ -3,6 +3,17 @@ Utility functions and classes for the migration tool.
 """
 
 import os
+import sys
+import json
+import time
+from functools import lru_cache
+
+# orjson import with fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class Colors:
     """ANSI color codes."""
@@ -16,13 +27,23 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Decided once at import: escapes are only useful on a terminal
+COLOR_ENABLED = sys.stdout.isatty() and 'NO_COLOR' not in os.environ
+
+# Invisible width colored() adds to a single-code cell (for padding table columns)
+COLOR_PAD = len(Colors.GREEN + Colors.ENDC) if COLOR_ENABLED else 0
+
+
 def colored(text: str, color: str) -> str:
-    """Apply ANSI color to text."""
+    """Apply ANSI color to text (plain text when output is not a terminal)."""
+    if not COLOR_ENABLED:
+        return text
     return f"{color}{text}{Colors.ENDC}"
 
 
+@lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
-    """Format bytes to human readable size."""
+    """Format bytes to human readable size (memoized, disk sizes repeat a lot)."""
     if size_bytes == 0:
         return "0 B"
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -34,5 +55,38 @@ def format_size(size_bytes: int) -> str:
 
 def format_timestamp(ts: float) -> str:
     """Format Unix timestamp to readable date."""
-    from datetime import datetime
-    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+    return _format_second(int(ts))
+
+
+@lru_cache(maxsize=4096)
+def _format_second(ts: int) -> str:
+    # Files written together share mtimes down to the second
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+
+
+def json_load(fp):
+    """Parse JSON from a file opened in binary mode (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(fp.read())
+    return json.load(fp)
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize object to a JSON string (orjson if available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def json_dumpb(obj) -> bytes:
+    """Serialize object to UTF-8 JSON bytes, e.g. for HTTP bodies."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
@@ -9,14 +9,11 @@ import subprocess
 from datetime import datetime
 from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass, asdict
+from importlib.util import find_spec
 
-# WinRM import with fallback
-try:
-    import winrm
-    from winrm.protocol import Protocol
-    WINRM_AVAILABLE = True
-except ImportError:
-    WINRM_AVAILABLE = False
+# pywinrm pulls in requests, requests_ntlm and cryptography; only probe for
+# it here and import it when a WinRMClient is actually created
+WINRM_AVAILABLE = find_spec('winrm') is not None
 
 
 @dataclass
@@ -196,6 +193,7 @@ class WinRMClient:
         """
         if not WINRM_AVAILABLE:
             raise ImportError("pywinrm not installed. Run: pip install pywinrm[kerberos]")
+        import winrm
         
         self.host = host
         self.transport = transport
@@ -318,9 +316,8 @@ foreach ($l in $udpListeners) {
 $allPids = $allPids | Select-Object -Unique
 
 # Get services for these PIDs
-$services = Get-CimInstance Win32_Service | Where-Object { 
-    $_.ProcessId -in $allPids -and $_.State -eq 'Running'
-}
+$services = Get-CimInstance Win32_Service -Filter "State = 'Running'" |
+    Where-Object ProcessId -in $allPids
 
 # ONLY exclude services essential for WinRM connectivity
 # All other services (AD, DNS, DHCP, etc.) CAN and SHOULD be stopped before DC migration
@@ -463,7 +460,7 @@ $cs = Get-CimInstance Win32_ComputerSystem
 '''
 
     PS_NETWORK_INFO = '''
-$adapters = Get-NetAdapter | Where-Object { $_.Status -eq 'Up' }
+$adapters = Get-NetAdapter -ErrorAction SilentlyContinue | Where-Object Status -eq 'Up'
 $results = @()
 foreach ($adapter in $adapters) {
     $ipConfig = Get-NetIPConfiguration -InterfaceIndex $adapter.ifIndex -ErrorAction SilentlyContinue
@@ -805,7 +802,7 @@ Write-Output "Static IP configured successfully"
 
     PS_UNINSTALL_NGT = r'''
 $ngtUninstall = Get-ItemProperty "HKLM:\SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\*" | 
-    Where-Object { $_.DisplayName -like "*Nutanix*Guest*" }
+    Where-Object DisplayName -like "*Nutanix*Guest*"
 
 if ($ngtUninstall) {
     $uninstallString = $ngtUninstall.UninstallString
@@ -863,7 +860,7 @@ $registryPaths = @(
 foreach ($regPath in $registryPaths) {
     foreach ($pattern in $nutanixPatterns) {
         $apps = Get-ItemProperty $regPath -ErrorAction SilentlyContinue | 
-            Where-Object { $_.DisplayName -like $pattern }
+            Where-Object DisplayName -like $pattern
         
         foreach ($app in $apps) {
             $displayName = $app.DisplayName
@@ -916,8 +913,7 @@ foreach ($regPath in $registryPaths) {
 # Also try WMI-based uninstall for any remaining Nutanix products
 Log "Checking for remaining Nutanix products via WMI..."
 try {
-    $wmiProducts = Get-WmiObject -Class Win32_Product -ErrorAction SilentlyContinue | 
-        Where-Object { $_.Name -like "*Nutanix*" }
+    $wmiProducts = Get-WmiObject -Class Win32_Product -Filter "Name LIKE '%Nutanix%'" -ErrorAction SilentlyContinue
     
     foreach ($product in $wmiProducts) {
         Log "Found via WMI: $($product.Name)"
@@ -1285,7 +1281,7 @@ Write-Output "Static IP configured"
             "# Uninstall Nutanix Guest Tools",
             "Write-Host 'Removing Nutanix Guest Tools...' -ForegroundColor Cyan",
             '$ngtUninstall = Get-ItemProperty "HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*" |',
-            '    Where-Object { $_.DisplayName -like "*Nutanix*Guest*" }',
+            '    Where-Object DisplayName -like "*Nutanix*Guest*"',
             "",
             "if ($ngtUninstall) {",
             "    $uninstallString = $ngtUninstall.UninstallString",
@@ -9,28 +9,229 @@ import os
 import sys
 import re
 import time
-import yaml
+import getpass
+import shutil
+import subprocess
 import argparse
 import json
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property, lru_cache, wraps
+from operator import itemgetter
 
 # Add lib to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from lib import Colors, colored, format_size, format_timestamp
-from lib import NutanixClient, HarvesterClient, MigrationActions
+from lib import Colors, colored, COLOR_PAD, format_size, format_timestamp, json_load, json_dumps
 from lib.vault import Vault, VaultError, get_kerberos_auth, kinit
 from lib.windows import (
     WinRMClient, WindowsPreCheck, WindowsPostConfig, VMConfig, ListeningService,
     download_virtio_tools, check_winrm_available, WINRM_AVAILABLE
 )
 
+# Disk buses switched to virtio by switch_vm_disk_bus
+LEGACY_DISK_BUSES = frozenset({'sata', 'ide', 'scsi'})
+
+# Shared read-only default for nested .get() chains (never mutate)
+_EMPTY: dict = {}
+
+# List cache keys filled from the Harvester API (see MigrationTool._cached_list)
+HARVESTER_LIST_KEYS = ('harvester_vms', 'harvester_vmis', 'harvester_images',
+                       'harvester_networks', 'harvester_storage', 'harvester_pvcs',
+                       'harvester_namespaces')
+
+# System namespaces hidden from the namespace pickers (harvester-public is kept)
+SYSTEM_NAMESPACE_NAME = re.compile(r'kube-|cattle-|fleet-|local|longhorn-|harvester-system')
+
+# Pre-colored Nutanix power state labels; unknown states fall back to red
+POWER_STATE_LABELS = {
+    'ON': colored('ON', Colors.GREEN),
+    'OFF': colored('OFF', Colors.RED),
+}
+
+
+def power_state_label(state: str) -> str:
+    label = POWER_STATE_LABELS.get(state)
+    return label if label is not None else colored(state, Colors.RED)
+
+
+# Pre-colored Harvester VM status labels (see list_harvester_vms): running
+# VMs are green, VMs without a known status red, reported states yellow
+VM_RUNNING_LABEL = colored("Running", Colors.GREEN)
+VM_STOPPED_LABEL = colored("Stopped", Colors.RED)
+VM_STATUS_LABELS = {s: colored(s, Colors.YELLOW) for s in (
+    'Stopped', 'Starting', 'Stopping', 'Provisioning', 'Migrating', 'Paused',
+    'Terminating', 'WaitingForVolumeBinding', 'ErrorUnschedulable', 'CrashLoopBackOff')}
+
+
+def vm_status_label(status: str) -> str:
+    label = VM_STATUS_LABELS.get(status)
+    return label if label is not None else colored(status, Colors.YELLOW)
+
+
+# Staging file extension -> pre-colored type label (see list_staging_disks)
+DISK_TYPE_LABELS = {
+    '.raw': colored("RAW", Colors.YELLOW),
+    '.qcow2': colored("QCOW2", Colors.GREEN),
+    '.vmdk': colored("VMDK", Colors.BLUE),
+    '.vhd': colored("VHD", Colors.BLUE),
+    '.vhdx': colored("VHD", Colors.BLUE),
+    '.iso': colored("ISO", Colors.CYAN),
+}
+
+# Per-row marks and labels of the listings and pickers, colored once at import
+SELECTED_MARK = colored(" ← selected", Colors.YELLOW)
+DONE_MARK = colored("✓", Colors.GREEN)
+PENDING_MARK = colored("○", Colors.YELLOW)
+STEP_DONE_LABEL = colored("✓ Done", Colors.GREEN)
+STEP_PENDING_LABEL = colored("○ Pending", Colors.YELLOW)
+COMPLETED_LABEL = colored("✅ Completed", Colors.GREEN)
+CONFIG_FOUND_MARK = colored("✓ config", Colors.GREEN)
+CONFIG_MANUAL_MARK = colored("○ manual", Colors.YELLOW)
+VOLUME_IMAGE_BACKED = colored("image-backed", Colors.YELLOW)
+VOLUME_INDEPENDENT = colored("independent", Colors.GREEN)
+PVC_BOUND_LABEL = colored("Bound", Colors.GREEN)
+
+# Row templates for the listing tables (colored columns are padded wider by
+# COLOR_PAD to make room for their escape codes)
+NUTANIX_VM_ROW = ("{:<4} {:<35} {:<%d} {:<6} {:<10} {:<18}" % (8 + COLOR_PAD)).format
+NUTANIX_IMAGE_ROW = "{:<40} {:<15} {:<15} {}".format
+HARVESTER_VM_ROW = ("{:<35} {:<15} {:<%d} {:<6} {:<10}" % (12 + COLOR_PAD)).format
+STAGING_FILE_ROW = "{:<4} {:<40} {:<15} {:<20} {}".format
+
+# Fixed-width separators, colored once at import (the listing tables use
+# MigrationTool._rule, which follows the terminal width)
+HEADER_RULE = colored("=" * 70, Colors.CYAN)
+EQ_RULE_60 = colored("=" * 60, Colors.BLUE)
+EQ_RULE_80 = colored("=" * 80, Colors.BLUE)
+DASH_RULE_40 = colored("-" * 40, Colors.BLUE)
+DASH_RULE_50 = colored("-" * 50, Colors.BLUE)
+
+# Static next-step hints, colored once at import
+TIP_NEXT_POSTMIG_WINDOWS = colored("\n💡 Next step: Menu Migration → Post-migration Windows (option 6)", Colors.YELLOW) + "\n"
+TIP_NEXT_CONFIGURE_NETWORK = colored("\n💡 Next step: Configure VM network if needed", Colors.YELLOW) + "\n"
+TIP_NEXT_SWITCH_DISK_BUS = "\n".join([
+    colored("\n💡 Next steps:", Colors.YELLOW),
+    "   1. Reboot the VM if not done",
+    "   2. Menu Harvester → Switch VM disk bus (option 12)",
+    "   3. Start VM and verify boot",
+]) + "\n"
+TIP_VIRTIO_AVAILABLE = "\n".join([
+    colored("\n💡 VirtIO Optimization Available:", Colors.YELLOW),
+    "   You can switch from SATA to VirtIO disk bus for better performance.",
+    "   Menu Harvester → Switch VM disk bus",
+]) + "\n"
+
+# Configuration screen (menu_config), filled with % from the loaded config
+CONFIG_SCREEN = "\n".join([
+    colored("\n⚙️  CURRENT CONFIGURATION", Colors.BOLD),
+    DASH_RULE_40,
+    "\nNutanix:",
+    "   Prism IP: %s",
+    "   Username: %s",
+    "\nHarvester:",
+    "   API URL: %s",
+    "   Namespace: %s",
+    "\nCeph:",
+    "   Mon IP: %s",
+    "\nTransfer:",
+    "   Staging: %s",
+]) + "\n"
+
+# Fixed parts of the VirtualMachine domain built by create_harvester_vm; shared
+# between manifests, which are only serialized, never modified
+UEFI_FIRMWARE = {"bootloader": {"efi": {"secureBoot": False, "persistent": False}}}
+VM_INPUT_DEVICES = [{"bus": "usb", "name": "tablet", "type": "tablet"}]
+VM_FEATURES = {"acpi": {"enabled": True}}
+
+
+def qcow2_stem(path: str) -> str:
+    """File name without directory and trailing .qcow2 (default volume name)."""
+    name = os.path.basename(path)
+    return name[:-6] if name.endswith('.qcow2') else name
+
+
+def spec_name(obj: dict) -> str:
+    """Name of a Nutanix v3 entity."""
+    return (obj.get('spec') or _EMPTY).get('name', '')
+
+
+def object_meta(obj: dict) -> tuple:
+    """(name, namespace, annotations) of a Kubernetes object, read in one pass."""
+    md = obj.get('metadata') or _EMPTY
+    return md.get('name', 'N/A'), md.get('namespace', 'N/A'), md.get('annotations') or _EMPTY
+
+
+def by_name(objs: list) -> list:
+    """Kubernetes objects sorted by lowercased name (key computed once per object)."""
+    keyed = [((obj.get('metadata') or _EMPTY).get('name', '').lower(), i, obj) for i, obj in enumerate(objs)]
+    keyed.sort(key=itemgetter(0, 1))
+    return [obj for _, _, obj in keyed]
+
+
+def vmi_names(vmis: list) -> set:
+    """Names of the given VMIs, i.e. the Harvester VMs that are running."""
+    names = set()
+    for vmi in vmis:
+        try:
+            names.add(vmi['metadata']['name'])
+        except KeyError:
+            pass
+    return names
+
+
+def split_scratch_pvcs(pvcs: list) -> tuple:
+    """Split PVCs in one pass into (regular sorted by name, CDI scratch/prime-* volumes)."""
+    regular, scratch = [], []
+    for pvc in pvcs:
+        name = pvc.get('metadata', _EMPTY).get('name', '')
+        if 'scratch' in name.lower() or name.startswith('prime-'):
+            scratch.append(pvc)
+        else:
+            regular.append(pvc)
+    return by_name(regular), scratch
+
+
+def throttled(progress, interval: float = 0.016):
+    """Wrap a progress(pct) callback to draw at most once per frame (~60 fps); 100% always passes."""
+    last = [0.0]
+    
+    def wrapper(pct):
+        now = time.monotonic()
+        if pct < 100 and now - last[0] < interval:
+            return
+        last[0] = now
+        progress(pct)
+    return wrapper
+
+
+def invalidates(*keys):
+    """Decorator: drop the given list cache entries once the method returns."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self.invalidate_list_cache(*keys)
+        return wrapper
+    return decorator
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime: float, size: int) -> dict:
+    import yaml
+    # libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
+
 
 def load_config(config_path: str = "config.yaml") -> dict:
-    """Load configuration from YAML file."""
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    """Load configuration from YAML file (re-parsed only when the file changes)."""
+    st = os.stat(config_path)
+    return _load_config_cached(config_path, st.st_mtime, st.st_size)
 
 
 def detect_boot_type_from_disk(disk_path: str) -> str:
@@ -44,7 +245,6 @@ def detect_boot_type_from_disk(disk_path: str) -> str:
     Returns:
         'UEFI' or 'BIOS'
     """
-    import subprocess
     
     if not os.path.exists(disk_path):
         print(colored(f"   ⚠️  Disk not found: {disk_path}", Colors.YELLOW))
@@ -140,9 +340,17 @@ class MigrationTool:
         self.harvester = None
         self.actions = None
         self._selected_vm = None
+        self._print_lock = threading.Lock()  # Serializes output of concurrent connects
+        self._list_cache = {}  # key -> (timestamp, items), see _cached_list
+        self._header_cache = (None, None)  # (selected VM, rendered header)
+        self._running_names_cache = (None, frozenset())  # (VMI list, names), see _running_names
+        self._sorted_views = {}  # key -> (source list, sorted records), see _sorted_view
+        # Shared pool for background/concurrent API calls; capped to stay polite to the APIs
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='migtool-io')
+        self._prefetching = {}  # key -> Future of a background _cached_list refresh
         
         # Initialize vault for credentials
-        windows_config = self.config.get('windows', {})
+        windows_config = self.windows_cfg
         vault_backend = windows_config.get('vault_backend', 'prompt')
         vault_path = windows_config.get('vault_path', 'migration/windows')
         try:
@@ -151,31 +359,210 @@ class MigrationTool:
             # Fallback to prompt if vault not configured
             self.vault = Vault(backend='prompt', vault_path=vault_path)
     
+    @cached_property
+    def nutanix_cfg(self) -> dict:
+        """Nutanix section of the config."""
+        return self.config.get('nutanix', {})
+    
+    @cached_property
+    def harvester_cfg(self) -> dict:
+        """Harvester section of the config."""
+        return self.config.get('harvester', {})
+    
+    @cached_property
+    def ceph_cfg(self) -> dict:
+        """Ceph section of the config."""
+        return self.config.get('ceph', {})
+    
+    @cached_property
+    def transfer_cfg(self) -> dict:
+        """Transfer section of the config."""
+        return self.config.get('transfer', {})
+    
+    @cached_property
+    def windows_cfg(self) -> dict:
+        """Windows section of the config."""
+        return self.config.get('windows', {})
+    
+    @cached_property
+    def staging_dir(self) -> str:
+        """Staging mount point from config."""
+        return self.transfer_cfg.get('staging_mount', '/mnt/data')
+    
+    @cached_property
+    def migrations_dir(self) -> str:
+        """Per-VM migration data directory under staging."""
+        return os.path.join(self.staging_dir, 'migrations')
+    
+    @cached_property
+    def tools_dir(self) -> str:
+        """VirtIO / QEMU guest agent tools directory under staging."""
+        return os.path.join(self.staging_dir, 'tools')
+    
     def clear_screen(self):
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Write the ANSI clear/home sequence directly rather than spawning clear/cls
+        if sys.stdout.isatty():
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
     
     def print_header(self):
-        self.clear_screen()
-        print(colored("=" * 70, Colors.CYAN))
-        print(colored("   NUTANIX → HARVESTER MIGRATION TOOL", Colors.BOLD + Colors.CYAN))
-        print(colored("=" * 70, Colors.CYAN))
-        if self._selected_vm:
-            print(colored(f"   Selected VM: {self._selected_vm}", Colors.YELLOW))
-        print()
+        # Header text only changes with the selected VM, so render it once per
+        # selection and emit clear + header as a single write.
+        selected, header = self._header_cache
+        if header is None or selected != self._selected_vm:
+            lines = [
+                HEADER_RULE,
+                colored("   NUTANIX → HARVESTER MIGRATION TOOL", Colors.BOLD + Colors.CYAN),
+                HEADER_RULE,
+            ]
+            if self._selected_vm:
+                lines.append(colored(f"   Selected VM: {self._selected_vm}", Colors.YELLOW))
+            header = "\n".join(lines) + "\n\n"
+            self._header_cache = (self._selected_vm, header)
+        if sys.stdout.isatty():
+            header = "\x1b[2J\x1b[H" + header
+        sys.stdout.write(header)
+        sys.stdout.flush()
     
     def print_menu(self, title: str, options: list):
-        print(colored(f"\n{title}", Colors.BOLD))
-        print(colored("-" * 40, Colors.BLUE))
-        for key, desc in options:
-            print(f"  {colored(key, Colors.GREEN)}. {desc}")
-        print()
+        lines = [colored(f"\n{title}", Colors.BOLD), DASH_RULE_40]
+        lines += [f"  {colored(key, Colors.GREEN)}. {desc}" for key, desc in options]
+        sys.stdout.write("\n".join(lines) + "\n\n")
     
     def input_prompt(self, prompt: str = "Choice") -> str:
         return input(colored(f"{prompt} > ", Colors.YELLOW)).strip()
     
+    def _item_at(self, items: list, choice: str):
+        """Return the item for a 1-based number typed by the user, or None (empty input cancels)."""
+        if not choice:
+            return None
+        if choice.isdecimal():
+            idx = int(choice) - 1
+            if 0 <= idx < len(items):
+                return items[idx]
+        print(colored("Invalid choice", Colors.RED))
+        return None
+    
+    def _item_or(self, items: list, choice: str, default):
+        """Return the item for a 1-based number typed by the user, or default for anything else."""
+        if choice.isdecimal():
+            idx = int(choice) - 1
+            if 0 <= idx < len(items):
+                return items[idx]
+        return default
+    
+    def _pick(self, items: list, prompt: str):
+        """Prompt for an item number and return the selected item, or None."""
+        return self._item_at(items, self.input_prompt(prompt))
+    
     def pause(self):
         input(colored("\nPress Enter to continue...", Colors.CYAN))
     
+    def _rule(self, width: int, char: str = '=') -> str:
+        """Table separator, clipped to the current terminal width so it never wraps."""
+        return char * min(width, shutil.get_terminal_size((width, 24)).columns)
+    
+    def _emit_table(self, rows: list):
+        """Write a whole table in one call instead of one print per row."""
+        sys.stdout.write("\n".join(rows) + "\n")
+    
+    def _emit_choices(self, title: str, labels):
+        """Numbered pick list ("  1. label"), written at once."""
+        rows = [f"\n{title}:"]
+        rows += [f"  {i}. {label}" for i, label in enumerate(labels, 1)]
+        self._emit_table(rows)
+        sys.stdout.flush()
+    
+    def _emit_file_menu(self, title: str, files: list):
+        """Numbered staging file list for the file pickers, written at once."""
+        self._emit_choices(title, (f"{f['name']} ({format_size(f['size'])})" for f in files))
+    
+    # === List Cache ===
+    
+    LIST_CACHE_MAX_AGE = 30  # seconds
+    
+    def _cached_list(self, key: str, fetch, max_age: float = None, refresh: bool = False) -> list:
+        """
+        Return fetch() result, reusing a cached copy younger than max_age.
+        
+        Used by the listing methods and the selection lists of the menu actions;
+        actions that change state drop the affected keys via @invalidates.
+        If the API call fails and an older copy exists, that copy is returned with
+        a warning, unless refresh=True (then the error propagates).
+        """
+        if max_age is None:
+            max_age = self.LIST_CACHE_MAX_AGE
+        pending = self._prefetching.get(key)
+        if not refresh and pending and not pending.done():
+            # A background prefetch is already fetching this list, reuse it
+            try:
+                pending.result()
+            except Exception:
+                pass
+        now = time.monotonic()
+        entry = self._list_cache.get(key)
+        if not refresh and entry and now - entry[0] < max_age:
+            return entry[1]
+        try:
+            items = fetch()
+        except Exception as e:
+            if refresh or not entry:
+                raise
+            with self._print_lock:
+                print(colored(f"⚠️  {e}", Colors.YELLOW))
+                print(colored(f"⚠️  Showing cached data from {int(now - entry[0])}s ago", Colors.YELLOW))
+            return entry[1]
+        self._list_cache[key] = (now, items)
+        return items
+    
+    def _fresh_cached_list(self, key: str):
+        """Cached list for key if it is still fresh, else None (never fetches)."""
+        entry = self._list_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.LIST_CACHE_MAX_AGE:
+            return entry[1]
+        return None
+    
+    def prefetch_lists(self, targets: list = None, missing_only: bool = False):
+        """
+        Warm the list cache in the background while the user reads the menu.
+        
+        targets is a list of (cache key, fetch) pairs, by default the lists
+        shown by the main menu actions. With missing_only, lists that are
+        already cached and fresh are left alone.
+        """
+        if targets is None:
+            targets = []
+            if self.nutanix:
+                targets.append(('nutanix_images', self.nutanix.list_images))
+            if self.harvester:
+                targets += [
+                    ('harvester_vms', self.harvester.list_all_vms),
+                    ('harvester_vmis', self.harvester.list_all_vmi_metadata),
+                ]
+        now = time.monotonic()
+        for key, fetch in targets:
+            pending = self._prefetching.get(key)
+            if pending and not pending.done():
+                continue
+            entry = self._list_cache.get(key)
+            if missing_only and entry and now - entry[0] < self.LIST_CACHE_MAX_AGE:
+                continue
+            self._prefetching[key] = self._io_pool.submit(self._cached_list, key, fetch, refresh=True)
+    
+    def close(self):
+        """Stop the background I/O pool, dropping queued work, and close API connections."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        for client in (self.nutanix, self.harvester):
+            if client:
+                client.close()
+    
+    def invalidate_list_cache(self, *keys):
+        """Drop cached lists (all of them if no key given)."""
+        if not keys:
+            self._list_cache.clear()
+        for key in keys:
+            self._list_cache.pop(key, None)
+    
     # === Migration Tracker Methods ===
     
     MIGRATION_STEPS = ['precheck', 'export', 'import_disks', 'create_vm', 'postmig']
@@ -189,8 +576,7 @@ class MigrationTool:
     
     def get_tracker_path(self) -> str:
         """Get path to migration tracker JSON file."""
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        return os.path.join(staging_dir, 'migrations', 'migration-tracker.json')
+        return os.path.join(self.migrations_dir, 'migration-tracker.json')
     
     def load_tracker(self) -> dict:
         """Load migration tracker from JSON file."""
@@ -366,28 +752,38 @@ class MigrationTool:
     
     def connect_nutanix(self) -> bool:
         try:
-            print("Connecting to Nutanix Prism...")
-            self.nutanix = NutanixClient(self.config['nutanix'])
-            vms = self.nutanix.list_vms()
-            print(colored(f"✅ Connected! {len(vms)} VMs found", Colors.GREEN))
+            with self._print_lock:
+                print("Connecting to Nutanix Prism...")
+            from lib import NutanixClient
+            self.nutanix = NutanixClient(self.nutanix_cfg)
+            vms = self._cached_list('nutanix_vms', self.nutanix.list_vms, refresh=True)
+            with self._print_lock:
+                print(colored(f"✅ Connected! {len(vms)} VMs found", Colors.GREEN))
             return True
         except Exception as e:
-            print(colored(f"❌ Error: {e}", Colors.RED))
+            with self._print_lock:
+                print(colored(f"❌ Nutanix: {e}", Colors.RED))
             return False
     
     def connect_harvester(self) -> bool:
         try:
-            print("Connecting to Harvester...")
-            self.harvester = HarvesterClient(self.config['harvester'])
-            nodes = self.harvester.get_nodes()
-            print(colored(f"✅ Connected! {len(nodes)} nodes", Colors.GREEN))
+            with self._print_lock:
+                print("Connecting to Harvester...")
+            from lib import HarvesterClient
+            self.harvester = HarvesterClient(self.harvester_cfg)
+            self.invalidate_list_cache(*HARVESTER_LIST_KEYS)
+            nodes = self.harvester.list_node_metadata()
+            with self._print_lock:
+                print(colored(f"✅ Connected! {len(nodes)} nodes", Colors.GREEN))
             return True
         except Exception as e:
-            print(colored(f"❌ Error: {e}", Colors.RED))
+            with self._print_lock:
+                print(colored(f"❌ Harvester: {e}", Colors.RED))
             return False
     
     def init_actions(self):
         if not self.actions:
+            from lib import MigrationActions
             self.actions = MigrationActions(self.config, self.nutanix, self.harvester)
     
     # === Nutanix Display Methods ===
@@ -396,31 +792,31 @@ class MigrationTool:
         if not self.nutanix and not self.connect_nutanix():
             return
         
-        vms = self.nutanix.list_vms()
+        vms = self._cached_list('nutanix_vms', self.nutanix.list_vms)
         
-        print(f"\n{'='*110}")
-        print(f"{'#':<4} {'VM Name':<35} {'State':<8} {'vCPU':<6} {'RAM':<10} {'Disks':<18}")
-        print(f"{'='*110}")
+        rows = [
+            "\n" + self._rule(110),
+            f"{'#':<4} {'VM Name':<35} {'State':<8} {'vCPU':<6} {'RAM':<10} {'Disks':<18}",
+            self._rule(110),
+        ]
         
-        sorted_vms = sorted(vms, key=lambda x: x.get('spec', {}).get('name', '').lower())
+        # Parse each VM once and sort the parsed records
+        parsed = self._sorted_view('nutanix_vms', vms, itemgetter('name'), self.nutanix.parse_vm_info)
         
-        for idx, vm in enumerate(sorted_vms, 1):
-            info = NutanixClient.parse_vm_info(vm)
-            
+        for idx, info in enumerate(parsed, 1):
             name = info['name'][:34] if info['name'] else 'N/A'
             state = info['power_state'] or 'N/A'
             vcpu = info['vcpu']
             ram = format_size(info['memory_mb'] * 1024 * 1024)
             
             disk_count = len(info['disks'])
-            total_size = sum(d['size_bytes'] for d in info['disks'])
-            disk_info = f"{disk_count}x ({format_size(total_size)})"
+            disk_info = f"{disk_count}x ({format_size(info['total_disk_bytes'])})"
             
-            state_color = Colors.GREEN if state == 'ON' else Colors.RED
-            print(f"{idx:<4} {name:<35} {colored(state, state_color):<17} {vcpu:<6} {ram:<10} {disk_info:<18}")
+            rows.append(NUTANIX_VM_ROW(idx, name, power_state_label(state), vcpu, ram, disk_info))
         
-        print(f"{'='*110}")
-        print(f"Total: {len(vms)} VMs")
+        rows.append(self._rule(110))
+        rows.append(f"Total: {len(vms)} VMs")
+        self._emit_table(rows)
     
     def show_vm_details(self, vm_name: str = None):
         if not self.nutanix and not self.connect_nutanix():
@@ -433,12 +829,17 @@ class MigrationTool:
             print(colored("No name specified", Colors.RED))
             return
         
-        vm = self.nutanix.get_vm_by_name(vm_name)
+        # Exact name from a recent listing needs no API call
+        search_name = vm_name.lower()
+        vm = next((v for v in self._fresh_cached_list('nutanix_vms') or ()
+                   if v.get('spec', _EMPTY).get('name', '').lower() == search_name), None)
+        if vm is None:
+            vm = self.nutanix.get_vm_by_name(vm_name)
         if not vm:
             print(colored(f"VM '{vm_name}' not found", Colors.RED))
             return
         
-        info = NutanixClient.parse_vm_info(vm)
+        info = self.nutanix.parse_vm_info(vm)
         
         print(colored(f"\n{'='*60}", Colors.CYAN))
         print(colored(f" VM: {info['name']}", Colors.BOLD))
@@ -446,8 +847,7 @@ class MigrationTool:
         
         print(colored("\n📋 General:", Colors.BOLD))
         print(f"   UUID: {info['uuid']}")
-        state_color = Colors.GREEN if info['power_state'] == 'ON' else Colors.RED
-        print(f"   State: {colored(info['power_state'], state_color)}")
+        print(f"   State: {power_state_label(info['power_state'])}")
         print(f"   vCPU: {info['vcpu']} ({info['num_sockets']} sockets x {info['num_vcpus_per_socket']} cores)")
         print(f"   RAM: {format_size(info['memory_mb'] * 1024 * 1024)}")
         print(f"   Boot: {info['boot_type']}")
@@ -467,7 +867,7 @@ class MigrationTool:
     def select_vm(self):
         """Select a VM from the migration tracker for the workflow."""
         print(colored("\n📋 Select VM for Migration", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         tracker = self.load_tracker()
         migrations = tracker.get('migrations', {})
@@ -490,7 +890,7 @@ class MigrationTool:
             next_label = self.STEP_LABELS.get(next_step, next_step)[:20] if next_step != "completed" else "✅ Done"
             
             # Mark current selection
-            current = colored(" ← selected", Colors.YELLOW) if self._selected_vm and self._selected_vm.lower() == vm_key else ""
+            current = SELECTED_MARK if self._selected_vm and self._selected_vm.lower() == vm_key else ""
             
             print(f"   {i:3}. {display_name:<20} {progress} → {next_label}{current}")
         
@@ -519,13 +919,15 @@ class MigrationTool:
         if not self.nutanix and not self.connect_nutanix():
             return
         
-        images = self.nutanix.list_images()
+        images = self._cached_list('nutanix_images', self.nutanix.list_images)
         
-        print(f"\n{'='*90}")
-        print(f"{'Image Name':<40} {'Type':<15} {'Size':<15} {'State'}")
-        print(f"{'='*90}")
+        rows = [
+            "\n" + self._rule(90),
+            f"{'Image Name':<40} {'Type':<15} {'Size':<15} {'State'}",
+            self._rule(90),
+        ]
         
-        for img in sorted(images, key=lambda x: x.get('spec', {}).get('name', '').lower()):
+        for img in self._sorted_view('nutanix_images', images, spec_name):
             spec = img.get('spec', {})
             status = img.get('status', {})
             name = spec.get('name', 'N/A')[:39]
@@ -533,37 +935,33 @@ class MigrationTool:
             size = status.get('resources', {}).get('size_bytes', 0)
             state = status.get('state', 'N/A')
             
-            print(f"{name:<40} {img_type:<15} {format_size(size):<15} {state}")
+            rows.append(NUTANIX_IMAGE_ROW(name, img_type, format_size(size), state))
         
-        print(f"{'='*90}")
-        print(f"Total: {len(images)} images")
+        rows.append(self._rule(90))
+        rows.append(f"Total: {len(images)} images")
+        self._emit_table(rows)
     
+    @invalidates('nutanix_images')
     def delete_nutanix_image(self):
         """Delete a Nutanix image (for cleanup after export)."""
         if not self.nutanix and not self.connect_nutanix():
             return
         
-        images = self.nutanix.list_images()
+        images = self._cached_list('nutanix_images', self.nutanix.list_images)
         
         if not images:
             print(colored("❌ No images found", Colors.YELLOW))
             return
         
         print("\nAvailable images (Enter to cancel):")
-        sorted_images = sorted(images, key=lambda x: x.get('spec', {}).get('name', '').lower())
+        sorted_images = self._sorted_view('nutanix_images', images, spec_name)
         for i, img in enumerate(sorted_images, 1):
             name = img.get('spec', {}).get('name', 'N/A')
             size = img.get('status', {}).get('resources', {}).get('size_bytes', 0)
             print(f"  {i}. {name} ({format_size(size)})")
         
-        choice = self.input_prompt("Image number to delete")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_images[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(sorted_images, "Image number to delete")
+        if selected is None:
             return
         
         image_name = selected.get('spec', {}).get('name')
@@ -579,37 +977,28 @@ class MigrationTool:
         else:
             print("Cancelled")
     
+    @invalidates('nutanix_vms')
     def power_on_nutanix_vm(self):
         """Power on a Nutanix VM."""
         if not self.nutanix and not self.connect_nutanix():
             return
         
-        vms = self.nutanix.list_vms()
+        vms = self._cached_list('nutanix_vms', self.nutanix.list_vms)
         
-        # Filter OFF VMs
-        off_vms = [vm for vm in vms if NutanixClient.parse_vm_info(vm).get('power_state') == 'OFF']
+        # Parse each VM once, keep the OFF ones sorted by name
+        parsed = self._sorted_view('nutanix_vms', vms, itemgetter('name'), self.nutanix.parse_vm_info)
+        off_vms = [info for info in parsed if info['power_state'] == 'OFF']
         
         if not off_vms:
             print(colored("❌ No powered off VMs found", Colors.YELLOW))
             return
         
-        print("\nPowered OFF VMs (Enter to cancel):")
-        sorted_vms = sorted(off_vms, key=lambda x: x.get('spec', {}).get('name', '').lower())
-        for i, vm in enumerate(sorted_vms, 1):
-            info = NutanixClient.parse_vm_info(vm)
-            print(f"  {i}. {info['name']}")
+        self._emit_choices("Powered OFF VMs (Enter to cancel)", (info['name'] for info in off_vms))
         
-        choice = self.input_prompt("VM number to power ON")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_vms[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        info = self._pick(off_vms, "VM number to power ON")
+        if info is None:
             return
         
-        info = NutanixClient.parse_vm_info(selected)
         vm_name = info['name']
         vm_uuid = info['uuid']
         
@@ -624,37 +1013,28 @@ class MigrationTool:
         else:
             print("Cancelled")
     
+    @invalidates('nutanix_vms')
     def power_off_nutanix_vm(self):
         """Power off a Nutanix VM."""
         if not self.nutanix and not self.connect_nutanix():
             return
         
-        vms = self.nutanix.list_vms()
+        vms = self._cached_list('nutanix_vms', self.nutanix.list_vms)
         
-        # Filter ON VMs
-        on_vms = [vm for vm in vms if NutanixClient.parse_vm_info(vm).get('power_state') == 'ON']
+        # Parse each VM once, keep the ON ones sorted by name
+        parsed = self._sorted_view('nutanix_vms', vms, itemgetter('name'), self.nutanix.parse_vm_info)
+        on_vms = [info for info in parsed if info['power_state'] == 'ON']
         
         if not on_vms:
             print(colored("❌ No powered on VMs found", Colors.YELLOW))
             return
         
-        print("\nPowered ON VMs (Enter to cancel):")
-        sorted_vms = sorted(on_vms, key=lambda x: x.get('spec', {}).get('name', '').lower())
-        for i, vm in enumerate(sorted_vms, 1):
-            info = NutanixClient.parse_vm_info(vm)
-            print(f"  {i}. {info['name']}")
+        self._emit_choices("Powered ON VMs (Enter to cancel)", (info['name'] for info in on_vms))
         
-        choice = self.input_prompt("VM number to power OFF")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_vms[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        info = self._pick(on_vms, "VM number to power OFF")
+        if info is None:
             return
         
-        info = NutanixClient.parse_vm_info(selected)
         vm_name = info['name']
         vm_uuid = info['uuid']
         
@@ -671,95 +1051,128 @@ class MigrationTool:
     
     # === Harvester Display Methods ===
     
+    def _running_names(self, vmis: list) -> frozenset:
+        """Running VM names for a VMI list, reused while the cached list is unchanged."""
+        source, names = self._running_names_cache
+        if source is not vmis:
+            names = frozenset(vmi_names(vmis))
+            self._running_names_cache = (vmis, names)
+        return names
+    
+    def _sorted_view(self, key: str, items: list, name_of, parse=None) -> list:
+        """
+        items (mapped through parse) sorted by lowercased name_of(record),
+        reused while the cached list is unchanged. Callers must not modify it.
+        """
+        source, records = self._sorted_views.get(key, (None, None))
+        if source is not items:
+            keyed = [((name_of(r) or '').lower(), i, r)
+                     for i, r in enumerate(map(parse, items) if parse else items)]
+            keyed.sort(key=itemgetter(0, 1))
+            records = [r for _, _, r in keyed]
+            self._sorted_views[key] = (items, records)
+        return records
+    
+    def _fetch_vms_and_vmis(self) -> tuple:
+        """Fetch all Harvester VMs and VMIs concurrently (independent API calls)."""
+        # The VM list is fetched on this thread while the pool fetches the VMIs
+        vmis_future = self._io_pool.submit(self._cached_list, 'harvester_vmis', self.harvester.list_all_vmi_metadata)
+        vms = self._cached_list('harvester_vms', self.harvester.list_all_vms)
+        return vms, vmis_future.result()
+    
     def list_harvester_vms(self):
         if not self.harvester and not self.connect_harvester():
             return
         
-        vms = self.harvester.list_all_vms()
+        vms = self._cached_list('harvester_vms', self.harvester.list_all_vms)
         
-        try:
-            vmis = self.harvester.list_all_vmis()
-            running_vms = {vmi.get('metadata', {}).get('name') for vmi in vmis}
-        except:
-            running_vms = set()
+        parsed = self._sorted_view('harvester_vms', vms, itemgetter('name'), self.harvester.parse_vm_info)
+        
+        # VM status already reflects the VMI; only older objects without it need the VMI list
+        running_vms = frozenset()
+        if any(i['status'] == 'Unknown' and i['ready'] is None for i in parsed):
+            try:
+                running_vms = self._running_names(
+                    self._cached_list('harvester_vmis', self.harvester.list_all_vmi_metadata))
+            except:
+                pass
         
-        print(f"\n{'='*100}")
-        print(f"{'VM Name':<35} {'Namespace':<15} {'Status':<12} {'CPU':<6} {'RAM':<10}")
-        print(f"{'='*100}")
+        rows = [
+            "\n" + self._rule(100),
+            f"{'VM Name':<35} {'Namespace':<15} {'Status':<12} {'CPU':<6} {'RAM':<10}",
+            self._rule(100),
+        ]
+        running_count = 0
         
-        for vm in sorted(vms, key=lambda x: x.get('metadata', {}).get('name', '').lower()):
-            info = HarvesterClient.parse_vm_info(vm)
+        for info in parsed:
             name = info['name'][:34] if info['name'] else 'N/A'
             namespace = info['namespace'][:14] if info['namespace'] else 'N/A'
             
             # Check actual running status
-            is_running = name in running_vms or info['status'] == 'Running'
+            is_running = info['status'] == 'Running' or info['ready'] is True or name in running_vms
             
             if is_running:
-                status_str = colored("Running", Colors.GREEN)
+                running_count += 1
+                status_str = VM_RUNNING_LABEL
             elif info['status'] and info['status'] != 'Unknown':
-                status_str = colored(info['status'], Colors.YELLOW)
+                status_str = vm_status_label(info['status'])
             else:
-                status_str = colored("Stopped", Colors.RED)
+                status_str = VM_STOPPED_LABEL
             
             cpu = info['cpu_cores'] or 'N/A'
             memory = info['memory'] or 'N/A'
             
-            print(f"{name:<35} {namespace:<15} {status_str:<21} {cpu:<6} {memory:<10}")
+            rows.append(HARVESTER_VM_ROW(name, namespace, status_str, cpu, memory))
         
-        print(f"{'='*100}")
-        print(f"Total: {len(vms)} VMs ({len(running_vms)} running)")
+        rows.append(self._rule(100))
+        rows.append(f"Total: {len(vms)} VMs ({running_count} running)")
+        self._emit_table(rows)
     
     def list_harvester_images(self):
         if not self.harvester and not self.connect_harvester():
             return
         
-        images = self.harvester.list_all_images()
+        images = self._cached_list('harvester_images', self.harvester.list_all_images)
         
-        print(f"\n{'='*80}")
-        print(f"{'Image Name':<40} {'Namespace':<20} {'Size':<15}")
-        print(f"{'='*80}")
+        rows = [
+            "\n" + self._rule(80),
+            f"{'Image Name':<40} {'Namespace':<20} {'Size':<15}",
+            self._rule(80),
+        ]
         
         for img in images:
-            name = img.get('metadata', {}).get('name', 'N/A')[:39]
-            ns = img.get('metadata', {}).get('namespace', 'N/A')[:19]
-            size = img.get('status', {}).get('size', 0)
-            print(f"{name:<40} {ns:<20} {format_size(size):<15}")
+            name, ns, _ = object_meta(img)
+            size = (img.get('status') or _EMPTY).get('size', 0)
+            rows.append(f"{name[:39]:<40} {ns[:19]:<20} {format_size(size):<15}")
         
-        print(f"{'='*80}")
-        print(f"Total: {len(images)} images")
+        rows.append(self._rule(80))
+        rows.append(f"Total: {len(images)} images")
+        self._emit_table(rows)
     
+    @invalidates('harvester_images')
     def delete_harvester_image(self):
         """Delete a Harvester image."""
         if not self.harvester and not self.connect_harvester():
             return
         
-        images = self.harvester.list_all_images()
+        images = self._cached_list('harvester_images', self.harvester.list_all_images)
         
         if not images:
             print(colored("❌ No images found", Colors.YELLOW))
             return
         
         print("\nAvailable images (Enter to cancel):")
-        sorted_images = sorted(images, key=lambda x: x.get('metadata', {}).get('name', '').lower())
+        sorted_images = by_name(images)
         for i, img in enumerate(sorted_images, 1):
-            name = img.get('metadata', {}).get('name', 'N/A')
-            ns = img.get('metadata', {}).get('namespace', 'N/A')
-            size = img.get('status', {}).get('size', 0)
+            name, ns, _ = object_meta(img)
+            size = (img.get('status') or _EMPTY).get('size', 0)
             print(f"  {i}. {name} ({ns}) - {format_size(size)}")
         
-        choice = self.input_prompt("Image number to delete")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_images[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(sorted_images, "Image number to delete")
+        if selected is None:
             return
         
-        image_name = selected.get('metadata', {}).get('name')
-        image_ns = selected.get('metadata', {}).get('namespace')
+        image_name, image_ns, _ = object_meta(selected)
         
         confirm = self.input_prompt(f"Delete '{image_name}' from {image_ns}? (yes to confirm)")
         if confirm.lower() == 'yes':
@@ -780,25 +1193,24 @@ class MigrationTool:
         if not self.harvester and not self.connect_harvester():
             return
         
-        networks = self.harvester.list_all_networks()
+        networks = self._cached_list('harvester_networks', self.harvester.list_all_networks)
         
-        print(colored(f"\n{'='*80}", Colors.BLUE))
-        print(colored("HARVESTER NETWORKS", Colors.BOLD))
-        print(colored(f"{'='*80}", Colors.BLUE))
-        print(f"{'Network Name':<30} {'Namespace':<20} {'Type':<12} {'VLAN':<8}")
-        print(f"{'-'*80}")
+        rows = [
+            colored("\n" + self._rule(80), Colors.BLUE),
+            colored("HARVESTER NETWORKS", Colors.BOLD),
+            colored(self._rule(80), Colors.BLUE),
+            f"{'Network Name':<30} {'Namespace':<20} {'Type':<12} {'VLAN':<8}",
+            self._rule(80, '-'),
+        ]
         
         # Group by namespace
         by_namespace = {}
         for net in networks:
-            ns = net.get('metadata', {}).get('namespace', 'N/A')
-            if ns not in by_namespace:
-                by_namespace[ns] = []
-            by_namespace[ns].append(net)
+            name, ns, _ = object_meta(net)
+            by_namespace.setdefault(ns, []).append((name, net))
         
         for ns in sorted(by_namespace.keys()):
-            for net in sorted(by_namespace[ns], key=lambda x: x.get('metadata', {}).get('name', '')):
-                name = net.get('metadata', {}).get('name', 'N/A')
+            for name, net in sorted(by_namespace[ns], key=itemgetter(0)):
                 
                 # Parse config to get network type and VLAN
                 net_type = "unknown"
@@ -821,86 +1233,87 @@ class MigrationTool:
                 except:
                     pass
                 
-                print(f"{name:<30} {ns:<20} {net_type:<12} {vlan_id:<8}")
+                rows.append(f"{name:<30} {ns:<20} {net_type:<12} {vlan_id:<8}")
         
-        print(colored(f"{'='*80}", Colors.BLUE))
-        print(f"Total: {len(networks)} network(s) in {len(by_namespace)} namespace(s)")
+        rows.append(colored(self._rule(80), Colors.BLUE))
+        rows.append(f"Total: {len(networks)} network(s) in {len(by_namespace)} namespace(s)")
+        self._emit_table(rows)
     
     def list_harvester_storage(self):
         if not self.harvester and not self.connect_harvester():
             return
         
-        scs = self.harvester.list_storage_classes()
+        scs = self._cached_list('harvester_storage', self.harvester.list_storage_classes)
         
-        print(f"\n{'='*70}")
-        print(f"{'Storage Class':<40} {'Provisioner':<30}")
-        print(f"{'='*70}")
+        rows = [
+            "\n" + self._rule(70),
+            f"{'Storage Class':<40} {'Provisioner':<30}",
+            self._rule(70),
+        ]
         
         for sc in scs:
-            name = sc.get('metadata', {}).get('name', 'N/A')
+            name, _, annotations = object_meta(sc)
             provisioner = sc.get('provisioner', 'N/A')
-            annotations = sc.get('metadata', {}).get('annotations', {})
             default = "(default)" if annotations.get('storageclass.kubernetes.io/is-default-class') == 'true' else ""
-            print(f"{name:<40} {provisioner:<30} {default}")
+            rows.append(f"{name:<40} {provisioner:<30} {default}")
         
-        print(f"{'='*70}")
+        rows.append(self._rule(70))
+        self._emit_table(rows)
     
     def list_harvester_volumes(self):
         """List all volumes (PVCs) in Harvester."""
         if not self.harvester and not self.connect_harvester():
             return
         
-        pvcs = self.harvester.list_all_pvcs()
+        pvcs = self._cached_list('harvester_pvcs', self.harvester.list_all_pvcs)
         
         # Separate scratch volumes
-        scratch_pvcs = [p for p in pvcs if 'scratch' in p.get('metadata', {}).get('name', '').lower() 
-                        or p.get('metadata', {}).get('name', '').startswith('prime-')]
-        regular_pvcs = [p for p in pvcs if p not in scratch_pvcs]
+        regular_pvcs, scratch_pvcs = split_scratch_pvcs(pvcs)
         
-        print(f"\n{'='*100}")
-        print(f"{'Volume Name':<50} {'Namespace':<18} {'Size':<10} {'Status':<10} {'Type'}")
-        print(f"{'='*100}")
+        rows = [
+            "\n" + self._rule(100),
+            f"{'Volume Name':<50} {'Namespace':<18} {'Size':<10} {'Status':<10} {'Type'}",
+            self._rule(100),
+        ]
         
-        for pvc in sorted(regular_pvcs, key=lambda x: x.get('metadata', {}).get('name', '').lower()):
-            name = pvc.get('metadata', {}).get('name', 'N/A')[:49]
-            ns = pvc.get('metadata', {}).get('namespace', 'N/A')[:17]
+        for pvc in regular_pvcs:
+            name, ns, annotations = object_meta(pvc)
+            name, ns = name[:49], ns[:17]
             size = pvc.get('spec', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A')
             status = pvc.get('status', {}).get('phase', 'N/A')
             
             # Check if it has image dependency
-            annotations = pvc.get('metadata', {}).get('annotations', {})
             if 'harvesterhci.io/imageId' in annotations:
-                vol_type = colored("image-backed", Colors.YELLOW)
+                vol_type = VOLUME_IMAGE_BACKED
             else:
-                vol_type = colored("independent", Colors.GREEN)
+                vol_type = VOLUME_INDEPENDENT
             
-            print(f"{name:<50} {ns:<18} {size:<10} {status:<10} {vol_type}")
+            rows.append(f"{name:<50} {ns:<18} {size:<10} {status:<10} {vol_type}")
         
         if scratch_pvcs:
-            print(f"\n{colored('Scratch/Temporary volumes (CDI):', Colors.YELLOW)}")
+            rows.append(f"\n{colored('Scratch/Temporary volumes (CDI):', Colors.YELLOW)}")
             for pvc in scratch_pvcs:
-                name = pvc.get('metadata', {}).get('name', 'N/A')[:49]
-                ns = pvc.get('metadata', {}).get('namespace', 'N/A')[:17]
-                print(f"  {name} ({ns})")
+                name, ns, _ = object_meta(pvc)
+                rows.append(f"  {name[:49]} ({ns[:17]})")
         
-        print(f"{'='*100}")
-        print(f"Total: {len(regular_pvcs)} volumes" + (f", {len(scratch_pvcs)} scratch" if scratch_pvcs else ""))
+        rows.append(self._rule(100))
+        rows.append(f"Total: {len(regular_pvcs)} volumes" + (f", {len(scratch_pvcs)} scratch" if scratch_pvcs else ""))
+        self._emit_table(rows)
     
+    @invalidates('harvester_pvcs')
     def delete_harvester_volume(self):
         """Delete a Harvester volume (PVC) or DataVolume."""
         if not self.harvester and not self.connect_harvester():
             return
         
-        pvcs = self.harvester.list_all_pvcs()
+        pvcs = self._cached_list('harvester_pvcs', self.harvester.list_all_pvcs)
         
         if not pvcs:
             print(colored("❌ No volumes found", Colors.YELLOW))
             return
         
         # Separate scratch volumes and regular volumes
-        scratch_pvcs = [p for p in pvcs if 'scratch' in p.get('metadata', {}).get('name', '').lower() 
-                        or p.get('metadata', {}).get('name', '').startswith('prime-')]
-        regular_pvcs = [p for p in pvcs if p not in scratch_pvcs]
+        regular_pvcs, scratch_pvcs = split_scratch_pvcs(pvcs)
         
         print(colored("\n📦 Volume Management", Colors.BOLD))
         print(f"   Regular volumes: {len(regular_pvcs)}")
@@ -921,13 +1334,12 @@ class MigrationTool:
                 return
         
         print("\nAvailable volumes (Enter to cancel):")
-        sorted_pvcs = sorted(regular_pvcs, key=lambda x: x.get('metadata', {}).get('name', '').lower())
-        for i, pvc in enumerate(sorted_pvcs, 1):
+        for i, pvc in enumerate(regular_pvcs, 1):
             name = pvc.get('metadata', {}).get('name', 'N/A')
             ns = pvc.get('metadata', {}).get('namespace', 'N/A')
             size = pvc.get('spec', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A')
             phase = pvc.get('status', {}).get('phase', '')
-            status = colored("Bound", Colors.GREEN) if phase == 'Bound' else colored(phase, Colors.YELLOW)
+            status = PVC_BOUND_LABEL if phase == 'Bound' else colored(phase, Colors.YELLOW)
             print(f"  {i}. {name} ({ns}) - {size} - {status}")
         
         choice = self.input_prompt("Volume number to delete (or 'all-scratch' to clean scratch)")
@@ -945,11 +1357,8 @@ class MigrationTool:
                     pass
             return
         
-        try:
-            idx = int(choice) - 1
-            selected = sorted_pvcs[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._item_at(regular_pvcs, choice)
+        if selected is None:
             return
         
         vol_name = selected.get('metadata', {}).get('name')
@@ -983,6 +1392,7 @@ class MigrationTool:
         else:
             print("Cancelled")
     
+    @invalidates('harvester_vms', 'harvester_vmis', 'harvester_pvcs')
     def dissociate_vm_from_image(self):
         """Clone VM volume to dissociate it from the source image."""
         if not self.harvester and not self.connect_harvester():
@@ -992,13 +1402,11 @@ class MigrationTool:
         print("   This will clone the VM's volume(s) to remove the backing image dependency.")
         print("   After this, you can delete the Harvester image.\n")
         
-        # List VMs
-        vms = self.harvester.list_all_vms()
+        # List VMs and VMIs (for running status)
+        vms, vmis = self._fetch_vms_and_vmis()
         stopped_vms = []
         
-        # Check VMIs for running status
-        vmis = self.harvester.list_all_vmis()
-        running_names = {vmi.get('metadata', {}).get('name') for vmi in vmis}
+        running_names = self._running_names(vmis)
         
         for vm in vms:
             vm_name = vm.get('metadata', {}).get('name')
@@ -1015,14 +1423,8 @@ class MigrationTool:
             ns = vm.get('metadata', {}).get('namespace', 'N/A')
             print(f"  {i}. {name} ({ns})")
         
-        choice = self.input_prompt("VM number")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected_vm = stopped_vms[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected_vm = self._pick(stopped_vms, "VM number")
+        if selected_vm is None:
             return
         
         vm_name = selected_vm.get('metadata', {}).get('name')
@@ -1059,53 +1461,47 @@ class MigrationTool:
             print("Cancelled")
             return
         
-        # Clone each volume
+        # Clone each volume (independent API calls, issued concurrently)
         cloned_volumes = []
+        clone_futures = []
         for vol in volumes_to_clone:
             old_name = vol['name']
             new_name = f"{old_name}-standalone"
-            
             print(f"\n🔄 Cloning {old_name} → {new_name}...")
+            clone_futures.append((old_name, new_name,
+                                  self._io_pool.submit(self.harvester.clone_pvc, old_name, new_name, vm_ns)))
+        
+        clone_failed = False
+        for old_name, new_name, future in clone_futures:
             try:
-                self.harvester.clone_pvc(old_name, new_name, vm_ns)
+                future.result()
                 print(colored(f"   ✅ Clone created: {new_name}", Colors.GREEN))
                 cloned_volumes.append({
                     'old': old_name,
                     'new': new_name
                 })
             except Exception as e:
-                print(colored(f"   ❌ Clone failed: {e}", Colors.RED))
-                return
+                print(colored(f"   ❌ Clone failed ({new_name}): {e}", Colors.RED))
+                clone_failed = True
+        if clone_failed:
+            return
         
-        # Wait for clones to be ready
+        # Wait for clones to be ready (watch, returns as soon as all are Bound)
         print("\n⏳ Waiting for clones to be ready...")
-        import time
-        for _ in range(60):  # Wait up to 60 seconds
-            all_ready = True
-            for vol in cloned_volumes:
-                try:
-                    pvc = self.harvester.get_pvc(vol['new'], vm_ns)
-                    phase = pvc.get('status', {}).get('phase', '')
-                    if phase != 'Bound':
-                        all_ready = False
-                        break
-                except:
-                    all_ready = False
-                    break
-            
-            if all_ready:
-                print(colored("   ✅ All clones ready!", Colors.GREEN))
-                break
-            time.sleep(2)
-            print("   .", end='', flush=True)
+        try:
+            all_ready = self.harvester.watch_pvcs_bound([vol['new'] for vol in cloned_volumes], vm_ns, timeout=120)
+        except Exception:
+            all_ready = False
+        if all_ready:
+            print(colored("   ✅ All clones ready!", Colors.GREEN))
         else:
             print(colored("\n   ⚠️  Timeout waiting for clones. Check Harvester UI.", Colors.YELLOW))
         
         # Update VM to use cloned volumes
         print("\n🔧 Updating VM to use cloned volumes...")
         try:
-            for vol in cloned_volumes:
-                self.harvester.update_vm_volume(vm_name, vol['old'], vol['new'], vm_ns)
+            # One GET+PUT for all volumes; per-volume updates of the same VM would race
+            self.harvester.update_vm_volumes(vm_name, {vol['old']: vol['new'] for vol in cloned_volumes}, vm_ns)
             print(colored(f"   ✅ VM updated to use standalone volumes", Colors.GREEN))
         except Exception as e:
             print(colored(f"   ❌ Error updating VM: {e}", Colors.RED))
@@ -1115,24 +1511,24 @@ class MigrationTool:
         # Offer to delete old volumes
         delete_old = self.input_prompt("\nDelete old image-linked volumes? (y/n)")
         if delete_old.lower() == 'y':
-            for vol in cloned_volumes:
-                try:
-                    self.harvester.delete_pvc(vol['old'], vm_ns)
-                    print(colored(f"   ✅ Deleted: {vol['old']}", Colors.GREEN))
-                except Exception as e:
-                    print(colored(f"   ⚠️  Could not delete {vol['old']}: {e}", Colors.YELLOW))
+            results = self.harvester.delete_pvcs([vol['old'] for vol in cloned_volumes], vm_ns)
+            for old_name, error in results.items():
+                if error is None:
+                    print(colored(f"   ✅ Deleted: {old_name}", Colors.GREEN))
+                else:
+                    print(colored(f"   ⚠️  Could not delete {old_name}: {error}", Colors.YELLOW))
         
         print(colored("\n✅ VM is now dissociated from images!", Colors.GREEN))
         print(colored("   You can now delete the Harvester images (Menu → Delete image)", Colors.CYAN))
     
+    @invalidates('harvester_vms', 'harvester_vmis')
     def power_on_harvester_vm(self):
         """Power on a Harvester VM."""
         if not self.harvester and not self.connect_harvester():
             return
         
-        vms = self.harvester.list_all_vms()
-        vmis = self.harvester.list_all_vmis()
-        running_names = {vmi.get('metadata', {}).get('name') for vmi in vmis}
+        vms, vmis = self._fetch_vms_and_vmis()
+        running_names = self._running_names(vmis)
         
         # Filter stopped VMs (not in VMIs list)
         stopped_vms = [vm for vm in vms if vm.get('metadata', {}).get('name') not in running_names]
@@ -1148,14 +1544,8 @@ class MigrationTool:
             ns = vm.get('metadata', {}).get('namespace', 'N/A')
             print(f"  {i}. {name} ({ns})")
         
-        choice = self.input_prompt("VM number to start")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_vms[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(sorted_vms, "VM number to start")
+        if selected is None:
             return
         
         vm_name = selected.get('metadata', {}).get('name')
@@ -1172,14 +1562,14 @@ class MigrationTool:
         else:
             print("Cancelled")
     
+    @invalidates('harvester_vms', 'harvester_vmis')
     def power_off_harvester_vm(self):
         """Power off a Harvester VM."""
         if not self.harvester and not self.connect_harvester():
             return
         
-        vms = self.harvester.list_all_vms()
-        vmis = self.harvester.list_all_vmis()
-        running_names = {vmi.get('metadata', {}).get('name') for vmi in vmis}
+        vms, vmis = self._fetch_vms_and_vmis()
+        running_names = self._running_names(vmis)
         
         # Filter running VMs (present in VMIs list)
         running_vms = [vm for vm in vms if vm.get('metadata', {}).get('name') in running_names]
@@ -1195,14 +1585,8 @@ class MigrationTool:
             ns = vm.get('metadata', {}).get('namespace', 'N/A')
             print(f"  {i}. {name} ({ns})")
         
-        choice = self.input_prompt("VM number to stop")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_vms[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(sorted_vms, "VM number to stop")
+        if selected is None:
             return
         
         vm_name = selected.get('metadata', {}).get('name')
@@ -1219,41 +1603,37 @@ class MigrationTool:
         else:
             print("Cancelled")
     
+    @invalidates('harvester_vms', 'harvester_vmis', 'harvester_pvcs')
     def delete_harvester_vm(self):
         """Delete a Harvester VM."""
         if not self.harvester and not self.connect_harvester():
             return
         
-        vms = self.harvester.list_all_vms()
-        vmis = self.harvester.list_all_vmis()
-        running_names = {vmi.get('metadata', {}).get('name') for vmi in vmis}
+        vms, vmis = self._fetch_vms_and_vmis()
+        running_names = self._running_names(vmis)
         
         if not vms:
             print(colored("❌ No VMs found", Colors.YELLOW))
             return
         
+        # One pass over the VM objects: (sort key, name, namespace, running)
+        rows = []
+        for vm in vms:
+            metadata = vm.get('metadata', _EMPTY)
+            name = metadata.get('name', 'N/A')
+            rows.append((name.lower(), name, metadata.get('namespace', 'N/A'), name in running_names))
+        rows.sort(key=itemgetter(0))
+        
         print("\nAll VMs (Enter to cancel):")
-        sorted_vms = sorted(vms, key=lambda x: x.get('metadata', {}).get('name', '').lower())
-        for i, vm in enumerate(sorted_vms, 1):
-            name = vm.get('metadata', {}).get('name', 'N/A')
-            ns = vm.get('metadata', {}).get('namespace', 'N/A')
-            is_running = name in running_names
+        for i, (_, name, ns, is_running) in enumerate(rows, 1):
             status = "🟢 Running" if is_running else "🔴 Stopped"
             print(f"  {i}. {status} {name} ({ns})")
         
-        choice = self.input_prompt("VM number to delete")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected = sorted_vms[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(rows, "VM number to delete")
+        if selected is None:
             return
         
-        vm_name = selected.get('metadata', {}).get('name')
-        vm_ns = selected.get('metadata', {}).get('namespace')
-        is_running = vm_name in running_names
+        _, vm_name, vm_ns, is_running = selected
         
         if is_running:
             print(colored("⚠️  VM is running! Stop it first.", Colors.YELLOW))
@@ -1287,7 +1667,7 @@ class MigrationTool:
                 print(f"   Total size: {format_size(result['total_size'])}")
         else:
             print(colored("❌ Not mounted", Colors.RED))
-            ceph_ip = self.config.get('ceph', {}).get('mon_ip', '10.16.16.140')
+            ceph_ip = self.ceph_cfg.get('mon_ip', '10.16.16.140')
             print(f"   Mount command:")
             print(f"   mount -t ceph {ceph_ip}:6789:/volumes/_nogroup/migration-staging {result['path']} -o name=admin,secretfile=/etc/ceph/admin.secret")
     
@@ -1305,9 +1685,11 @@ class MigrationTool:
             print(colored("\n❌ No files in staging", Colors.YELLOW))
             return
         
-        print(f"\n{'='*90}")
-        print(f"{'#':<4} {'Filename':<40} {'Size':<15} {'Modified':<20} {'Type'}")
-        print(f"{'='*90}")
+        rows = [
+            "\n" + self._rule(90),
+            f"{'#':<4} {'Filename':<40} {'Size':<15} {'Modified':<20} {'Type'}",
+            self._rule(90),
+        ]
         
         total_size = 0
         for idx, f in enumerate(files, 1):
@@ -1317,23 +1699,14 @@ class MigrationTool:
             mtime = format_timestamp(f['mtime'])
             
             # Detect type by extension
-            if f['name'].endswith('.raw'):
-                ftype = colored("RAW", Colors.YELLOW)
-            elif f['name'].endswith('.qcow2'):
-                ftype = colored("QCOW2", Colors.GREEN)
-            elif f['name'].endswith('.vmdk'):
-                ftype = colored("VMDK", Colors.BLUE)
-            elif f['name'].endswith('.vhd') or f['name'].endswith('.vhdx'):
-                ftype = colored("VHD", Colors.BLUE)
-            elif f['name'].endswith('.iso'):
-                ftype = colored("ISO", Colors.CYAN)
-            else:
-                ftype = "Other"
+            _, dot, ext = f['name'].rpartition('.')
+            ftype = DISK_TYPE_LABELS.get(dot + ext.lower(), "Other")
             
-            print(f"{idx:<4} {name:<40} {size:<15} {mtime:<20} {ftype}")
+            rows.append(STAGING_FILE_ROW(idx, name, size, mtime, ftype))
         
-        print(f"{'='*90}")
-        print(f"Total: {len(files)} files, {format_size(total_size)}")
+        rows.append(self._rule(90))
+        rows.append(f"Total: {len(files)} files, {format_size(total_size)}")
+        self._emit_table(rows)
     
     def show_disk_info(self):
         """Show detailed info about a disk image."""
@@ -1349,16 +1722,10 @@ class MigrationTool:
             return
         
         # Show files and prompt for selection
-        print("\nAvailable files:")
-        for idx, f in enumerate(files, 1):
-            print(f"  {idx}. {f['name']} ({format_size(f['size'])})")
+        self._emit_file_menu("Available files", files)
         
-        choice = self.input_prompt("File number")
-        try:
-            idx = int(choice) - 1
-            selected = files[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(files, "File number")
+        if selected is None:
             return
         
         # Get detailed info
@@ -1398,10 +1765,11 @@ class MigrationTool:
         size = os.path.getsize(raw_path)
         print(f"\n🔄 Converting: {filename} ({format_size(size)})")
         
+        @throttled
         def progress(pct):
             print(f"\r   Progress: {pct:.1f}%", end='', flush=True)
         
-        result = self.actions.convert_raw_to_qcow2(raw_path, compress=True, progress_callback=progress)
+        result = self.actions.convert_raw_to_qcow2(raw_path, compress=self.transfer_cfg.get('compress', True), progress_callback=progress)
         print()  # New line after progress
         
         if result['success']:
@@ -1424,21 +1792,20 @@ class MigrationTool:
             print(colored("❌ No .raw files found in staging", Colors.RED))
             return
         
-        print("\nAvailable RAW files:")
-        for i, f in enumerate(raw_files, 1):
-            print(f"  {i}. {f['name']} ({format_size(f['size'])})")
+        self._emit_file_menu("Available RAW files", raw_files)
         
         choice = self.input_prompt("File number to convert (or 'all')")
         
         if choice.lower() == 'all':
+            if len(raw_files) > 1:
+                self._convert_files_parallel(raw_files)
+                return
             files_to_convert = raw_files
         else:
-            try:
-                idx = int(choice) - 1
-                files_to_convert = [raw_files[idx]]
-            except:
-                print(colored("Invalid choice", Colors.RED))
+            selected = self._item_at(raw_files, choice)
+            if selected is None:
                 return
+            files_to_convert = [selected]
         
         for f in files_to_convert:
             print(f"\n🔄 Converting: {f['name']}")
@@ -1447,10 +1814,11 @@ class MigrationTool:
             if confirm.lower() != 'y':
                 continue
             
+            @throttled
             def progress(pct):
                 print(f"\r   Progress: {pct:.1f}%", end='', flush=True)
             
-            result = self.actions.convert_raw_to_qcow2(f['path'], compress=True, progress_callback=progress)
+            result = self.actions.convert_raw_to_qcow2(f['path'], compress=self.transfer_cfg.get('compress', True), progress_callback=progress)
             print()  # New line after progress
             
             if result['success']:
@@ -1462,6 +1830,40 @@ class MigrationTool:
             else:
                 print(colored(f"❌ Error: {result['error']}", Colors.RED))
     
+    def _convert_files_parallel(self, raw_files: list, max_parallel: int = 2):
+        """Convert several RAW files at once, showing one combined progress line."""
+        confirm = self.input_prompt(f"Convert {len(raw_files)} files, {max_parallel} at a time? (y/n)")
+        if confirm.lower() != 'y':
+            return
+        
+        percents = {f['name']: 0.0 for f in raw_files}
+        
+        @throttled
+        def draw(_pct):
+            line = " | ".join(f"{name[:20]} {pct:.0f}%" for name, pct in percents.items() if 0 < pct < 100)
+            print(f"\r   Progress: {line:<66}", end='', flush=True)
+        
+        def convert(f):
+            def progress(pct):
+                percents[f['name']] = pct
+                with self._print_lock:
+                    draw(min(pct, 99.9))
+            return f, self.actions.convert_raw_to_qcow2(f['path'], compress=self.transfer_cfg.get('compress', True), progress_callback=progress)
+        
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(raw_files))) as pool:
+            futures = [pool.submit(convert, f) for f in raw_files]
+            for future in as_completed(futures):
+                f, result = future.result()
+                percents[f['name']] = 100.0
+                with self._print_lock:
+                    print("\r" + " " * 80 + "\r", end='')
+                    if result['success']:
+                        print(colored(f"✅ {f['name']}: {format_size(result['size_before'])} → {format_size(result['size_after'])} ({result['reduction_pct']:.1f}% reduction)", Colors.GREEN))
+                        if self.actions.delete_file(f['path']):
+                            print(colored("   RAW file deleted", Colors.GREEN))
+                    else:
+                        print(colored(f"❌ {f['name']}: {result['error']}", Colors.RED))
+    
     def delete_staging_file(self):
         """Delete a file from staging."""
         self.init_actions()
@@ -1475,16 +1877,10 @@ class MigrationTool:
             print(colored("❌ No files in staging", Colors.YELLOW))
             return
         
-        print("\nFiles in staging:")
-        for idx, f in enumerate(files, 1):
-            print(f"  {idx}. {f['name']} ({format_size(f['size'])})")
+        self._emit_file_menu("Files in staging", files)
         
-        choice = self.input_prompt("File number to delete")
-        try:
-            idx = int(choice) - 1
-            selected = files[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected = self._pick(files, "File number to delete")
+        if selected is None:
             return
         
         confirm = self.input_prompt(f"Delete '{selected['name']}'? (yes to confirm)")
@@ -1496,6 +1892,7 @@ class MigrationTool:
         else:
             print("Cancelled")
     
+    @invalidates('nutanix_images')
     def export_vm(self):
         """Export VM disks from Nutanix to staging."""
         if not self._selected_vm:
@@ -1512,7 +1909,7 @@ class MigrationTool:
                 return
         
         print(colored(f"\n📤 Export VM: {self._selected_vm}", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         # Ask for transfer method
         print(colored("\nTransfer method:", Colors.BOLD))
@@ -1543,11 +1940,10 @@ class MigrationTool:
             if proceed.lower() != 'y':
                 return
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
         vm_name_clean = self._selected_vm.lower().replace(' ', '-').replace('/', '-')
         
         # Create VM-specific migrations folder
-        vm_migration_dir = os.path.join(staging_dir, 'migrations', vm_name_clean)
+        vm_migration_dir = os.path.join(self.migrations_dir, vm_name_clean)
         os.makedirs(vm_migration_dir, exist_ok=True)
         print(colored(f"   📁 Migration folder: {vm_migration_dir}", Colors.CYAN))
         
@@ -1654,7 +2050,7 @@ class MigrationTool:
     def _export_vm_api(self):
         """Export VM disks via API (original method)."""
         print(colored(f"\n📤 API Export: {self._selected_vm}", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         # Get VM details
         vm = self.nutanix.get_vm_by_name(self._selected_vm)
@@ -1662,7 +2058,7 @@ class MigrationTool:
             print(colored(f"❌ VM not found: {self._selected_vm}", Colors.RED))
             return
         
-        vm_info = NutanixClient.parse_vm_info(vm)
+        vm_info = self.nutanix.parse_vm_info(vm)
         vm_uuid = vm.get('metadata', {}).get('uuid')
         
         # Check power state
@@ -1699,11 +2095,10 @@ class MigrationTool:
             disks_to_export = disks
         
         # Staging directory
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
         vm_name_clean = self._selected_vm.lower().replace(' ', '-').replace('/', '-')
         
         # Create VM-specific migrations folder
-        vm_migration_dir = os.path.join(staging_dir, 'migrations', vm_name_clean)
+        vm_migration_dir = os.path.join(self.migrations_dir, vm_name_clean)
         os.makedirs(vm_migration_dir, exist_ok=True)
         
         print(colored(f"\n🚀 Starting export to {vm_migration_dir}", Colors.CYAN))
@@ -1741,7 +2136,6 @@ class MigrationTool:
                     # Delete and recreate
                     print("      Deleting existing image...")
                     self.nutanix.delete_image(existing.get('metadata', {}).get('uuid'))
-                    import time
                     time.sleep(5)
             
             # Create image from disk
@@ -1865,17 +2259,23 @@ class MigrationTool:
         # This is essentially export_vm but explicitly named for the workflow
         self.export_vm()
     
+    @invalidates('harvester_pvcs')
     def create_pvcs_for_vm(self):
         """Create PVCs in Harvester for the selected VM's disks (legacy - use import_disks_to_pvcs instead)."""
         print(colored("\n📦 Create PVCs for VM Disks", Colors.BOLD))
-        print(colored("=" * 60, Colors.BLUE))
+        print(EQ_RULE_60)
         
         if not self.harvester and not self.connect_harvester():
             return
         
+        # Namespace and storage class pickers come after the disk probing below
+        self.prefetch_lists([
+            ('harvester_namespaces', self.harvester.list_user_namespaces),
+            ('harvester_storage', self.harvester.list_storage_classes),
+        ])
+        
         vm_name = self._selected_vm.lower().replace(' ', '-')
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        vm_dir = os.path.join(staging_dir, 'migrations', vm_name)
+        vm_dir = os.path.join(self.migrations_dir, vm_name)
         
         # Find QCOW2 files
         qcow2_files = []
@@ -1891,7 +2291,6 @@ class MigrationTool:
         
         print(f"\n📁 Found {len(qcow2_files)} disk(s) for {self._selected_vm}:")
         
-        import subprocess
         import math
         
         disk_info = []
@@ -1918,7 +2317,7 @@ class MigrationTool:
             return
         
         # Get namespace - numbered list selection
-        namespaces = self.harvester.list_namespaces()
+        namespaces = self._cached_list('harvester_namespaces', self.harvester.list_user_namespaces)
         excluded_ns = ['kube-system', 'kube-public', 'kube-node-lease', 
                        'cattle-system', 'cattle-fleet-system', 'cattle-impersonation-system',
                        'harvester-system', 'longhorn-system', 'fleet-local']
@@ -1937,18 +2336,11 @@ class MigrationTool:
                 print(f"     {i}. {ns}")
         
         ns_choice = self.input_prompt(f"   Select namespace [{default_ns_idx}]") or str(default_ns_idx)
-        try:
-            ns_idx = int(ns_choice) - 1
-            if 0 <= ns_idx < len(ns_names):
-                namespace = ns_names[ns_idx]
-            else:
-                namespace = "default"
-        except ValueError:
-            namespace = "default"
+        namespace = self._item_or(ns_names, ns_choice, "default")
         print(colored(f"   → Using: {namespace}", Colors.CYAN))
         
         # Get storage classes - numbered list
-        scs = self.harvester.list_storage_classes()
+        scs = self._cached_list('harvester_storage', self.harvester.list_storage_classes)
         sc_names = sorted([sc.get('metadata', {}).get('name', '') for sc in scs])
         
         print(colored("\n   Available storage classes:", Colors.BOLD))
@@ -1967,14 +2359,8 @@ class MigrationTool:
         print()
         for disk in disk_info:
             sc_choice = self.input_prompt(f"   Storage class for {disk['name']} ({disk['size_gi']} GiB) [{default_sc_idx}]") or str(default_sc_idx)
-            try:
-                sc_idx = int(sc_choice) - 1
-                if 0 <= sc_idx < len(sc_names):
-                    disk['storage_class'] = sc_names[sc_idx]
-                else:
-                    disk['storage_class'] = sc_names[default_sc_idx - 1] if default_sc_idx > 0 else sc_names[0]
-            except ValueError:
-                disk['storage_class'] = sc_names[default_sc_idx - 1] if default_sc_idx > 0 else sc_names[0]
+            default_sc = sc_names[default_sc_idx - 1] if default_sc_idx > 0 else sc_names[0]
+            disk['storage_class'] = self._item_or(sc_names, sc_choice, default_sc)
         
         # Summary before creation
         print(colored("\n   Summary:", Colors.BOLD))
@@ -1986,35 +2372,36 @@ class MigrationTool:
         if confirm.lower() != 'y':
             return
         
+        print(colored(f"\n   Creating {len(disk_info)} PVC(s)...", Colors.CYAN))
+        results = self.harvester.create_empty_block_pvcs(disk_info, namespace)
         for disk in disk_info:
-            print(colored(f"\n   Creating PVC: {disk['name']} ({disk['size_gi']} GiB) on {disk['storage_class']}...", Colors.CYAN))
-            try:
-                self.harvester.create_empty_block_pvc(
-                    name=disk['name'],
-                    size_gi=disk['size_gi'],
-                    storage_class=disk['storage_class'],
-                    namespace=namespace
-                )
-                print(colored(f"   ✅ PVC created: {disk['name']}", Colors.GREEN))
-            except Exception as e:
-                if "already exists" in str(e):
-                    print(colored(f"   ⚠️  PVC already exists: {disk['name']}", Colors.YELLOW))
-                else:
-                    print(colored(f"   ❌ Error: {e}", Colors.RED))
+            e = results[disk['name']]
+            if e is None:
+                print(colored(f"   ✅ PVC created: {disk['name']} ({disk['size_gi']} GiB) on {disk['storage_class']}", Colors.GREEN))
+            elif "already exists" in str(e):
+                print(colored(f"   ⚠️  PVC already exists: {disk['name']}", Colors.YELLOW))
+            else:
+                print(colored(f"   ❌ Error: {e}", Colors.RED))
         
         print(colored(f"\n✅ PVCs created.", Colors.GREEN))
     
+    @invalidates('harvester_pvcs')
     def import_disks_to_pvcs(self):
         """Import disk data from staging to Harvester PVCs."""
         print(colored("\n📥 Import Disks to Harvester", Colors.BOLD))
-        print(colored("=" * 60, Colors.BLUE))
+        print(EQ_RULE_60)
         
         if not self.harvester and not self.connect_harvester():
             return
         
+        # Namespace and storage class pickers come after the disk probing below
+        self.prefetch_lists([
+            ('harvester_namespaces', self.harvester.list_user_namespaces),
+            ('harvester_storage', self.harvester.list_storage_classes),
+        ])
+        
         vm_name = self._selected_vm.lower().replace(' ', '-')
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        vm_dir = os.path.join(staging_dir, 'migrations', vm_name)
+        vm_dir = os.path.join(self.migrations_dir, vm_name)
         
         # Find QCOW2 files
         qcow2_files = []
@@ -2028,7 +2415,6 @@ class MigrationTool:
             return
         
         # Get disk sizes
-        import subprocess
         import math
         disk_info = []
         print(f"\n📁 Found {len(qcow2_files)} disk(s) for {self._selected_vm}:")
@@ -2078,7 +2464,7 @@ class MigrationTool:
                 return
         
         # Get namespace - numbered list selection
-        namespaces = self.harvester.list_namespaces()
+        namespaces = self._cached_list('harvester_namespaces', self.harvester.list_user_namespaces)
         excluded_ns = ['kube-system', 'kube-public', 'kube-node-lease', 
                        'cattle-system', 'cattle-fleet-system', 'cattle-impersonation-system',
                        'harvester-system', 'longhorn-system', 'fleet-local']
@@ -2097,18 +2483,11 @@ class MigrationTool:
                 print(f"     {i}. {ns}")
         
         ns_choice = self.input_prompt(f"   Select namespace [{default_ns_idx}]") or str(default_ns_idx)
-        try:
-            ns_idx = int(ns_choice) - 1
-            if 0 <= ns_idx < len(ns_names):
-                namespace = ns_names[ns_idx]
-            else:
-                namespace = "default"
-        except ValueError:
-            namespace = "default"
+        namespace = self._item_or(ns_names, ns_choice, "default")
         print(colored(f"   → Using: {namespace}", Colors.CYAN))
         
         # Get storage classes - numbered list
-        scs = self.harvester.list_storage_classes()
+        scs = self._cached_list('harvester_storage', self.harvester.list_storage_classes)
         sc_names = sorted([sc.get('metadata', {}).get('name', '') for sc in scs])
         
         print(colored("\n   Available storage classes:", Colors.BOLD))
@@ -2127,14 +2506,8 @@ class MigrationTool:
         print()
         for disk in disks_to_import:
             sc_choice = self.input_prompt(f"   Storage class for disk{disk['index']} ({disk['size_gi']} GiB) [{default_sc_idx}]") or str(default_sc_idx)
-            try:
-                sc_idx = int(sc_choice) - 1
-                if 0 <= sc_idx < len(sc_names):
-                    disk['storage_class'] = sc_names[sc_idx]
-                else:
-                    disk['storage_class'] = sc_names[default_sc_idx - 1] if default_sc_idx > 0 else sc_names[0]
-            except ValueError:
-                disk['storage_class'] = sc_names[default_sc_idx - 1] if default_sc_idx > 0 else sc_names[0]
+            default_sc = sc_names[default_sc_idx - 1] if default_sc_idx > 0 else sc_names[0]
+            disk['storage_class'] = self._item_or(sc_names, sc_choice, default_sc)
         
         # Summary
         print(colored("\n   Summary:", Colors.BOLD))
@@ -2168,61 +2541,54 @@ class MigrationTool:
         elif not import_all:
             print(colored(f"\n   ℹ️  Single disk imported. Run 'all' to mark step complete.", Colors.YELLOW))
 
+    @invalidates('harvester_images', 'harvester_pvcs')
     def import_to_harvester(self):
         """Create independent volume in Harvester using CDI DataVolume."""
         print(colored("\n📦 Create Volume in Harvester (DataVolume)", Colors.BOLD))
-        print(colored("=" * 60, Colors.BLUE))
+        print(EQ_RULE_60)
         print(colored("Creates a PVC with NO backing image dependency.", Colors.GREEN))
         print(colored("The volume is 100% independent.", Colors.GREEN))
-        print(colored("=" * 60, Colors.BLUE))
+        print(EQ_RULE_60)
         
         self.init_actions()
         
         if not self.harvester and not self.connect_harvester():
             return
         
+        # Fetched while the user picks the file and volume name
+        self.prefetch_lists([
+            ('harvester_namespaces', self.harvester.list_user_namespaces),
+            ('harvester_storage', self.harvester.list_storage_classes),
+        ])
+        
         qcow2_files = self.actions.list_qcow2_files()
         
         if not qcow2_files:
             print(colored("❌ No .qcow2 files found in staging", Colors.RED))
             return
         
-        print("\nAvailable QCOW2 files:")
-        for i, f in enumerate(qcow2_files, 1):
-            print(f"  {i}. {f['name']} ({format_size(f['size'])})")
+        self._emit_file_menu("Available QCOW2 files", qcow2_files)
         
-        choice = self.input_prompt("File number to import")
-        if not choice:
-            return
-        try:
-            idx = int(choice) - 1
-            selected_file = qcow2_files[idx]
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected_file = self._pick(qcow2_files, "File number to import")
+        if selected_file is None:
             return
         
         # Volume name
-        file_basename = os.path.basename(selected_file['name']).replace('.qcow2', '')
+        file_basename = qcow2_stem(selected_file['name'])
         vol_name = self.input_prompt(f"Volume name [{file_basename}]") or file_basename
         vol_name = vol_name.lower().replace('_', '-')
         
         # Namespace
         namespaces = self.get_harvester_namespaces()
-        print("\nAvailable namespaces:")
-        for i, ns in enumerate(namespaces, 1):
-            print(f"  {i}. {ns}")
+        self._emit_choices("Available namespaces", namespaces)
         
         choice = self.input_prompt("Namespace number [1]")
-        try:
-            idx = int(choice) - 1 if choice else 0
-            namespace = namespaces[idx]
-        except:
-            namespace = namespaces[0]
+        namespace = self._item_or(namespaces, choice, namespaces[0])
         
         # Storage Class
         print(colored("\n💾 Storage Class:", Colors.BOLD))
         
-        all_scs = self.harvester.list_storage_classes()
+        all_scs = self._cached_list('harvester_storage', self.harvester.list_storage_classes)
         valid_scs = []
         default_sc_idx = 0
         
@@ -2250,16 +2616,11 @@ class MigrationTool:
         default_choice = str(default_sc_idx) if default_sc_idx else "1"
         sc_choice = self.input_prompt(f"Storage class [{default_choice}]") or default_choice
         
-        try:
-            sc_idx = int(sc_choice) - 1
-            selected_sc = valid_scs[sc_idx].get('metadata', {}).get('name')
-        except:
-            selected_sc = valid_scs[0].get('metadata', {}).get('name')
+        selected_sc = self._item_or(valid_scs, sc_choice, valid_scs[0]).get('metadata', {}).get('name')
         
         print(colored(f"   ✓ Using: {selected_sc}", Colors.GREEN))
         
         # Volume size - get virtual size
-        import subprocess
         import math
         try:
             result = subprocess.run(
@@ -2283,7 +2644,7 @@ class MigrationTool:
         size_gi = int(size_input) if size_input else default_size
         
         # Check NFS config for sparse import
-        transfer_config = self.config.get('transfer', {})
+        transfer_config = self.transfer_cfg
         nfs_server = transfer_config.get('nfs_server')
         nfs_path = transfer_config.get('nfs_path')
         
@@ -2324,7 +2685,6 @@ class MigrationTool:
                     if line.strip():
                         print(f"   {line}")
         
-        import time
         start_time = time.time()
         
         try:
@@ -2353,6 +2713,7 @@ class MigrationTool:
         except Exception as e:
             print(colored(f"\n\n❌ Error: {e}", Colors.RED))
     
+    @invalidates('harvester_pvcs')
     def import_vm_disk(self, vm_name: str, disk_idx: int = None, 
                        namespace: str = "harvester-public",
                        storage_class: str = "harvester-longhorn-dual-node"):
@@ -2368,7 +2729,7 @@ class MigrationTool:
             storage_class: Storage class to use
         """
         print(colored("\n📦 Import VM Disk to Harvester", Colors.BOLD))
-        print(colored("=" * 60, Colors.BLUE))
+        print(EQ_RULE_60)
         
         self.init_actions()
         
@@ -2376,7 +2737,7 @@ class MigrationTool:
             return
         
         # Get transfer config
-        transfer_config = self.config.get('transfer', {})
+        transfer_config = self.transfer_cfg
         nfs_server = transfer_config.get('nfs_server')
         nfs_path = transfer_config.get('nfs_path')
         
@@ -2412,7 +2773,6 @@ class MigrationTool:
             print(colored(f"\n→ Importing all {len(vm_files)} disk(s)", Colors.CYAN))
         
         # Import each disk
-        import subprocess
         import math
         
         for i, qcow2_info in enumerate(vm_files):
@@ -2420,7 +2780,7 @@ class MigrationTool:
             qcow2_path = qcow2_info['path']
             
             # Derive volume name from file
-            base_name = os.path.basename(qcow2_file).replace('.qcow2', '')
+            base_name = qcow2_stem(qcow2_file)
             vol_name = base_name.lower().replace('_', '-')
             
             print(colored(f"\n{'='*60}", Colors.BLUE))
@@ -2501,12 +2861,23 @@ class MigrationTool:
         print("   Press Ctrl+C to stop waiting (import continues in background)")
         print("   Note: 'prime-*' scratch volumes are normal and will be cleaned up")
         
-        import time
         start_time = time.time()
         last_phase = ""
+        last_poll = 0.0
+        progress_str = ""
         
         try:
             while True:
+                # Poll the DataVolume every 5s, refresh the served-bytes line every second
+                now = time.time()
+                if now - last_poll < 5:
+                    time.sleep(1)
+                    elapsed = int(time.time() - start_time)
+                    served = format_size(self.actions.http_server_stats()['bytes'])
+                    print(f"\r   [{elapsed}s]{progress_str} served {served}     ", end='', flush=True)
+                    continue
+                last_poll = now
+                
                 status = self.harvester.get_datavolume_status(vol_name, namespace)
                 phase = status.get('phase', 'Unknown')
                 progress = status.get('progress', '')
@@ -2519,7 +2890,8 @@ class MigrationTool:
                 
                 # Progress display
                 progress_str = f" {progress}" if progress and progress != 'N/A' else ""
-                print(f"\r   [{elapsed}s]{progress_str}     ", end='', flush=True)
+                served = format_size(self.actions.http_server_stats()['bytes'])
+                print(f"\r   [{elapsed}s]{progress_str} served {served}     ", end='', flush=True)
                 
                 if phase == 'Succeeded':
                     print(colored(f"\n\n✅ Volume created: {namespace}/{vol_name}", Colors.GREEN))
@@ -2547,8 +2919,6 @@ class MigrationTool:
                     print(f"   kubectl describe dv {vol_name} -n {namespace}")
                     break
                 
-                time.sleep(5)
-                
         except KeyboardInterrupt:
             print(colored(f"\n\n⚠️  Import continues in background", Colors.YELLOW))
         
@@ -2559,22 +2929,14 @@ class MigrationTool:
     def get_harvester_namespaces(self) -> list:
         """Get list of namespaces from Harvester."""
         try:
-            result = self.harvester._request("GET", "/api/v1/namespaces")
-            namespaces = []
-            # System namespace prefixes to exclude
-            exclude_prefixes = ('kube-', 'cattle-', 'fleet-', 'local', 'longhorn-', 'harvester-system')
-            
-            for ns in result.get('items', []):
-                name = ns.get('metadata', {}).get('name', '')
-                # Keep harvester-public, exclude other system namespaces
-                if name == 'harvester-public':
-                    namespaces.append(name)
-                elif not any(name.startswith(p) for p in exclude_prefixes):
-                    namespaces.append(name)
+            items = self._cached_list('harvester_namespaces', self.harvester.list_user_namespaces)
+            namespaces = [name for name in ((ns.get('metadata') or _EMPTY).get('name', '') for ns in items)
+                          if not SYSTEM_NAMESPACE_NAME.match(name)]
             return sorted(namespaces) if namespaces else ['default']
         except:
             return ['default']
     
+    @invalidates('harvester_vms', 'harvester_vmis', 'harvester_pvcs')
     def create_harvester_vm(self):
         """Create a VM in Harvester using existing PVCs (created via DataVolume)."""
         if not self.harvester and not self.connect_harvester():
@@ -2585,20 +2947,20 @@ class MigrationTool:
             return
         
         print(colored("\n🖥️  Create VM in Harvester", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
+        
+        # Networks are only needed after the disk prompts, fetch them alongside the namespaces
+        self.prefetch_lists([
+            ('harvester_namespaces', self.harvester.list_user_namespaces),
+            ('harvester_networks', self.harvester.list_all_networks),
+        ])
         
         # Get namespace first
         namespaces = self.get_harvester_namespaces()
-        print("\nAvailable namespaces:")
-        for i, ns in enumerate(namespaces, 1):
-            print(f"  {i}. {ns}")
+        self._emit_choices("Available namespaces", namespaces)
         
         choice = self.input_prompt("Namespace number [1]")
-        try:
-            idx = int(choice) - 1 if choice else 0
-            namespace = namespaces[idx]
-        except:
-            namespace = namespaces[0]
+        namespace = self._item_or(namespaces, choice, namespaces[0])
         
         # List available PVCs
         all_pvcs = self.harvester.list_pvcs(namespace)
@@ -2606,19 +2968,20 @@ class MigrationTool:
             print(colored(f"❌ No PVCs found in {namespace}. Import volumes first (option 6).", Colors.RED))
             return
         
-        # Detect VM names from PVCs (e.g., "vm-name-disk0" → "vm-name")
+        # Project the PVCs to {name, size} once and detect VM names from
+        # them (e.g., "vm-name-disk0" → "vm-name")
+        pvc_list = []
         detected_vms = {}
         for pvc in all_pvcs:
-            pvc_name = pvc.get('metadata', {}).get('name', '')
+            pvc_name = (pvc.get('metadata') or _EMPTY).get('name', '')
+            reqs = ((pvc.get('spec') or _EMPTY).get('resources') or _EMPTY).get('requests') or _EMPTY
+            entry = {'name': pvc_name, 'size': reqs.get('storage', 'N/A')}
+            pvc_list.append(entry)
             if '-disk' in pvc_name:
-                vm_base = pvc_name.rsplit('-disk', 1)[0]
-                if vm_base not in detected_vms:
-                    detected_vms[vm_base] = []
-                detected_vms[vm_base].append(pvc)
+                detected_vms.setdefault(pvc_name.rsplit('-disk', 1)[0], []).append(entry)
         
         # Look for saved VM configs
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        migrations_dir = os.path.join(staging_dir, 'migrations')
+        migrations_dir = self.migrations_dir
         
         # Initialize variables
         loaded_config = None
@@ -2641,19 +3004,14 @@ class MigrationTool:
                 disk_count = len(detected_vms[vm_base])
                 config_path = os.path.join(migrations_dir, vm_base.lower(), 'vm-config.json')
                 has_config = os.path.exists(config_path)
-                status = colored("✓ config", Colors.GREEN) if has_config else colored("○ manual", Colors.YELLOW)
+                status = CONFIG_FOUND_MARK if has_config else CONFIG_MANUAL_MARK
                 selected = " ← current" if current_match == i - 1 else ""
                 print(f"   {i}. {vm_base} ({disk_count} disk(s)) {status}{selected}")
             print(f"   0. Enter manually")
             
             default_choice = str(current_match + 1) if current_match is not None else "1"
             choice = self.input_prompt(f"\nSelect VM [{default_choice}]") or default_choice
-            try:
-                idx = int(choice) - 1
-                if idx >= 0 and idx < len(detected_list):
-                    self._selected_vm = detected_list[idx]
-            except:
-                pass
+            self._selected_vm = self._item_or(detected_list, choice, self._selected_vm)
         
         # Load vm-config.json if available
         if self._selected_vm:
@@ -2709,13 +3067,10 @@ class MigrationTool:
                 break
         
         if detected_key:
-            auto_pvcs = sorted(detected_vms[detected_key], key=lambda p: p.get('metadata', {}).get('name', ''))
-            print(f"   Auto-detected {len(auto_pvcs)} disk(s) for {detected_key}:")
-            for i, pvc in enumerate(auto_pvcs):
-                pvc_name = pvc.get('metadata', {}).get('name', '')
-                size = pvc.get('spec', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A')
-                print(f"      Disk {i}: {pvc_name} ({size})")
-                selected_pvcs.append({'name': pvc_name, 'size': size})
+            selected_pvcs = sorted(detected_vms[detected_key], key=itemgetter('name'))
+            print(f"   Auto-detected {len(selected_pvcs)} disk(s) for {detected_key}:")
+            for i, pvc in enumerate(selected_pvcs):
+                print(f"      Disk {i}: {pvc['name']} ({pvc['size']})")
             
             use_auto = self.input_prompt("\nUse these PVCs? (y/n) [y]") or "y"
             if use_auto.lower() != 'y':
@@ -2723,25 +3078,15 @@ class MigrationTool:
         
         # Manual selection if needed
         if not selected_pvcs:
-            print("\nAvailable PVCs:")
-            for i, pvc in enumerate(all_pvcs, 1):
-                pvc_name = pvc.get('metadata', {}).get('name', '')
-                size = pvc.get('spec', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A')
-                print(f"  {i}. {pvc_name} ({size})")
+            self._emit_choices("Available PVCs", (f"{pvc['name']} ({pvc['size']})" for pvc in pvc_list))
             
             pvc_choices = self.input_prompt("PVC numbers (comma-separated, first=boot)")
             if not pvc_choices:
                 return
             
-            try:
-                indices = [int(x.strip()) - 1 for x in pvc_choices.split(',')]
-                for idx in indices:
-                    pvc = all_pvcs[idx]
-                    selected_pvcs.append({
-                        'name': pvc.get('metadata', {}).get('name', ''),
-                        'size': pvc.get('spec', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A')
-                    })
-            except:
+            numbers = [x.strip() for x in pvc_choices.split(',')]
+            selected_pvcs = [self._item_or(pvc_list, n, None) for n in numbers]
+            if None in selected_pvcs:
                 print(colored("Invalid selection", Colors.RED))
                 return
         
@@ -2773,7 +3118,7 @@ class MigrationTool:
         print(colored("\n🌐 Network Configuration:", Colors.BOLD))
         
         # Get all networks from all namespaces
-        all_networks = self.harvester.list_all_networks()
+        all_networks = self._cached_list('harvester_networks', self.harvester.list_all_networks)
         
         if not all_networks:
             print(colored("   No networks found!", Colors.RED))
@@ -2840,11 +3185,8 @@ class MigrationTool:
                 default_idx = 1
             
             net_choice = self.input_prompt(prompt) or str(default_idx)
-            try:
-                net_idx = int(net_choice) - 1
-                selected_net = network_list[net_idx].copy()  # Copy to avoid modifying original
-            except:
-                selected_net = network_list[0].copy()
+            # Copy to avoid modifying original
+            selected_net = self._item_or(network_list, net_choice, network_list[0]).copy()
             
             # Store source MAC if available
             if source_nics and nic_idx < len(source_nics):
@@ -2876,31 +3218,25 @@ class MigrationTool:
         # Build VM manifest with PVC references (NO images)
         print(colored("\n🚀 Creating VM...", Colors.CYAN))
         
-        disks_spec = []
-        volumes_spec = []
-        volume_claim_templates = []
-        
-        for i, pvc in enumerate(selected_pvcs):
-            disk_name = f"disk-{i}"
-            disk_spec = {"name": disk_name, "disk": {"bus": disk_bus}}
-            if i == 0:
-                disk_spec["bootOrder"] = 1
-            disks_spec.append(disk_spec)
-            
-            volumes_spec.append({
-                "name": disk_name,
-                "persistentVolumeClaim": {"claimName": pvc['name']}
-            })
-            
-            # Build volume claim template for UI annotation
-            volume_claim_templates.append({
+        disks_spec = [{"name": f"disk-{i}", "disk": {"bus": disk_bus}} for i in range(len(selected_pvcs))]
+        if disks_spec:
+            disks_spec[0]["bootOrder"] = 1
+        volumes_spec = [
+            {"name": f"disk-{i}", "persistentVolumeClaim": {"claimName": pvc['name']}}
+            for i, pvc in enumerate(selected_pvcs)
+        ]
+        # Volume claim templates for the UI annotation
+        volume_claim_templates = [
+            {
                 "metadata": {"name": pvc['name'], "annotations": {"harvesterhci.io/imageId": ""}},
                 "spec": {
                     "accessModes": ["ReadWriteMany"],
                     "resources": {"requests": {"storage": pvc['size']}},
                     "volumeMode": "Block"
                 }
-            })
+            }
+            for pvc in selected_pvcs
+        ]
         
         net_model = "e1000" if disk_bus == "sata" else "virtio"
         
@@ -2926,6 +3262,29 @@ class MigrationTool:
             })
             network_ips_annotation[nic_name] = ""
         
+        domain = {
+            "cpu": {
+                "cores": cpu,
+                "sockets": 1,
+                "maxSockets": 1,
+                "threads": 1
+            },
+            "memory": {"guest": f"{ram}Gi"},
+            "resources": {
+                "limits": {"cpu": str(cpu), "memory": f"{ram}Gi"},
+                "requests": {"cpu": "250m", "memory": f"{ram * 682}Mi"}
+            },
+            "devices": {
+                "disks": disks_spec,
+                "interfaces": interfaces_spec,
+                "inputs": VM_INPUT_DEVICES
+            },
+            "features": VM_FEATURES,
+            "machine": {"type": "q35"}
+        }
+        if boot_type == "UEFI":
+            domain["firmware"] = UEFI_FIRMWARE
+        
         manifest = {
             "apiVersion": "kubevirt.io/v1",
             "kind": "VirtualMachine",
@@ -2935,8 +3294,8 @@ class MigrationTool:
                 "labels": {"harvesterhci.io/creator": "harvesterhci"},
                 "annotations": {
                     "harvesterhci.io/vmRunStrategy": "RerunOnFailure",
-                    "harvesterhci.io/volumeClaimTemplates": json.dumps(volume_claim_templates),
-                    "harvesterhci.io/networkIps": json.dumps(network_ips_annotation)
+                    "harvesterhci.io/volumeClaimTemplates": json_dumps(volume_claim_templates),
+                    "harvesterhci.io/networkIps": json_dumps(network_ips_annotation)
                 }
             },
             "spec": {
@@ -2954,26 +3313,7 @@ class MigrationTool:
                     "spec": {
                         "hostname": vm_name,
                         "evictionStrategy": "LiveMigrateIfPossible",
-                        "domain": {
-                            "cpu": {
-                                "cores": cpu,
-                                "sockets": 1,
-                                "maxSockets": 1,
-                                "threads": 1
-                            },
-                            "memory": {"guest": f"{ram}Gi"},
-                            "resources": {
-                                "limits": {"cpu": str(cpu), "memory": f"{ram}Gi"},
-                                "requests": {"cpu": "250m", "memory": f"{ram * 682}Mi"}
-                            },
-                            "devices": {
-                                "disks": disks_spec,
-                                "interfaces": interfaces_spec,
-                                "inputs": [{"bus": "usb", "name": "tablet", "type": "tablet"}]
-                            },
-                            "features": {"acpi": {"enabled": True}},
-                            "machine": {"type": "q35"}
-                        },
+                        "domain": domain,
                         "networks": networks_spec,
                         "volumes": volumes_spec,
                         "terminationGracePeriodSeconds": 120
@@ -2982,11 +3322,6 @@ class MigrationTool:
             }
         }
         
-        if boot_type == "UEFI":
-            manifest['spec']['template']['spec']['domain']['firmware'] = {
-                "bootloader": {"efi": {"secureBoot": False, "persistent": False}}
-            }
-        
         try:
             self.harvester.create_vm(manifest)
             print(colored(f"\n✅ VM created: {vm_name}", Colors.GREEN))
@@ -3008,9 +3343,9 @@ class MigrationTool:
                     for i, nic in enumerate(source_nics):
                         ip = nic.get('ip') if not nic.get('dhcp') else 'DHCP'
                         print(f"      NIC-{i}: {ip}")
-                    print(colored("\n💡 Next step: Menu Migration → Post-migration Windows (option 7)", Colors.YELLOW))
+                    sys.stdout.write(TIP_NEXT_POSTMIG_WINDOWS)
                 else:
-                    print(colored("\n💡 Next step: Configure VM network if needed", Colors.YELLOW))
+                    sys.stdout.write(TIP_NEXT_CONFIGURE_NETWORK)
         except Exception as e:
             print(colored(f"❌ Error: {e}", Colors.RED))
     
@@ -3018,6 +3353,13 @@ class MigrationTool:
     
     def menu_tracker(self):
         """Migration Tracker menu."""
+        actions = {
+            "1": self.tracker_list_all,
+            "2": self.tracker_add_vm,
+            "3": self.tracker_remove_vm,
+            "4": self.tracker_reset_steps,
+            "5": self.tracker_view_vm,
+        }
         while True:
             self.print_header()
             self.print_menu("MIGRATION TRACKER", [
@@ -3031,20 +3373,9 @@ class MigrationTool:
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self.tracker_list_all()
-                self.pause()
-            elif choice == "2":
-                self.tracker_add_vm()
-                self.pause()
-            elif choice == "3":
-                self.tracker_remove_vm()
-                self.pause()
-            elif choice == "4":
-                self.tracker_reset_steps()
-                self.pause()
-            elif choice == "5":
-                self.tracker_view_vm()
+            action = actions.get(choice)
+            if action:
+                action()
                 self.pause()
             elif choice == "0":
                 break
@@ -3052,7 +3383,7 @@ class MigrationTool:
     def tracker_list_all(self):
         """List all VMs in the migration tracker."""
         print(colored("\n📋 Migration Status Overview", Colors.BOLD))
-        print(colored("=" * 80, Colors.BLUE))
+        print(EQ_RULE_80)
         
         tracker = self.load_tracker()
         migrations = tracker.get('migrations', {})
@@ -3064,7 +3395,7 @@ class MigrationTool:
         
         # Header
         print(f"{'VM Name':<25} {'OS':<10} {'Progress':<12} {'Next Step':<20} {'Added':<12}")
-        print(colored("=" * 80, Colors.BLUE))
+        print(EQ_RULE_80)
         
         for vm_key, vm_data in sorted(migrations.items()):
             display_name = vm_data.get('display_name', vm_key)
@@ -3078,7 +3409,7 @@ class MigrationTool:
             # Color based on progress
             if next_step == "completed":
                 progress_colored = colored(progress, Colors.GREEN)
-                next_label = colored("✅ Completed", Colors.GREEN)
+                next_label = COMPLETED_LABEL
             elif done == 0:
                 progress_colored = colored(progress, Colors.YELLOW)
             else:
@@ -3086,13 +3417,13 @@ class MigrationTool:
             
             print(f"{display_name:<25} {os_type:<10} {progress_colored} {next_label:<20} {added:<12}")
         
-        print(colored("=" * 80, Colors.BLUE))
+        print(EQ_RULE_80)
         print(f"Total: {len(migrations)} VM(s) in migration pipeline")
     
     def tracker_add_vm(self):
         """Add a VM from Nutanix to the migration tracker."""
         print(colored("\n➕ Add VM to Migration List", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         if not self.nutanix and not self.connect_nutanix():
             return
@@ -3102,7 +3433,7 @@ class MigrationTool:
         existing = set(tracker.get('migrations', {}).keys())
         
         # List Nutanix VMs
-        vms = self.nutanix.list_vms()
+        vms = self._cached_list('nutanix_vms', self.nutanix.list_vms)
         if not vms:
             print(colored("❌ No VMs found in Nutanix", Colors.RED))
             return
@@ -3158,7 +3489,7 @@ class MigrationTool:
     def tracker_remove_vm(self):
         """Remove a VM from the migration tracker."""
         print(colored("\n➖ Remove VM from Migration List", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         tracker = self.load_tracker()
         migrations = tracker.get('migrations', {})
@@ -3191,19 +3522,18 @@ class MigrationTool:
                 confirm = self.input_prompt(f"   Remove '{display_name}'? (y/n) [n]") or "n"
                 if confirm.lower() == 'y':
                     # Check for staging files to cleanup
-                    staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-                    vm_staging_dir = os.path.join(staging_dir, 'migrations', vm_key)
+                    vm_staging_dir = os.path.join(self.migrations_dir, vm_key)
                     
                     files_to_delete = []
                     total_size = 0
                     
                     if os.path.exists(vm_staging_dir):
-                        for f in os.listdir(vm_staging_dir):
-                            f_path = os.path.join(vm_staging_dir, f)
-                            if os.path.isfile(f_path):
-                                f_size = os.path.getsize(f_path)
-                                files_to_delete.append({'name': f, 'path': f_path, 'size': f_size})
-                                total_size += f_size
+                        with os.scandir(vm_staging_dir) as it:
+                            for entry in it:
+                                if entry.is_file():
+                                    f_size = entry.stat().st_size
+                                    files_to_delete.append({'name': entry.name, 'path': entry.path, 'size': f_size})
+                                    total_size += f_size
                     
                     # Ask to cleanup staging files
                     if files_to_delete:
@@ -3237,7 +3567,7 @@ class MigrationTool:
     def tracker_reset_steps(self):
         """Reset step(s) for a VM in the tracker."""
         print(colored("\n🔄 Reset VM Step(s)", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         tracker = self.load_tracker()
         migrations = tracker.get('migrations', {})
@@ -3275,7 +3605,7 @@ class MigrationTool:
                     step_data = steps.get(step, {})
                     done = step_data.get('done', False)
                     date = step_data.get('date', '')[:10] if step_data.get('date') else '-'
-                    status = colored("✓", Colors.GREEN) if done else colored("○", Colors.YELLOW)
+                    status = DONE_MARK if done else PENDING_MARK
                     label = self.STEP_LABELS.get(step, step)
                     print(f"   {i}. {status} {label:<30} {date}")
                 
@@ -3307,7 +3637,7 @@ class MigrationTool:
     def tracker_view_vm(self):
         """View detailed status of a VM in the tracker."""
         print(colored("\n🔍 View VM Details", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         tracker = self.load_tracker()
         migrations = tracker.get('migrations', {})
@@ -3354,7 +3684,7 @@ class MigrationTool:
                     done = step_data.get('done', False)
                     date = step_data.get('date', '')
                     date_str = date[:19].replace('T', ' ') if date else '-'
-                    status = colored("✓ Done", Colors.GREEN) if done else colored("○ Pending", Colors.YELLOW)
+                    status = STEP_DONE_LABEL if done else STEP_PENDING_LABEL
                     label = self.STEP_LABELS.get(step, step)
                     print(f"   {label:<30} {status:<15} {date_str}")
                 
@@ -3369,6 +3699,15 @@ class MigrationTool:
             print(colored("❌ Invalid input", Colors.RED))
 
     def menu_nutanix(self):
+        actions = {
+            "1": self.list_nutanix_vms,
+            "2": self.show_vm_details,
+            "3": self.tracker_add_vm,
+            "4": self.power_on_nutanix_vm,
+            "5": self.power_off_nutanix_vm,
+            "6": self.list_nutanix_images,
+            "7": self.delete_nutanix_image,
+        }
         while True:
             self.print_header()
             self.print_menu("NUTANIX", [
@@ -3379,36 +3718,52 @@ class MigrationTool:
                 ("5", "Power OFF VM"),
                 ("6", "List images"),
                 ("7", "Delete image (cleanup)"),
+                ("r", "Refresh cached lists"),
                 ("0", "Back")
             ])
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self.list_nutanix_vms()
-                self.pause()
-            elif choice == "2":
-                self.show_vm_details()
-                self.pause()
-            elif choice == "3":
-                self.tracker_add_vm()
-                self.pause()
-            elif choice == "4":
-                self.power_on_nutanix_vm()
-                self.pause()
-            elif choice == "5":
-                self.power_off_nutanix_vm()
-                self.pause()
-            elif choice == "6":
-                self.list_nutanix_images()
-                self.pause()
-            elif choice == "7":
-                self.delete_nutanix_image()
+            action = actions.get(choice)
+            if action:
+                action()
                 self.pause()
+            elif choice.lower() == "r":
+                self.invalidate_list_cache('nutanix_vms', 'nutanix_images')
             elif choice == "0":
                 break
     
+    def _harvester_menu_lists(self) -> list:
+        """(cache key, fetch) pairs behind the Harvester menu listings."""
+        h = self.harvester
+        return [
+            ('harvester_vms', h.list_all_vms),
+            ('harvester_vmis', h.list_all_vmi_metadata),
+            ('harvester_images', h.list_all_images),
+            ('harvester_pvcs', h.list_all_pvcs),
+            ('harvester_networks', h.list_all_networks),
+            ('harvester_storage', h.list_storage_classes),
+        ]
+    
     def menu_harvester(self):
+        actions = {
+            "1": self.list_harvester_vms,
+            "2": self.power_on_harvester_vm,
+            "3": self.power_off_harvester_vm,
+            "4": self.delete_harvester_vm,
+            "5": self.dissociate_vm_from_image,
+            "6": self.list_harvester_images,
+            "7": self.delete_harvester_image,
+            "8": self.list_harvester_volumes,
+            "9": self.delete_harvester_volume,
+            "10": self.list_harvester_networks,
+            "11": self.list_harvester_storage,
+            "12": self.switch_vm_disk_bus,
+        }
+        # Independent list calls, fetched concurrently while the menu is shown
+        if self.harvester:
+            self.prefetch_lists(self._harvester_menu_lists(), missing_only=True)
+        
         while True:
             self.print_header()
             self.print_menu("HARVESTER", [
@@ -3424,54 +3779,28 @@ class MigrationTool:
                 ("10", "List networks"),
                 ("11", "List storage classes"),
                 ("12", "Switch VM disk bus (SATA → VirtIO)"),
+                ("r", "Refresh cached lists"),
                 ("0", "Back")
             ])
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self.list_harvester_vms()
-                self.pause()
-            elif choice == "2":
-                self.power_on_harvester_vm()
-                self.pause()
-            elif choice == "3":
-                self.power_off_harvester_vm()
-                self.pause()
-            elif choice == "4":
-                self.delete_harvester_vm()
-                self.pause()
-            elif choice == "5":
-                self.dissociate_vm_from_image()
-                self.pause()
-            elif choice == "6":
-                self.list_harvester_images()
-                self.pause()
-            elif choice == "7":
-                self.delete_harvester_image()
-                self.pause()
-            elif choice == "8":
-                self.list_harvester_volumes()
-                self.pause()
-            elif choice == "9":
-                self.delete_harvester_volume()
-                self.pause()
-            elif choice == "10":
-                self.list_harvester_networks()
-                self.pause()
-            elif choice == "11":
-                self.list_harvester_storage()
-                self.pause()
-            elif choice == "12":
-                self.switch_vm_disk_bus()
+            action = actions.get(choice)
+            if action:
+                action()
                 self.pause()
+            elif choice.lower() == "r":
+                self.invalidate_list_cache(*HARVESTER_LIST_KEYS)
+                if self.harvester:
+                    self.prefetch_lists(self._harvester_menu_lists())
             elif choice == "0":
                 break
     
+    @invalidates('harvester_vms', 'harvester_vmis')
     def switch_vm_disk_bus(self):
         """Switch VM disk bus from SATA to VirtIO."""
         print(colored("\n🔄 Switch VM Disk Bus (SATA → VirtIO)", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         if not self.harvester and not self.connect_harvester():
             return
@@ -3500,18 +3829,11 @@ class MigrationTool:
             
             print(f"  {i}. {name} ({ns}) - {state} - Bus: {bus_str}")
         
-        choice = self.input_prompt("\nSelect VM number")
-        if not choice:
-            return
-        
-        try:
-            idx = int(choice) - 1
-            selected_vm = vms[idx]
-            vm_name = selected_vm.get('metadata', {}).get('name')
-            namespace = selected_vm.get('metadata', {}).get('namespace')
-        except:
-            print(colored("Invalid choice", Colors.RED))
+        selected_vm = self._pick(vms, "\nSelect VM number")
+        if selected_vm is None:
             return
+        vm_name = selected_vm.get('metadata', {}).get('name')
+        namespace = selected_vm.get('metadata', {}).get('namespace')
         
         # Check current bus types
         spec = selected_vm.get('spec', {}).get('template', {}).get('spec', {})
@@ -3530,7 +3852,8 @@ class MigrationTool:
             print(colored("\n✅ All disks already using VirtIO!", Colors.GREEN))
             return
         
-        # Check if VM is running
+        # Check if VM is running (vm_data tracks the latest VM object we have)
+        vm_data = selected_vm
         vm_status = selected_vm.get('status', {})
         if vm_status.get('ready', False):
             print(colored(f"\n⚠️  VM {vm_name} is running", Colors.YELLOW))
@@ -3542,18 +3865,14 @@ class MigrationTool:
                     self.harvester.stop_vm(vm_name, namespace)
                     print(colored("   ✅ Stop command sent. Waiting...", Colors.GREEN))
                     
-                    # Wait for VM to stop
-                    import time
-                    max_wait = 120
-                    elapsed = 0
-                    while elapsed < max_wait:
-                        time.sleep(5)
-                        elapsed += 5
-                        vm_data = self.harvester.get_vm(vm_name, namespace)
-                        if not vm_data.get('status', {}).get('ready', False):
-                            print(colored("   ✅ VM stopped", Colors.GREEN))
-                            break
-                        print(f"   Waiting... ({elapsed}s)")
+                    # Wait for VM to stop (watch API, polling fallback)
+                    vm_data = self.harvester.watch_vm(
+                        vm_name, namespace,
+                        predicate=lambda v: not (v.get('status') or _EMPTY).get('ready', False),
+                        timeout=120
+                    )
+                    if vm_data:
+                        print(colored("   ✅ VM stopped", Colors.GREEN))
                     else:
                         print(colored("   ⚠️  VM did not stop in time", Colors.YELLOW))
                         return
@@ -3578,43 +3897,32 @@ class MigrationTool:
         print(colored("\n   Updating VM configuration...", Colors.CYAN))
         
         try:
-            # Get fresh VM data
-            vm_data = self.harvester.get_vm(vm_name, namespace)
-            
-            # Modify disk bus in the spec
-            new_disks = []
-            template_spec = vm_data.get('spec', {}).get('template', {}).get('spec', {})
-            for disk in template_spec.get('domain', {}).get('devices', {}).get('disks', []):
-                new_disk = disk.copy()
-                if 'disk' in new_disk:
-                    new_disk['disk'] = new_disk['disk'].copy()
-                    old_bus = new_disk['disk'].get('bus', 'sata')
-                    if old_bus in ('sata', 'ide', 'scsi'):
-                        new_disk['disk']['bus'] = 'virtio'
-                        print(f"   {new_disk.get('name')}: {old_bus} → virtio")
-                new_disks.append(new_disk)
-            
-            # Build patch
-            patch = {
-                "spec": {
-                    "template": {
-                        "spec": {
-                            "domain": {
-                                "devices": {
-                                    "disks": new_disks
-                                }
-                            }
-                        }
-                    }
-                }
-            }
+            # Modify disk bus in the spec, reusing the last VM object seen
+            # (watch result after a stop, otherwise the listing above)
+            template_spec = ((vm_data.get('spec') or _EMPTY).get('template') or _EMPTY).get('spec') or _EMPTY
+            current_disks = ((template_spec.get('domain') or _EMPTY).get('devices') or _EMPTY).get('disks', [])
+            changed = [
+                (i, d.get('name'), d['disk'].get('bus', 'sata'))
+                for i, d in enumerate(current_disks)
+                if 'disk' in d and d['disk'].get('bus', 'sata') in LEGACY_DISK_BUSES
+            ]
+            for _, disk_name, old_bus in changed:
+                print(f"   {disk_name}: {old_bus} → virtio")
+            
+            # JSON Patch touching only the changed bus fields; the test op
+            # guards against the disks list having been reordered meanwhile
+            disks_path = "/spec/template/spec/domain/devices/disks"
+            ops = []
+            for i, disk_name, _ in changed:
+                ops.append({"op": "test", "path": f"{disks_path}/{i}/name", "value": disk_name})
+                ops.append({"op": "add", "path": f"{disks_path}/{i}/disk/bus", "value": "virtio"})
             
             # Apply patch via Harvester API
-            result = self.harvester._request(
+            self.harvester._request(
                 "PATCH",
                 f"/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachines/{vm_name}",
-                json=patch,
-                headers={"Content-Type": "application/merge-patch+json"}
+                ops,
+                content_type="application/json-patch+json"
             )
             
             print(colored("   ✅ VM configuration updated!", Colors.GREEN))
@@ -3623,9 +3931,18 @@ class MigrationTool:
             start = self.input_prompt("\nStart VM now? (y/n)")
             if start.lower() == 'y':
                 print("   Starting VM...")
-                self.harvester.start_vm(vm_name, namespace)
-                print(colored("   ✅ Start command sent", Colors.GREEN))
-                print(colored("\n💡 Monitor VM boot via Harvester console", Colors.YELLOW))
+                # The patch above is already applied; the boot itself is
+                # asynchronous, so don't block the menu on the start call
+                def start_in_background():
+                    try:
+                        self.harvester.start_vm(vm_name, namespace)
+                    except Exception as e:
+                        with self._print_lock:
+                            print(colored(f"\n   ❌ Start failed for {vm_name}: {e}", Colors.RED))
+                self._io_pool.submit(start_in_background)
+                with self._print_lock:
+                    print(colored("   ✅ Start command submitted, VM will start shortly", Colors.GREEN))
+                    print(colored("\n💡 Monitor VM boot via Harvester console", Colors.YELLOW))
             
         except Exception as e:
             print(colored(f"❌ Error: {e}", Colors.RED))
@@ -3633,6 +3950,19 @@ class MigrationTool:
             traceback.print_exc()
     
     def menu_migration(self):
+        actions = {
+            "1": self.select_vm,
+            "2": self.windows_precheck,
+            "3": self.export_vm,
+            "4": self.import_disks_to_pvcs,
+            "5": self.create_harvester_vm,
+            "6": self.postmig_autoconfigure,
+            "7": lambda: print(colored("\n🚧 Post-migration Linux - Coming soon", Colors.YELLOW)),
+            "8": self.check_staging,
+            "9": self.list_staging_disks,
+            "10": self.show_disk_info,
+        }
+        needs_vm = {"2", "3", "4"}  # Work on the selected VM
         while True:
             self.print_header()
             self.print_menu("MIGRATION", [
@@ -3652,44 +3982,12 @@ class MigrationTool:
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self.select_vm()
-                self.pause()
-            elif choice == "2":
-                if not self._selected_vm:
-                    print(colored("❌ No VM selected. Use option 1 first.", Colors.RED))
-                else:
-                    self.windows_precheck()
-                self.pause()
-            elif choice == "3":
-                if not self._selected_vm:
-                    print(colored("❌ No VM selected. Use option 1 first.", Colors.RED))
-                else:
-                    self.export_vm()
-                self.pause()
-            elif choice == "4":
-                if not self._selected_vm:
+            action = actions.get(choice)
+            if action:
+                if choice in needs_vm and not self._selected_vm:
                     print(colored("❌ No VM selected. Use option 1 first.", Colors.RED))
                 else:
-                    self.import_disks_to_pvcs()
-                self.pause()
-            elif choice == "5":
-                self.create_harvester_vm()
-                self.pause()
-            elif choice == "6":
-                self.postmig_autoconfigure()
-                self.pause()
-            elif choice == "7":
-                print(colored("\n🚧 Post-migration Linux - Coming soon", Colors.YELLOW))
-                self.pause()
-            elif choice == "8":
-                self.check_staging()
-                self.pause()
-            elif choice == "9":
-                self.list_staging_disks()
-                self.pause()
-            elif choice == "10":
-                self.show_disk_info()
+                    action()
                 self.pause()
             elif choice == "0":
                 break
@@ -3698,6 +3996,17 @@ class MigrationTool:
     
     def menu_windows(self):
         """Windows tools menu."""
+        actions = {
+            "1": self.check_winrm_prereqs,
+            "2": self.windows_precheck,
+            "3": self.view_vm_config,
+            "4": self.download_tools,
+            "5": self.stop_windows_services,
+            "6": self.start_windows_services,
+            "7": self.generate_postmig_script,
+            "8": self.postmig_autoconfigure,
+            "10": self.install_virtio_drivers,
+        }
         while True:
             self.print_header()
             self.print_menu("WINDOWS TOOLS", [
@@ -3716,42 +4025,19 @@ class MigrationTool:
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self.check_winrm_prereqs()
-                self.pause()
-            elif choice == "2":
-                self.windows_precheck()
-                self.pause()
-            elif choice == "3":
-                self.view_vm_config()
-                self.pause()
-            elif choice == "4":
-                self.download_tools()
-                self.pause()
-            elif choice == "5":
-                self.stop_windows_services()
-                self.pause()
-            elif choice == "6":
-                self.start_windows_services()
-                self.pause()
-            elif choice == "7":
-                self.generate_postmig_script()
-                self.pause()
-            elif choice == "8":
-                self.postmig_autoconfigure()
+            action = actions.get(choice)
+            if action:
+                action()
                 self.pause()
             elif choice == "9":
                 self.menu_vault()
-            elif choice == "10":
-                self.install_virtio_drivers()
-                self.pause()
             elif choice == "0":
                 break
     
     def install_virtio_drivers(self):
         """Install Red Hat VirtIO drivers on a running Windows VM."""
         print(colored("\n📦 Install Red Hat VirtIO Drivers", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         print(colored("   This will install the proper VirtIO drivers for KVM/Harvester.", Colors.CYAN))
         print(colored("   Required BEFORE switching VM disk bus from SATA to VirtIO!", Colors.YELLOW))
         
@@ -3760,8 +4046,7 @@ class MigrationTool:
             return
         
         # Check tools exist
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        tools_dir = os.path.join(staging_dir, 'tools')
+        tools_dir = self.tools_dir
         virtio_iso = os.path.join(tools_dir, 'virtio-win.iso')
         
         if not os.path.exists(virtio_iso):
@@ -3770,7 +4055,7 @@ class MigrationTool:
             return
         
         # Get target host
-        windows_config = self.config.get('windows', {})
+        windows_config = self.windows_cfg
         domain = windows_config.get('domain', 'AD.WYSSCENTER.CH').lower()
         use_kerberos = windows_config.get('use_kerberos', True)
         
@@ -3799,7 +4084,6 @@ class MigrationTool:
                 print(f"   Using: {username}")
             except:
                 username = self.input_prompt("   Username [Administrator]") or "Administrator"
-                import getpass
                 password = getpass.getpass("   Password: ")
         
         # Connect
@@ -3977,10 +4261,7 @@ Log "=========================================="
                 print(colored("   Reboot initiated. Wait for VM to come back.", Colors.GREEN))
             
             print(colored("\n✅ VirtIO drivers installation complete!", Colors.GREEN))
-            print(colored("\n💡 Next steps:", Colors.YELLOW))
-            print("   1. Reboot the VM if not done")
-            print("   2. Menu Harvester → Switch VM disk bus (option 12)")
-            print("   3. Start VM and verify boot")
+            sys.stdout.write(TIP_NEXT_SWITCH_DISK_BUS)
             
         except Exception as e:
             print(colored(f"❌ Error: {e}", Colors.RED))
@@ -3990,7 +4271,7 @@ Log "=========================================="
     def check_winrm_prereqs(self):
         """Check WinRM prerequisites."""
         print(colored("\n🔍 Checking Windows Remote Management Prerequisites", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         # Check pywinrm
         available, msg = check_winrm_available()
@@ -4023,7 +4304,7 @@ Log "=========================================="
         
         # Check tools directory
         print("\n   Checking tools...")
-        tools_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data') + '/tools'
+        tools_dir = self.tools_dir
         if os.path.exists(tools_dir):
             tools = os.listdir(tools_dir)
             if tools:
@@ -4048,13 +4329,12 @@ Log "=========================================="
             print(colored("❌ pywinrm not installed. Run: pip install pywinrm[kerberos]", Colors.RED))
             return None, None, None
         
-        windows_config = self.config.get('windows', {})
+        windows_config = self.windows_cfg
         domain = windows_config.get('domain', 'AD.WYSSCENTER.CH').lower()
         use_kerberos = windows_config.get('use_kerberos', True)
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
         
         # List available VM configs
-        migrations_dir = os.path.join(staging_dir, 'migrations')
+        migrations_dir = self.migrations_dir
         if os.path.exists(migrations_dir):
             configs = []
             for d in os.listdir(migrations_dir):
@@ -4113,7 +4393,6 @@ Log "=========================================="
                 username, password = self.vault.get_credential("local-admin")
             except:
                 username = self.input_prompt("Username [Administrator]") or "Administrator"
-                import getpass
                 password = getpass.getpass("Password: ")
         
         # Connect
@@ -4134,7 +4413,7 @@ Log "=========================================="
             
             # Get vm_dir from hostname
             hostname = host.split('.')[0].lower()
-            vm_dir = os.path.join(staging_dir, 'migrations', hostname)
+            vm_dir = os.path.join(self.migrations_dir, hostname)
             
             # Load config if not already loaded
             if not config:
@@ -4151,7 +4430,7 @@ Log "=========================================="
     def stop_windows_services(self):
         """Stop listening services before migration."""
         print(colored("\n🛑 Stop Services (Pre-Migration)", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         client, config, vm_dir = self._connect_windows()
         if not client:
@@ -4260,7 +4539,7 @@ Log "=========================================="
     def start_windows_services(self):
         """Start services after migration."""
         print(colored("\n▶️  Start Services (Post-Migration)", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         client, config, vm_dir = self._connect_windows()
         if not client:
@@ -4364,7 +4643,7 @@ Log "=========================================="
     def windows_precheck(self):
         """Run pre-migration check on Windows VM."""
         print(colored("\n🔍 Windows Pre-Migration Check", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         if not WINRM_AVAILABLE:
             print(colored("❌ pywinrm not installed. Run: pip install pywinrm[kerberos]", Colors.RED))
@@ -4381,7 +4660,7 @@ Log "=========================================="
             return
         
         # Build default FQDN from selected VM
-        windows_config = self.config.get('windows', {})
+        windows_config = self.windows_cfg
         domain = windows_config.get('domain', 'AD.WYSSCENTER.CH').lower()
         use_kerberos = windows_config.get('use_kerberos', True)
         
@@ -4428,7 +4707,6 @@ Log "=========================================="
                 print(f"   Username: {username}")
             except VaultError:
                 username = self.input_prompt("Username [Administrator]") or "Administrator"
-                import getpass
                 password = getpass.getpass("Password: ")
         
         # Connect
@@ -4527,7 +4805,7 @@ Log "=========================================="
             ps_nutanix_check = '''
 Get-ItemProperty HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*,
                  HKLM:\\SOFTWARE\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* -ErrorAction SilentlyContinue |
-    Where-Object { $_.DisplayName -like "*Nutanix*" } |
+    Where-Object DisplayName -like '*Nutanix*' |
     Select-Object DisplayName, DisplayVersion |
     ForEach-Object { "$($_.DisplayName)|$($_.DisplayVersion)" }
 '''
@@ -4647,8 +4925,7 @@ Get-ItemProperty HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\
             config.migration_ready = True
             
             # Save config
-            staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-            vm_dir = os.path.join(staging_dir, 'migrations', config.hostname.lower())
+            vm_dir = os.path.join(self.migrations_dir, config.hostname.lower())
             os.makedirs(vm_dir, exist_ok=True)
             config_path = os.path.join(vm_dir, 'vm-config.json')
             config.save(config_path)
@@ -4658,8 +4935,9 @@ Get-ItemProperty HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\
             if not self.nutanix:
                 print(colored("\n   🔗 Connecting to Nutanix to get VM boot type...", Colors.CYAN))
                 try:
-                    nutanix_config = self.config.get('nutanix', {})
+                    nutanix_config = self.nutanix_cfg
                     if nutanix_config.get('prism_central'):
+                        from lib import NutanixClient
                         self.nutanix = NutanixClient(
                             host=nutanix_config['prism_central'],
                             username=nutanix_config.get('username'),
@@ -4674,7 +4952,7 @@ Get-ItemProperty HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\
                 try:
                     nutanix_vm = self.nutanix.get_vm_by_name(config.hostname)
                     if nutanix_vm:
-                        vm_info = NutanixClient.parse_vm_info(nutanix_vm)
+                        vm_info = self.nutanix.parse_vm_info(nutanix_vm)
                         
                         # Reload and enhance the config with Nutanix data
                         with open(config_path, 'r') as f:
@@ -4713,8 +4991,7 @@ Get-ItemProperty HKLM:\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\
         """Install only QEMU Guest Agent on Windows VM via WinRM."""
         self.init_actions()
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        tools_dir = os.path.join(staging_dir, 'tools')
+        tools_dir = self.tools_dir
         qemu_ga_msi = os.path.join(tools_dir, 'qemu-ga-x86_64.msi')
         
         if not os.path.exists(qemu_ga_msi):
@@ -4814,8 +5091,7 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
         """Install missing prerequisites on Windows VM via WinRM."""
         self.init_actions()
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        tools_dir = os.path.join(staging_dir, 'tools')
+        tools_dir = self.tools_dir
         
         # Check what needs to be installed
         install_qemu_ga = not config.agents.qemu_guest_agent
@@ -4947,7 +5223,8 @@ if (Test-Path $exe) {
                             
                             if "DONE" in stdout2:
                                 break
-                            print(f"      Still installing... ({elapsed}s)")
+                            print(f"\r      Still installing... ({elapsed}s)   ", end='', flush=True)
+                        print()
                         
                         # Verify installation
                         verify = 'if ((Test-Path "$env:ProgramFiles\\Red Hat") -or (Test-Path "$env:ProgramFiles\\Virtio-Win\\Vioscsi")) { "SUCCESS" } else { "FAILED" }'
@@ -5065,8 +5342,7 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
                             print(f"      - {prereq}")
                     
                     # Update saved config
-                    staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-                    vm_dir = os.path.join(staging_dir, 'migrations', new_config.hostname.lower())
+                    vm_dir = os.path.join(self.migrations_dir, new_config.hostname.lower())
                     os.makedirs(vm_dir, exist_ok=True)
                     config_path = os.path.join(vm_dir, 'vm-config.json')
                     new_config.save(config_path)
@@ -5084,8 +5360,7 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
         """View saved VM configuration."""
         print(colored("\n📋 View VM Configuration", Colors.BOLD))
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        migrations_dir = os.path.join(staging_dir, 'migrations')
+        migrations_dir = self.migrations_dir
         
         if not os.path.exists(migrations_dir):
             print(colored("❌ No migrations directory found", Colors.YELLOW))
@@ -5117,11 +5392,11 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
             idx = int(choice) - 1
             name, path = configs[idx]
             
-            with open(path, 'r') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                data = json_load(f)
             
             print(colored(f"\n--- {name} ---", Colors.BOLD))
-            print(json.dumps(data, indent=2))
+            print(json_dumps(data, indent=True))
             
         except (ValueError, IndexError):
             print(colored("Invalid choice", Colors.RED))
@@ -5129,10 +5404,9 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
     def download_tools(self):
         """Download virtio-win and QEMU guest agent tools."""
         print(colored("\n⬇️  Download VirtIO and QEMU Guest Agent Tools", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        tools_dir = os.path.join(staging_dir, 'tools')
+        tools_dir = self.tools_dir
         
         print(f"\n   Destination: {tools_dir}")
         print("\n   Files to download:")
@@ -5161,8 +5435,7 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
         
         print(colored("\n📜 Generate Post-Migration Script", Colors.BOLD))
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        migrations_dir = os.path.join(staging_dir, 'migrations')
+        migrations_dir = self.migrations_dir
         
         if not os.path.exists(migrations_dir):
             print(colored("❌ No migrations directory found", Colors.YELLOW))
@@ -5218,8 +5491,7 @@ Remove-Item $msiPath -Force -ErrorAction SilentlyContinue
         """Install Red Hat VirtIO drivers during post-migration (reuses existing WinRM connection)."""
         self.init_actions()
         
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        tools_dir = os.path.join(staging_dir, 'tools')
+        tools_dir = self.tools_dir
         virtio_iso = os.path.join(tools_dir, 'virtio-win.iso')
         
         if not os.path.exists(virtio_iso):
@@ -5356,10 +5628,11 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
         finally:
             httpd.shutdown()
     
+    @invalidates('harvester_vms', 'harvester_vmis')
     def postmig_autoconfigure(self, vm_name=None, namespace=None):
         """Auto-configure Windows VM after migration using ping FQDN."""
         print(colored("\n🔧 Post-Migration Auto-Configure", Colors.BOLD))
-        print(colored("-" * 50, Colors.BLUE))
+        print(DASH_RULE_50)
         
         # Check if step already done (use selected_vm or passed vm_name)
         check_vm = vm_name or self._selected_vm
@@ -5376,8 +5649,8 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
         # Use selected VM if available
         if not vm_name and self._selected_vm:
             vm_name = self._selected_vm.lower().replace(' ', '-')
-            # Try to find the VM in Harvester to get namespace
-            vms = self.harvester.list_all_vms()
+            # Try to find the VM in Harvester to get namespace (fresh: the run state matters)
+            vms = self._cached_list('harvester_vms', self.harvester.list_all_vms, refresh=True)
             for vm in vms:
                 if vm.get('metadata', {}).get('name', '').lower() == vm_name:
                     namespace = vm.get('metadata', {}).get('namespace', 'default')
@@ -5391,7 +5664,6 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
                             try:
                                 self.harvester.start_vm(vm_name, namespace)
                                 print(colored("   ✅ Start command sent. Waiting 30s for boot...", Colors.GREEN))
-                                import time
                                 time.sleep(30)
                             except Exception as e:
                                 print(colored(f"   ❌ Error: {e}", Colors.RED))
@@ -5408,7 +5680,7 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
         # If still no vm_name, list VMs and ask user to select
         if not vm_name:
             # List ALL VMs in Harvester (across all namespaces)
-            vms = self.harvester.list_all_vms()
+            vms = self._cached_list('harvester_vms', self.harvester.list_all_vms)
             if not vms:
                 print(colored("❌ No VMs found in Harvester", Colors.RED))
                 return
@@ -5422,18 +5694,11 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
                 state = "🟢 Running" if running else "🔴 Stopped"
                 print(f"  {i}. {name} ({ns}) - {state}")
             
-            choice = self.input_prompt("\nSelect VM number")
-            if not choice:
-                return
-            
-            try:
-                idx = int(choice) - 1
-                selected_vm = vms[idx]
-                vm_name = selected_vm.get('metadata', {}).get('name')
-                namespace = selected_vm.get('metadata', {}).get('namespace')
-            except:
-                print(colored("Invalid choice", Colors.RED))
+            selected_vm = self._pick(vms, "\nSelect VM number")
+            if selected_vm is None:
                 return
+            vm_name = selected_vm.get('metadata', {}).get('name')
+            namespace = selected_vm.get('metadata', {}).get('namespace')
             
             # Check if VM is running
             vm_status = selected_vm.get('status', {})
@@ -5445,7 +5710,6 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
                     try:
                         self.harvester.start_vm(vm_name, namespace)
                         print(colored("   ✅ Start command sent. Waiting 30s for boot...", Colors.GREEN))
-                        import time
                         time.sleep(30)
                     except Exception as e:
                         print(colored(f"   ❌ Error: {e}", Colors.RED))
@@ -5456,14 +5720,12 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
             print(colored(f"   VM: {vm_name} ({namespace})", Colors.CYAN))
         
         # Build FQDN and ping
-        windows_config = self.config.get('windows', {})
+        windows_config = self.windows_cfg
         domain = windows_config.get('domain', 'AD.WYSSCENTER.CH').lower()
         vm_fqdn = f"{vm_name}.{domain}"
         
         print(colored(f"\n🔍 Pinging VM: {vm_fqdn}...", Colors.CYAN))
         
-        import time
-        import subprocess
         
         max_wait = 180  # 3 minutes max
         start_time = time.time()
@@ -5485,13 +5747,12 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
                     print(colored(f"\n   ✅ VM responds to ping! ({elapsed}s)", Colors.GREEN))
                     break
                 else:
-                    if elapsed % 15 == 0:
-                        print(f"   ⏳ Waiting for VM to respond... ({elapsed}s)")
+                    print(f"\r   ⏳ Waiting for VM to respond... ({elapsed}s)   ", end='', flush=True)
             except subprocess.TimeoutExpired:
                 pass
             except Exception as e:
                 if elapsed % 30 == 0:
-                    print(f"   ⏳ Ping error: {e}")
+                    print(f"\n   ⏳ Ping error: {e}")
             
             time.sleep(5)
         
@@ -5501,33 +5762,38 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
             if retry.lower() != 'y':
                 return
         
-        # Load vm-config.json
-        staging_dir = self.config.get('transfer', {}).get('staging_mount', '/mnt/data')
-        config_path = os.path.join(staging_dir, 'migrations', vm_name.lower(), 'vm-config.json')
-        
-        if not os.path.exists(config_path):
-            migrations_dir = os.path.join(staging_dir, 'migrations')
-            if os.path.exists(migrations_dir):
-                configs = [d for d in os.listdir(migrations_dir) 
-                          if os.path.exists(os.path.join(migrations_dir, d, 'vm-config.json'))]
-                if configs:
-                    print(f"\n   Config not found for '{vm_name}'. Available:")
-                    for i, cfg in enumerate(configs, 1):
-                        print(f"     {i}. {cfg}")
-                    choice = self.input_prompt("   Select config number")
-                    try:
-                        idx = int(choice) - 1
-                        config_path = os.path.join(migrations_dir, configs[idx], 'vm-config.json')
-                    except:
-                        return
+        # Load vm-config.json (open directly, only scan migrations/ on a miss)
+        config_path = os.path.join(self.migrations_dir, vm_name.lower(), 'vm-config.json')
+        
+        try:
+            f = open(config_path, 'rb')
+        except FileNotFoundError:
+            f = None
+            migrations_dir = self.migrations_dir
+            configs = []
+            if os.path.isdir(migrations_dir):
+                with os.scandir(migrations_dir) as entries:
+                    configs = [e.name for e in entries
+                               if e.is_dir() and os.path.exists(os.path.join(e.path, 'vm-config.json'))]
+            if configs:
+                print(f"\n   Config not found for '{vm_name}'. Available:")
+                for i, cfg in enumerate(configs, 1):
+                    print(f"     {i}. {cfg}")
+                choice = self.input_prompt("   Select config number")
+                try:
+                    idx = int(choice) - 1
+                    config_path = os.path.join(migrations_dir, configs[idx], 'vm-config.json')
+                    f = open(config_path, 'rb')
+                except:
+                    return
         
-        if not os.path.exists(config_path):
+        if f is None:
             print(colored(f"❌ Config not found. Run pre-migration check first.", Colors.RED))
             return
         
         try:
-            with open(config_path) as f:
-                vm_config = json.load(f)
+            with f:
+                vm_config = json_load(f)
             print(colored(f"   📋 Loaded: {config_path}", Colors.GREEN))
         except Exception as e:
             print(colored(f"❌ Error: {e}", Colors.RED))
@@ -5576,7 +5842,6 @@ Remove-Item $iso -Force -ErrorAction SilentlyContinue
                 print(f"   Using: {username}")
             except:
                 username = self.input_prompt("   Username [Administrator]") or "Administrator"
-                import getpass
                 password = getpass.getpass("   Password: ")
         
         # Wait for WinRM to be ready
@@ -5683,7 +5948,7 @@ $uninstallKeys = @(
 
 $nutanixApps = @()
 foreach ($key in $uninstallKeys) {
-    $apps = Get-ItemProperty $key -ErrorAction SilentlyContinue | Where-Object { $_.DisplayName -like "*Nutanix*" }
+    $apps = Get-ItemProperty $key -ErrorAction SilentlyContinue | Where-Object DisplayName -like '*Nutanix*'
     if ($apps) {
         $nutanixApps += $apps
     }
@@ -5692,6 +5957,7 @@ foreach ($key in $uninstallKeys) {
 Log "Found $($nutanixApps.Count) Nutanix application(s)"
 Write-Host "FOUND:$($nutanixApps.Count)"
 
+$exeUninstalls = @()
 foreach ($app in $nutanixApps) {
     $name = $app.DisplayName
     $guid = $app.PSChildName
@@ -5699,17 +5965,20 @@ foreach ($app in $nutanixApps) {
     Log "Processing: $name"
     Write-Host "   Uninstalling: $name"
     
+    # MSI removals hold the Windows Installer mutex (error 1618 if run
+    # concurrently), so they run serially here; EXE uninstallers often call
+    # Windows Installer too, so they are only started once all MSIs are done
     # Method 1: If it's an MSI (GUID format)
     if ($guid -match "^\\{[A-F0-9-]+\\}$") {
         Log "Uninstalling MSI: $guid"
         $proc = Start-Process "msiexec.exe" -ArgumentList "/x $guid /qn /norestart" -Wait -PassThru -NoNewWindow
         Log "msiexec exit code: $($proc.ExitCode)"
+        continue
     }
     # Method 2: Use QuietUninstallString if available
-    elseif ($app.QuietUninstallString) {
-        Log "Using QuietUninstallString: $($app.QuietUninstallString)"
-        $proc = Start-Process "cmd.exe" -ArgumentList "/c `"$($app.QuietUninstallString)`"" -Wait -PassThru -NoNewWindow
-        Log "Exit code: $($proc.ExitCode)"
+    if ($app.QuietUninstallString) {
+        $uninstall = $app.QuietUninstallString
+        Log "Using QuietUninstallString: $uninstall"
     }
     # Method 3: Use UninstallString with silent flags
     elseif ($app.UninstallString) {
@@ -5721,13 +5990,56 @@ foreach ($app in $nutanixApps) {
             $uninstall = "$uninstall /S /silent /quiet"
         }
         Log "Using UninstallString: $uninstall"
+    }
+    else {
+        continue
+    }
+    
+    if ($uninstall -match "msiexec") {
         $proc = Start-Process "cmd.exe" -ArgumentList "/c `"$uninstall`"" -Wait -PassThru -NoNewWindow
         Log "Exit code: $($proc.ExitCode)"
+    } else {
+        $exeUninstalls += ,@($name, $uninstall)
+    }
+}
+
+# Non-MSI uninstallers run in parallel, after the msiexec removals above
+$jobs = @()
+foreach ($exe in $exeUninstalls) {
+    $jobs += Start-Job -Name $exe[0] -ArgumentList $exe[1] -ScriptBlock {
+        param($cmd)
+        (Start-Process "cmd.exe" -ArgumentList "/c `"$cmd`"" -Wait -PassThru -NoNewWindow).ExitCode
+    }
+}
+if ($jobs) {
+    $jobs | Wait-Job -Timeout 240 | Out-Null
+    # Uninstallers that call Windows Installer themselves can collide on its
+    # mutex (1618 = another installation in progress); retry those one by one
+    $retry = @()
+    for ($i = 0; $i -lt $jobs.Count; $i++) {
+        $job = $jobs[$i]
+        if ($job.State -eq 'Running') {
+            Log "$($job.Name) abandoned after timeout (still running after 240s)"
+            continue
+        }
+        $code = Receive-Job $job -ErrorAction SilentlyContinue
+        Log "$($job.Name) exit code: $code ($($job.State))"
+        if ($code -eq 1618) {
+            $retry += ,$exeUninstalls[$i]
+        }
+    }
+    $jobs | Remove-Job -Force
+    foreach ($exe in $retry) {
+        Log "Retrying $($exe[0]) after Windows Installer was busy (1618)"
+        $proc = Start-Process "cmd.exe" -ArgumentList "/c `"$($exe[1])`"" -Wait -PassThru -NoNewWindow
+        Log "$($exe[0]) retry exit code: $($proc.ExitCode)"
     }
 }
 
 # Stop and disable Nutanix services
-$services = Get-Service | Where-Object { $_.Name -like "*Nutanix*" -or $_.DisplayName -like "*Nutanix*" }
+$services = @(Get-Service -Name "*Nutanix*" -ErrorAction SilentlyContinue) +
+            @(Get-Service -DisplayName "*Nutanix*" -ErrorAction SilentlyContinue) |
+            Sort-Object Name -Unique
 foreach ($svc in $services) {
     Log "Stopping service: $($svc.Name)"
     Stop-Service -Name $svc.Name -Force -ErrorAction SilentlyContinue
@@ -5807,7 +6119,7 @@ $targetGateway = "{gateway}"
 $targetDNS = @({','.join([f'"{d}"' for d in dns_list])})
 
 # Find adapter by MAC address
-$adapter = Get-NetAdapter | Where-Object {{ $_.MacAddress -eq $targetMAC }}
+$adapter = Get-NetAdapter -ErrorAction SilentlyContinue | Where-Object MacAddress -eq $targetMAC
 if (-not $adapter) {{
     Write-Host "CONFIG_CHECK:NO_ADAPTER"
     Write-Host "TARGET_MAC:$targetMAC"
@@ -5867,7 +6179,7 @@ $prefix = {prefix}
 $gateway = "{gateway}"
 $dns = @({','.join([f'"{d}"' for d in dns_list])})
 
-$adapter = Get-NetAdapter | Where-Object {{ $_.MacAddress -eq $targetMAC }}
+$adapter = Get-NetAdapter -ErrorAction SilentlyContinue | Where-Object MacAddress -eq $targetMAC
 if (-not $adapter) {{ throw "Adapter not found" }}
 
 $ifName = $adapter.Name
@@ -5938,8 +6250,7 @@ Write-Host "SUCCESS"
                                 print(colored(f"\n   ✅ VM is back online! ({elapsed}s)", Colors.GREEN))
                                 break
                             else:
-                                if elapsed % 15 == 0:
-                                    print(f"   ⏳ Waiting... ({elapsed}s)")
+                                print(f"\r   ⏳ Waiting... ({elapsed}s)   ", end='', flush=True)
                         except:
                             pass
                         
@@ -5979,9 +6290,7 @@ Write-Host "SUCCESS"
                 print(f"   IP: {original_ip}")
             
             if virtio_installed:
-                print(colored("\n💡 VirtIO Optimization Available:", Colors.YELLOW))
-                print("   You can switch from SATA to VirtIO disk bus for better performance.")
-                print("   Menu Harvester → Switch VM disk bus")
+                sys.stdout.write(TIP_VIRTIO_AVAILABLE)
             
             # Update tracker
             track_vm = vm_name or self._selected_vm
@@ -5995,6 +6304,13 @@ Write-Host "SUCCESS"
     
     def menu_vault(self):
         """Vault management submenu."""
+        actions = {
+            "1": self._vault_list,
+            "2": self._vault_add,
+            "3": self._vault_test,
+            "4": self._kerberos_check,
+            "5": self._kerberos_kinit,
+        }
         while True:
             self.print_header()
             self.print_menu("VAULT MANAGEMENT", [
@@ -6008,20 +6324,9 @@ Write-Host "SUCCESS"
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self._vault_list()
-                self.pause()
-            elif choice == "2":
-                self._vault_add()
-                self.pause()
-            elif choice == "3":
-                self._vault_test()
-                self.pause()
-            elif choice == "4":
-                self._kerberos_check()
-                self.pause()
-            elif choice == "5":
-                self._kerberos_kinit()
+            action = actions.get(choice)
+            if action:
+                action()
                 self.pause()
             elif choice == "0":
                 break
@@ -6051,7 +6356,6 @@ Write-Host "SUCCESS"
         if not username:
             return
         
-        import getpass
         password = getpass.getpass("Password: ")
         if not password:
             return
@@ -6076,12 +6380,15 @@ Write-Host "SUCCESS"
         except VaultError as e:
             print(colored(f"❌ Error: {e}", Colors.RED))
     
+    def _klist(self):
+        """Run klist once and capture its output."""
+        return subprocess.run(["klist"], capture_output=True, text=True)
+    
     def _kerberos_check(self):
         """Check Kerberos ticket status."""
         print(colored("\n🎫 Kerberos Ticket Status", Colors.BOLD))
         
-        import subprocess
-        result = subprocess.run(["klist"], capture_output=True, text=True)
+        result = self._klist()
         
         if result.returncode == 0:
             print(colored("✅ Valid Kerberos tickets:", Colors.GREEN))
@@ -6098,44 +6405,46 @@ Write-Host "SUCCESS"
         if not principal:
             return
         
-        import getpass
         password = getpass.getpass("Password: ")
         
         if kinit(principal, password):
             print(colored("✅ Kerberos ticket obtained", Colors.GREEN))
-            import subprocess
-            subprocess.run(["klist"])
+            print(self._klist().stdout)
         else:
             print(colored("❌ Failed to get Kerberos ticket", Colors.RED))
     
     def menu_config(self):
         self.print_header()
-        print(colored("\n⚙️  CURRENT CONFIGURATION", Colors.BOLD))
-        print(colored("-" * 40, Colors.BLUE))
-        
-        print(f"\nNutanix:")
-        print(f"   Prism IP: {self.config['nutanix']['prism_ip']}")
-        print(f"   Username: {self.config['nutanix']['username']}")
-        
-        print(f"\nHarvester:")
-        print(f"   API URL: {self.config['harvester']['api_url']}")
-        print(f"   Namespace: {self.config['harvester'].get('namespace', 'default')}")
-        
-        print(f"\nCeph:")
-        print(f"   Mon IP: {self.config.get('ceph', {}).get('mon_ip', 'N/A')}")
-        
-        print(f"\nTransfer:")
-        print(f"   Staging: {self.config.get('transfer', {}).get('staging_mount', '/mnt/staging')}")
-        
+        sys.stdout.write(CONFIG_SCREEN % (
+            self.nutanix_cfg['prism_ip'],
+            self.nutanix_cfg['username'],
+            self.harvester_cfg['api_url'],
+            self.harvester_cfg.get('namespace', 'default'),
+            self.ceph_cfg.get('mon_ip', 'N/A'),
+            self.transfer_cfg.get('staging_mount', '/mnt/staging'),
+        ))
         self.pause()
     
     def main_menu(self):
         self.print_header()
         print("Initializing...")
-        self.connect_nutanix()
-        self.connect_harvester()
+        # Both logins are independent, run them concurrently
+        nutanix_future = self._io_pool.submit(self.connect_nutanix)
+        harvester_future = self._io_pool.submit(self.connect_harvester)
+        nutanix_future.result()
+        harvester_future.result()
+        self.prefetch_lists()
         self.pause()
         
+        # Submenus and the config screen handle their own pause
+        actions = {
+            "1": self.menu_tracker,
+            "2": self.menu_migration,
+            "3": self.menu_nutanix,
+            "4": self.menu_harvester,
+            "5": self.menu_windows,
+            "6": self.menu_config,
+        }
         while True:
             self.print_header()
             self.print_menu("MAIN MENU", [
@@ -6150,23 +6459,25 @@ Write-Host "SUCCESS"
             
             choice = self.input_prompt()
             
-            if choice == "1":
-                self.menu_tracker()
-            elif choice == "2":
-                self.menu_migration()
-            elif choice == "3":
-                self.menu_nutanix()
-            elif choice == "4":
-                self.menu_harvester()
-            elif choice == "5":
-                self.menu_windows()
-            elif choice == "6":
-                self.menu_config()
+            action = actions.get(choice)
+            if action:
+                action()
             elif choice.lower() == "q":
                 print(colored("\nGoodbye! 👋", Colors.CYAN))
                 break
 
 
+def import_command(tool: MigrationTool, args):
+    """Import command: python3 migrate.py import vmname --disk N"""
+    if not args.args:
+        print(colored("Usage: migrate.py import <vmname> --disk <N>", Colors.RED))
+        print(colored("   or: migrate.py import <vmname> (imports all disks)", Colors.RED))
+        sys.exit(1)
+    vm_name = args.args[0]
+    disk_idx = args.disk
+    tool.import_vm_disk(vm_name, disk_idx, args.namespace, args.storage_class)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Nutanix to Harvester Migration Tool")
     parser.add_argument("-c", "--config", default="config.yaml", help="Configuration file")
@@ -6180,36 +6491,29 @@ def main():
     
     tool = MigrationTool(args.config)
     
-    if not args.command:
-        tool.main_menu()
-    else:
+    try:
+        if not args.command:
+            tool.main_menu()
+            return
+        
         # Direct command mode
-        if args.command == "list":
-            tool.list_nutanix_vms()
-        elif args.command == "list-harvester":
-            tool.list_harvester_vms()
-        elif args.command == "list-images":
-            tool.list_harvester_images()
-        elif args.command == "list-networks":
-            tool.list_harvester_networks()
-        elif args.command == "list-staging":
-            tool.list_staging_disks()
-        elif args.command == "show":
-            vm_name = args.args[0] if args.args else None
-            tool.show_vm_details(vm_name)
-        elif args.command == "test-harvester":
-            tool.connect_harvester()
-        elif args.command == "import":
-            # Import command: python3 migrate.py import vmname --disk N
-            if not args.args:
-                print(colored("Usage: migrate.py import <vmname> --disk <N>", Colors.RED))
-                print(colored("   or: migrate.py import <vmname> (imports all disks)", Colors.RED))
-                sys.exit(1)
-            vm_name = args.args[0]
-            disk_idx = args.disk
-            tool.import_vm_disk(vm_name, disk_idx, args.namespace, args.storage_class)
+        commands = {
+            "list": tool.list_nutanix_vms,
+            "list-harvester": tool.list_harvester_vms,
+            "list-images": tool.list_harvester_images,
+            "list-networks": tool.list_harvester_networks,
+            "list-staging": tool.list_staging_disks,
+            "show": lambda: tool.show_vm_details(args.args[0] if args.args else None),
+            "test-harvester": tool.connect_harvester,
+            "import": lambda: import_command(tool, args),
+        }
+        handler = commands.get(args.command)
+        if handler:
+            handler()
         else:
             print(f"Unknown command: {args.command}")
+    finally:
+        tool.close()
 
 
 if __name__ == "__main__":
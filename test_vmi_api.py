@@ -6,15 +6,19 @@ import yaml
 import json
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import tempfile
 import os
+import atexit
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings('ignore')
 
 # Load config
-with open('config.yaml') as f:
-    config = yaml.safe_load(f)
+with open('config.yaml', 'rb') as f:
+    config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
 harvester_config = config.get('harvester', {})
 base_url = harvester_config.get('api_url')
@@ -34,37 +38,68 @@ ca_data = harvester_config.get('certificate_authority_data')
 
 cert = None
 verify = False
+temp_files = []
+
+
+@atexit.register
+def cleanup_temp_files():
+    """Remove the decoded cert files, also when a test fails early."""
+    for path in temp_files:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def write_temp(b64_data, suffix):
+    """Decode base64 data into a temp file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as f:
+        temp_files.append(f.name)
+        f.write(base64.b64decode(b64_data))
+    return f.name
+
 
 if cert_data and key_data:
-    cert_file = tempfile.NamedTemporaryFile(delete=False, suffix='.crt')
-    cert_file.write(base64.b64decode(cert_data))
-    cert_file.close()
-    
-    key_file = tempfile.NamedTemporaryFile(delete=False, suffix='.key')
-    key_file.write(base64.b64decode(key_data))
-    key_file.close()
-    
-    cert = (cert_file.name, key_file.name)
+    cert = (write_temp(cert_data, '.crt'), write_temp(key_data, '.key'))
     print(f"✅ Using client certificate")
 
 if ca_data:
-    ca_file = tempfile.NamedTemporaryFile(delete=False, suffix='.crt')
-    ca_file.write(base64.b64decode(ca_data))
-    ca_file.close()
-    verify = ca_file.name
+    verify = write_temp(ca_data, '.crt')
     print(f"✅ Using CA certificate")
 
 print()
 
+# One session for all tests: TLS connections (with client cert) are pooled
+# and reused instead of a new handshake per request
+session = requests.Session()
+session.cert = cert
+session.verify = verify if verify else False
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                      max_retries=Retry(total=2, backoff_factor=0.2)))
+
+# The three requests are independent. The first one runs on its own so it
+# opens a TLS connection the other two can reuse; those two then run together
+# (at most one more handshake) while Test 1 prints, and the output stays in order
+vmi_url = f"{base_url}/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachineinstances/{vm_name}"
+vm_url = f"{base_url}/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachines/{vm_name}"
+vmi_list_url = f"{base_url}/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachineinstances"
+pool = ThreadPoolExecutor(max_workers=2)
+vmi_future = pool.submit(session.get, vmi_url)
+try:
+    vmi_future.result()
+except Exception:
+    pass  # Reported by Test 1
+vm_future, vmi_list_future = (pool.submit(session.get, u) for u in (vm_url, vmi_list_url))
+pool.shutdown(wait=False)
+
 # Test 1: KubeVirt API - Get VMI
 print("=" * 60)
 print("Test 1: KubeVirt API - /apis/kubevirt.io/v1/")
 print("=" * 60)
-url = f"{base_url}/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachineinstances/{vm_name}"
-print(f"URL: {url}")
+print(f"URL: {vmi_url}")
 
 try:
-    r = requests.get(url, cert=cert, verify=verify if verify else False)
+    r = vmi_future.result()
     print(f"Status: {r.status_code}")
     if r.ok:
         data = r.json()
@@ -91,20 +126,19 @@ print()
 print("=" * 60)
 print("Test 2: VM annotations - /apis/kubevirt.io/v1/virtualmachines")
 print("=" * 60)
-url = f"{base_url}/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachines/{vm_name}"
-print(f"URL: {url}")
+print(f"URL: {vm_url}")
 
 try:
-    r = requests.get(url, cert=cert, verify=verify if verify else False)
+    r = vm_future.result()
     print(f"Status: {r.status_code}")
     if r.ok:
         data = r.json()
         annotations = data.get('metadata', {}).get('annotations', {})
         
         # Show relevant annotations
-        print("\nRelevant annotations:")
-        for key in ['network.harvesterhci.io/ips', 'harvesterhci.io/mac-address']:
-            print(f"  {key}: {annotations.get(key, 'N/A')}")
+        sys.stdout.write("\nRelevant annotations:\n" + "".join(
+            "  %s: %s\n" % (key, annotations.get(key, 'N/A'))
+            for key in ['network.harvesterhci.io/ips', 'harvesterhci.io/mac-address']))
         
         print(f"\nStatus.printableStatus: {data.get('status', {}).get('printableStatus', 'N/A')}")
         print(f"Status.ready: {data.get('status', {}).get('ready', 'N/A')}")
@@ -119,30 +153,24 @@ print()
 print("=" * 60)
 print("Test 3: List all VMIs in namespace")
 print("=" * 60)
-url = f"{base_url}/apis/kubevirt.io/v1/namespaces/{namespace}/virtualmachineinstances"
-print(f"URL: {url}")
+print(f"URL: {vmi_list_url}")
 
 try:
-    r = requests.get(url, cert=cert, verify=verify if verify else False)
+    r = vmi_list_future.result()
     print(f"Status: {r.status_code}")
     if r.ok:
         data = r.json()
         items = data.get('items', [])
-        print(f"Found {len(items)} VMI(s):")
+        lines = ["Found %d VMI(s):" % len(items)]
         for item in items:
             name = item.get('metadata', {}).get('name', 'N/A')
-            phase = item.get('status', {}).get('phase', 'N/A')
-            interfaces = item.get('status', {}).get('interfaces', [])
-            ips = [iface.get('ipAddress', '') for iface in interfaces if iface.get('ipAddress')]
-            print(f"  - {name}: {phase}, IPs: {ips}")
+            status = item.get('status', {})
+            ips = [iface['ipAddress'] for iface in status.get('interfaces', []) if iface.get('ipAddress')]
+            lines.append("  - %s: %s, IPs: %s" % (name, status.get('phase', 'N/A'), ips))
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         print(f"Error: {r.text[:500]}")
 except Exception as e:
     print(f"Exception: {e}")
 
-# Cleanup temp files
-if cert:
-    os.unlink(cert[0])
-    os.unlink(cert[1])
-if verify and verify != False:
-    os.unlink(verify)
+session.close()